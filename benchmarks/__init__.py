@@ -0,0 +1 @@
+"""Offline benchmarks of framcore hot paths. Run with python -m benchmarks.run."""
@@ -0,0 +1,288 @@
+"""
+Benchmark cases for query, resampling, fingerprinting and aggregation hot paths, and import time.
+
+A case has a setup(**params) that builds untimed state for one size and a run(state) that is timed.
+Setup is called once per repeat, so cases that modify state in place (e.g. aggregators) start fresh each time.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from benchmarks import synthetic
+from framcore.aggregators import HydroAggregator, NodeAggregator, WindAggregator
+from framcore.components import HydroModule, Wind
+from framcore.curves import CurveBreakpoints
+from framcore.expressions import get_level_value, get_profile_vector, get_unit_conversion_factor
+from framcore.expressions.units import _fallback_get_unit_conversion_factor
+from framcore.populators import SyntheticPopulator
+from framcore.querydbs import CacheDB, ModelDB
+from framcore.solvers import ModelStore
+from framcore.timeindexes import FixedFrequencyTimeIndex, ListTimeIndex, ModelYear, ProfileTimeIndex
+from framcore.utils import set_global_energy_equivalent
+
+SIZES = ("small", "medium", "large")
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1991, 1, timedelta(weeks=1), is_52_week_years=True)
+
+
+class Case:
+    """Named benchmark with size parameters, setup and timed run."""
+
+    def __init__(self, name: str, params: dict[str, dict], setup: Callable[..., object], run: Callable[[object], object]) -> None:
+        """Create case where setup(**params[size]) returns the state passed to run."""
+        self.name = name
+        self.params = params
+        self.setup = setup
+        self.run = run
+
+
+CASES: dict[str, Case] = dict()
+
+
+def _add_case(name: str, params: dict[str, dict], setup: Callable[..., object]) -> Callable[[Callable], Callable]:
+    def decorator(run: Callable[[object], object]) -> Callable[[object], object]:
+        assert name not in CASES, name
+        assert set(params) == set(SIZES), name
+        CASES[name] = Case(name, params, setup, run)
+        return run
+
+    return decorator
+
+
+def _weekly_scen_dim(num_years: int) -> FixedFrequencyTimeIndex:
+    return ProfileTimeIndex(1991, num_years, timedelta(weeks=1), is_52_week_years=True)
+
+
+# --- resampling -----------------------------------------------------------------------------------
+
+
+_YEARS = {"small": {"num_years": 1}, "medium": {"num_years": 10}, "large": {"num_years": 30}}
+
+
+def _setup_fixed_frequency(num_years: int) -> tuple:
+    profile = synthetic.make_hourly_profile(num_years)
+    target_index = _weekly_scen_dim(num_years)
+    target = np.zeros(target_index.get_num_periods(), dtype=np.float64)
+    return profile.get_timeindex(), profile.get_vector(is_float32=False), target_index, target
+
+
+@_add_case("write_into_fixed_frequency.hourly_to_weekly", _YEARS, _setup_fixed_frequency)
+def _run_fixed_frequency(state: tuple) -> None:
+    timeindex, vector, target_index, target = state
+    timeindex.write_into_fixed_frequency(target, target_index, vector)
+
+
+def _setup_list_timeindex(num_years: int) -> tuple:
+    num_periods = num_years * 52 * 7
+    start = datetime.fromisocalendar(1991, 1, 1)
+    datetimes = [start + timedelta(days=i) for i in range(num_periods + 1)]
+    timeindex = ListTimeIndex(datetimes, is_52_week_years=True, extrapolate_first_point=False, extrapolate_last_point=False)
+    vector = np.random.default_rng(0).random(num_periods)
+    target_index = _weekly_scen_dim(num_years)
+    target = np.zeros(target_index.get_num_periods(), dtype=np.float64)
+    return timeindex, vector, target_index, target
+
+
+@_add_case("write_into_fixed_frequency.daily_list_to_weekly", _YEARS, _setup_list_timeindex)
+def _run_list_timeindex(state: tuple) -> None:
+    timeindex, vector, target_index, target = state
+    timeindex.write_into_fixed_frequency(target, target_index, vector)
+
+
+# --- queries --------------------------------------------------------------------------------------
+
+
+_HYDRO = {
+    "small": {"num_areas": 4, "num_cascades": 5, "cascade_length": 4},
+    "medium": {"num_areas": 10, "num_cascades": 50, "cascade_length": 8},
+    "large": {"num_areas": 40, "num_cascades": 1000, "cascade_length": 10},
+}
+
+
+def _setup_level_value(**sizes: int) -> tuple:
+    model = synthetic.make_model(**sizes)
+    exprs = [obj.get_inflow().get_level() for obj in model.get_data().values() if isinstance(obj, HydroModule)]
+    return exprs, ModelDB(model)
+
+
+@_add_case("get_level_value.hydro_inflow", _HYDRO, _setup_level_value)
+def _run_level_value(state: tuple) -> None:
+    exprs, db = state
+    for expr in exprs:
+        get_level_value(expr, db, "Mm3/year", DATA_DIM, SCEN_DIM, is_max=False)
+
+
+def _setup_level_value_sum(**sizes: int) -> tuple:
+    model = synthetic.make_model(**sizes)
+    exprs = [obj.get_inflow().get_level() for obj in model.get_data().values() if isinstance(obj, HydroModule)]
+    return sum(exprs[1:], exprs[0]), CacheDB(model)
+
+
+@_add_case("get_level_value.hydro_inflow_sum", _HYDRO, _setup_level_value_sum)
+def _run_level_value_sum(state: tuple) -> None:
+    expr, db = state
+    get_level_value(expr, db, "Mm3/year", DATA_DIM, SCEN_DIM, is_max=False)
+
+
+_WIND = {
+    "small": {"num_areas": 4, "num_wind": 20, "num_profiles": 2, "num_weather_years": 1},
+    "medium": {"num_areas": 10, "num_wind": 100, "num_profiles": 10, "num_weather_years": 10},
+    "large": {"num_areas": 40, "num_wind": 1000, "num_profiles": 20, "num_weather_years": 30},
+}
+
+
+def _setup_profile_vector(**sizes: int) -> tuple:
+    model = synthetic.make_model(**sizes)
+    exprs = [obj.get_max_capacity().get_profile() for obj in model.get_data().values() if isinstance(obj, Wind)]
+    return exprs, ModelDB(model), _weekly_scen_dim(sizes["num_weather_years"])
+
+
+@_add_case("get_profile_vector.wind_hourly_to_weekly", _WIND, _setup_profile_vector)
+def _run_profile_vector(state: tuple) -> None:
+    exprs, db, scen_dim = state
+    for expr in exprs:
+        get_profile_vector(expr, db, DATA_DIM, scen_dim, is_zero_one=True)
+
+
+_UNITS = {"small": {"num_calls": 1_000}, "medium": {"num_calls": 10_000}, "large": {"num_calls": 100_000}}
+_UNIT_PAIRS = [("MW", "GW"), ("m3/s", "Mm3/year"), ("kWh/m3", "GWh/Mm3"), ("EUR/MWh", "EUR/GWh"), ("2.5*MW", "GW"), ("t/MWh", "t/GWh")]
+
+
+def _setup_unit_conversion(num_calls: int) -> list[tuple[str, str]]:
+    return [_UNIT_PAIRS[i % len(_UNIT_PAIRS)] for i in range(num_calls)]
+
+
+@_add_case("get_unit_conversion_factor.mixed", _UNITS, _setup_unit_conversion)
+def _run_unit_conversion(pairs: list[tuple[str, str]]) -> None:
+    for from_unit, to_unit in pairs:
+        get_unit_conversion_factor(from_unit, to_unit)
+
+
+_FALLBACK_PAIRS = [("GWh/year", "kW"), ("Mm3/year", "m3/h"), ("EUR/kWh", "EUR/TWh"), ("kg/MWh", "t/GWh"), ("TWh/year", "GW")]
+_FALLBACK = {"small": {"num_calls": 5}, "medium": {"num_calls": 20}, "large": {"num_calls": 50}}
+
+
+def _setup_unit_fallback(num_calls: int) -> list[tuple[str, str]]:
+    return [_FALLBACK_PAIRS[i % len(_FALLBACK_PAIRS)] for i in range(num_calls)]
+
+
+@_add_case("get_unit_conversion_factor.sympy_fallback", _FALLBACK, _setup_unit_fallback)
+def _run_unit_fallback(pairs: list[tuple[str, str]]) -> None:
+    for from_unit, to_unit in pairs:
+        _fallback_get_unit_conversion_factor(from_unit, to_unit)
+
+
+# --- curves ---------------------------------------------------------------------------------------
+
+
+_CURVES = {
+    "small": {"num_curves": 10, "num_points": 1_000},
+    "medium": {"num_curves": 100, "num_points": 10_000},
+    "large": {"num_curves": 1_000, "num_points": 10_000},
+}
+
+
+def _setup_curves(num_curves: int, num_points: int) -> tuple:
+    rng = np.random.default_rng(0)
+    curves = []
+    for __ in range(num_curves):
+        x = np.cumsum(rng.uniform(1.0, 100.0, 20))
+        curves.append(CurveBreakpoints(x, np.cumsum(rng.uniform(0.0, 5.0, 20)), mode=CurveBreakpoints.MONOTONE_SPLINE))
+    return curves, rng.uniform(0.0, 1000.0, (num_curves, num_points))
+
+
+@_add_case("curve.evaluate_many_monotone_spline", _CURVES, _setup_curves)
+def _run_curves(state: tuple) -> None:
+    curves, x = state
+    CurveBreakpoints.evaluate_many(curves, x)
+
+
+# --- fingerprints ---------------------------------------------------------------------------------
+
+
+def _setup_profile_fingerprint(num_years: int) -> object:
+    return synthetic.make_hourly_profile(num_years)
+
+
+@_add_case("fingerprint.hourly_profile", _YEARS, _setup_profile_fingerprint)
+def _run_profile_fingerprint(profile: object) -> None:
+    profile.get_fingerprint().get_hash()
+
+
+def _setup_model_fingerprints(**sizes: int) -> tuple:
+    return synthetic.make_model(**sizes), ModelStore("unused")
+
+
+@_add_case("fingerprint.hydro_model_store", _HYDRO, _setup_model_fingerprints)
+def _run_model_fingerprints(state: tuple) -> None:
+    model, store = state
+    store.get_model_fingerprints(model)
+
+
+# --- aggregators ----------------------------------------------------------------------------------
+
+
+def _setup_hydro_aggregator(**sizes: int) -> tuple:
+    model = synthetic.make_model(**sizes)
+    set_global_energy_equivalent(model.get_data(), synthetic.METAKEY_ENERGY_EQ_DOWNSTREAM)
+    return model, HydroAggregator(synthetic.METAKEY_ENERGY_EQ_DOWNSTREAM, DATA_DIM, SCEN_DIM)
+
+
+@_add_case("aggregator.hydro", _HYDRO, _setup_hydro_aggregator)
+def _run_hydro_aggregator(state: tuple) -> None:
+    model, aggregator = state
+    aggregator.aggregate(model)
+
+
+_NODES = {
+    "small": {"num_areas": 4, "nodes_per_area": 4},
+    "medium": {"num_areas": 10, "nodes_per_area": 10},
+    "large": {"num_areas": 40, "nodes_per_area": 25},
+}
+
+
+def _setup_node_aggregator(**sizes: int) -> tuple:
+    return synthetic.make_model(**sizes), NodeAggregator("Power", SyntheticPopulator.METAKEY_AREA, DATA_DIM, SCEN_DIM)
+
+
+@_add_case("aggregator.node", _NODES, _setup_node_aggregator)
+def _run_node_aggregator(state: tuple) -> None:
+    model, aggregator = state
+    aggregator.aggregate(model)
+
+
+def _setup_wind_aggregator(**sizes: int) -> tuple:
+    return synthetic.make_model(**sizes), WindAggregator(DATA_DIM, _weekly_scen_dim(sizes["num_weather_years"]))
+
+
+@_add_case("aggregator.wind", _WIND, _setup_wind_aggregator)
+def _run_wind_aggregator(state: tuple) -> None:
+    model, aggregator = state
+    aggregator.aggregate(model)
+
+
+# --- import time ----------------------------------------------------------------------------------
+
+
+# Each run starts a fresh interpreter, so the time includes interpreter start-up (a few tens of ms).
+_IMPORTS = {
+    "small": {"code": "import framcore"},
+    "medium": {"code": "import framcore.timevectors, framcore.expressions; framcore.expressions.get_unit_conversion_factor('MW', 'GW')"},
+    "large": {"code": "import framcore.expressions; framcore.expressions.get_unit_conversion_factor('GWh/year', 'kW')"},
+}
+
+
+def _setup_import(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+@_add_case("import.framcore", _IMPORTS, _setup_import)
+def _run_import(command: list[str]) -> None:
+    subprocess.run(command, check=True)
@@ -0,0 +1,170 @@
+"""
+Run benchmark cases and write results to a json file.
+
+Usage:
+    python -m benchmarks.run [--filter SUBSTRING] [--sizes small,medium] [--repeat 5] [--output-dir benchmarks/results]
+                             [--compare previous_results.json]
+
+Per case and size, the result file holds min, median and max seconds of the timed runs, and the peak
+memory allocated (tracemalloc) during one extra run. The file also holds machine, python and package
+versions and the git commit, so results from different commits on the same machine can be compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.cases import CASES, SIZES, Case
+from framcore.events import set_event_level
+
+RESULTS_VERSION = 1
+_SECONDS_PER_MILLISECOND = 1e-3
+
+
+def run_case(case: Case, size: str, repeat: int) -> dict:
+    """Time repeat runs of case with a fresh setup each, after one untimed warmup run. Then measure peak memory of one more run."""
+    params = case.params[size]
+    case.run(case.setup(**params))  # lazy imports and module level caches
+
+    seconds = []
+    for __ in range(repeat):
+        state = case.setup(**params)
+        gc.collect()
+        t0 = time.perf_counter()
+        case.run(state)
+        seconds.append(time.perf_counter() - t0)
+        del state
+
+    state = case.setup(**params)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.run(state)
+        __, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "params": params,
+        "repeat": repeat,
+        "min": min(seconds),
+        "median": statistics.median(seconds),
+        "max": max(seconds),
+        "peak_memory_bytes": peak,
+    }
+
+
+def get_environment() -> dict:
+    """Return machine, interpreter and version info stored with results."""
+    return {
+        "machine": platform.node(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "commit": _get_commit(),
+    }
+
+
+def run(names: list[str], sizes: list[str], repeat: int) -> dict:
+    """Run cases names in sizes. Return results document."""
+    results: dict[str, dict[str, dict]] = dict()
+    for name in names:
+        results[name] = dict()
+        for size in sizes:
+            result = run_case(CASES[name], size, repeat)
+            results[name][size] = result
+            print(f"{name:55s} {size:7s} median {_format_seconds(result['median']):>10s}  peak {result['peak_memory_bytes'] / 1e6:9.1f} MB")
+    return {
+        "version": RESULTS_VERSION,
+        "date": datetime.now(UTC).isoformat(timespec="seconds"),
+        "environment": get_environment(),
+        "results": results,
+    }
+
+
+def compare(current: dict, previous: dict) -> None:
+    """Print ratio of median seconds and peak memory of current to previous results."""
+    for name, sizes in current["results"].items():
+        for size, result in sizes.items():
+            old = previous["results"].get(name, dict()).get(size)
+            if old is None:
+                continue
+            time_ratio = result["median"] / old["median"] if old["median"] else float("nan")
+            memory_ratio = result["peak_memory_bytes"] / old["peak_memory_bytes"] if old["peak_memory_bytes"] else float("nan")
+            print(f"{name:55s} {size:7s} time x{time_ratio:6.2f}  memory x{memory_ratio:6.2f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this substring.")
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma separated subset of {','.join(SIZES)}.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per case and size.")
+    parser.add_argument("--output-dir", type=Path, default=Path(__file__).parent / "results")
+    parser.add_argument("--compare", type=Path, default=None, help="Previous results file to compare against.")
+    parser.add_argument("--list", action="store_true", help="List case names and exit.")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+    if args.list:
+        for name in names:
+            print(name)
+        return 0
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = set(sizes) - set(SIZES)
+    if unknown:
+        parser.error(f"Unknown sizes {sorted(unknown)}. Expected subset of {SIZES}.")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1.")
+
+    set_event_level("warning")  # keep info events from aggregators out of timings and output
+
+    document = run(names, sizes, args.repeat)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    commit = document["environment"]["commit"] or "nocommit"
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    path = args.output_dir / f"{stamp}-{commit[:8]}.json"
+    with Path.open(path, "w") as f:
+        json.dump(document, f, indent=1)
+    print(f"Wrote {path}")
+
+    if args.compare is not None:
+        with Path.open(args.compare) as f:
+            compare(document, json.load(f))
+
+    return 0
+
+
+def _get_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < _SECONDS_PER_MILLISECOND:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1.0:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
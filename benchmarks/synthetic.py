@@ -0,0 +1,48 @@
+"""Synthetic models and time vectors of scalable size for benchmarks."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from framcore import Model
+from framcore.populators import SyntheticPopulator
+from framcore.timeindexes import FixedFrequencyTimeIndex
+from framcore.timevectors import ListTimeVector, ReferencePeriod
+
+METAKEY_ENERGY_EQ_DOWNSTREAM = "energy_eq_downstream"
+
+
+def make_hourly_profile(num_years: int, seed: int = 0, start_year: int = 1991, is_zero_one: bool = False) -> ListTimeVector:
+    """Mean one (or zero one) hourly profile over num_years 52-week years from start_year."""
+    rng = np.random.default_rng(seed)
+    num_periods = num_years * 52 * 168
+    hours = np.arange(num_periods)
+    values = 1.0 + 0.3 * np.sin(2 * np.pi * hours / (52 * 168)) + 0.1 * np.sin(2 * np.pi * hours / 24) + 0.05 * rng.standard_normal(num_periods)
+    values = np.clip(values / values.max(), 0.0, 1.0) if is_zero_one else values / values.mean()
+    timeindex = FixedFrequencyTimeIndex(
+        start_time=datetime.fromisocalendar(start_year, 1, 1),
+        period_duration=timedelta(hours=1),
+        num_periods=num_periods,
+        is_52_week_years=True,
+        extrapolate_first_point=False,
+        extrapolate_last_point=False,
+    )
+    return ListTimeVector(
+        timeindex,
+        values,
+        unit=None,
+        is_max_level=None,
+        is_zero_one_profile=is_zero_one,
+        reference_period=ReferencePeriod(start_year, num_years),
+    )
+
+
+def make_model(seed: int = 0, **kwargs: object) -> Model:
+    """Synthetic system from SyntheticPopulator. Sizes not given in kwargs are zero (except one area with one node)."""
+    sizes = {"num_areas": 1, "nodes_per_area": 1, "num_cascades": 0, "num_wind": 0, "num_solar": 0}
+    sizes.update(kwargs)
+    model = Model()
+    SyntheticPopulator(seed=seed, **sizes).populate(model)
+    return model
@@ -1,5 +1,6 @@
 import contextlib
-import inspect
+import functools
+from collections.abc import Iterator
 from typing import Any
 
 from framcore.events import (
@@ -17,6 +18,11 @@ from framcore.fingerprints import Fingerprint
 class Base:
     """Core base class to share methods."""
 
+    # Subclasses declaring __slots__ in every class of their MRO have no per-instance __dict__, which saves memory
+    # in large models. Subclasses without __slots__ still get a __dict__. _get_fields supports both.
+    # Slots named _cached_* hold derived data and are not fields (not in repr or fingerprint).
+    __slots__ = ()
+
     def _check_type(self, value, class_or_tuple) -> None:  # noqa: ANN001
         if not isinstance(value, class_or_tuple):
             message = f"Expected {class_or_tuple} for {self}, got {type(value).__name__}"
@@ -102,7 +108,7 @@ class Base:
 
         default_excludes = {"_parent"}
 
-        for prop_name, prop_value in self.__dict__.items():
+        for prop_name, prop_value in self._get_fields():
             if callable(prop_value) or (refs and prop_name in refs) or (excludes and prop_name in excludes) or prop_name in default_excludes:
                 continue
 
@@ -113,7 +119,18 @@ class Base:
 
         return fingerprint
 
+    def _get_fields(self) -> Iterator[tuple[str, object]]:
+        """Yield (name, value) of all instance fields, from __slots__ (base class first) and __dict__. Skip unset slots."""
+        for name in _get_slot_names(type(self)):
+            with contextlib.suppress(AttributeError):
+                yield name, getattr(self, name)
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            yield from instance_dict.items()
+
     def _get_property_name(self, property_reference) -> str | None:  # noqa: ANN001
+        import inspect  # noqa: PLC0415  (slow import, rarely used)
+
         for name, value in inspect.getmembers(self):
             if value is property_reference:
                 return name
@@ -123,7 +140,7 @@ class Base:
         """Display type and non-None fields."""
         type_name = type(self).__name__
         value_fields = []
-        for k, v in vars(self).items():
+        for k, v in self._get_fields():
             display_value = self._get_attr_str(k, v)
             if display_value is not None:
                 value_fields.append(f"{k}={display_value}")
@@ -140,3 +157,15 @@ class Base:
         except Exception:
             pass
         return type(value).__name__
+
+
+@functools.cache
+def _get_slot_names(cls: type) -> tuple[str, ...]:
+    """Return names of all __slots__ fields of cls, base classes first. Skip _cached_* slots."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and not name.startswith("_cached_") and name not in names:
+                names.append(name)
+    return tuple(names)
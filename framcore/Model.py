@@ -1,4 +1,5 @@
 from collections import Counter
+from collections.abc import Iterable
 from copy import deepcopy
 from typing import TYPE_CHECKING
 
@@ -8,7 +9,7 @@ from framcore.curves import Curve
 from framcore.expressions import Expr
 from framcore.loaders import Loader
 from framcore.timevectors import TimeVector
-from framcore.utils import get_supported_components
+from framcore.utils import NodeFlowGraph
 
 if TYPE_CHECKING:
     from framcore.aggregators import Aggregator
@@ -21,6 +22,16 @@ class Model(Base):
         """Create a new model instance."""
         self._data: dict[str, Component | TimeVector | Curve | Expr] = dict()
         self._aggregators: list[Aggregator] = []
+        self._version = 0
+        self._node_flow_graph: NodeFlowGraph | None = None
+        self._node_flow_graph_version = -1
+
+    def __getstate__(self) -> dict:
+        """Drop cached NodeFlowGraph when pickled or deepcopied."""
+        state = self.__dict__.copy()
+        state["_node_flow_graph"] = None
+        state["_node_flow_graph_version"] = -1
+        return state
 
     def add(self, key: str, x: Component | TimeVector | Curve | Expr, overwrite: bool = False) -> None:
         """
@@ -36,6 +47,7 @@ class Model(Base):
             message = f"Key {key} is already used to store object {obj}."
             raise KeyError(message)
         self._data[key] = deepcopy(x)
+        self._version += 1
 
     def get(self, key: str) -> Component | TimeVector | Curve | Expr:
         """Get deepcopy of object stored behind key. KeyError if missing."""
@@ -46,6 +58,7 @@ class Model(Base):
         """Delete object behind key. KeyError if missing."""
         self._check_type(key, str)
         del self._data[key]
+        self._version += 1
 
     def disaggregate(self) -> None:
         """Undo all aggregations in LIFO order."""
@@ -58,6 +71,28 @@ class Model(Base):
         """Get internal data. Modify this with care."""
         return self._data
 
+    def get_version(self) -> int:
+        """Return counter which is incremented by add, delete, aggregate, disaggregate and clear_caches."""
+        return self._version
+
+    def _bump_version(self) -> None:
+        self._version += 1
+
+    def get_node_flow_graph(self) -> NodeFlowGraph:
+        """
+        Get NodeFlowGraph of all Components in Model. Reused until model changes.
+
+        The cached graph is rebuilt when the model version has changed, or when the Components
+        stored in the model (checked by identity) differ from the Components the graph was made from.
+        If Components are modified inplace (e.g. replace_node), call clear_caches to force rebuild.
+        """
+        graph = self._node_flow_graph
+        if graph is None or self._node_flow_graph_version != self._version or not graph.is_view_of(self._data):
+            graph = NodeFlowGraph(self._data)
+            self._node_flow_graph = graph
+            self._node_flow_graph_version = self._version
+        return graph
+
     def get_content_counts(self) -> dict[str, Counter]:
         """Return number of objects stored in model organized into concepts and types."""
         data_values = self.get_data().values()
@@ -92,12 +127,9 @@ class Model(Base):
 
     def get_loaders(self) -> set[Loader]:
         """Get all loaders stored in Model."""
-        from framcore.components import Flow, Node
-
         out = set()
         data = self.get_data()
-        components = dict()
-        for key, value in data.items():
+        for value in data.values():
             if isinstance(value, Expr):
                 value.add_loaders(out)
                 # out.update(value.get_loaders())
@@ -105,21 +137,56 @@ class Model(Base):
                 loader = value.get_loader()
                 if loader is not None:
                     out.add(loader)
-            elif isinstance(value, Component):
-                components[key] = value
-        graph = get_supported_components(components, (Flow, Node), tuple())
-        for c in graph.values():
-            c: Flow | Node
+        for c in self.get_node_flow_graph().get_graph().values():
             c.add_loaders(out)
             # out.update(c.get_loaders())
         return out
 
+    def prefetch(
+        self,
+        values: Iterable[Expr | TimeVector | Curve | Component | str] | None = None,
+        max_workers: int = 4,
+    ) -> int:
+        """
+        Load data behind values in bulk to warm loader caches before queries or solve. Return number of ids loaded.
+
+        Values are Expr (all loaded leaves, found like get_timeindexes_from_expr), TimeVector, Curve,
+        Component (all ids of its loaders) or keys in Model. Default is all ids of all loaders in Model.
+        Loaders are grouped per source file and files are read in parallel using max_workers threads.
+        """
+        from framcore.components import Flow, Node  # noqa: PLC0415
+        from framcore.expressions import add_loaded_id, get_loaded_ids_from_expr  # noqa: PLC0415
+        from framcore.utils import get_supported_components, prefetch_loaded_ids  # noqa: PLC0415
+
+        if values is None:
+            loaded_ids = {loader: set(loader.get_ids()) for loader in self.get_loaders()}
+            return prefetch_loaded_ids(loaded_ids, max_workers)
+
+        loaded_ids: dict[Loader, set[str]] = dict()
+        for value in values:
+            obj = self._data[value] if isinstance(value, str) else value
+            if isinstance(obj, Expr):
+                for loader, ids in get_loaded_ids_from_expr(self, obj).items():
+                    loaded_ids.setdefault(loader, set()).update(ids)
+            elif isinstance(obj, Component):
+                loaders = set()
+                for c in get_supported_components({"component": obj}, (Flow, Node), tuple()).values():
+                    c.add_loaders(loaders)
+                for loader in loaders:
+                    loaded_ids.setdefault(loader, set()).update(loader.get_ids())
+            else:
+                self._check_type(obj, (TimeVector, Curve))
+                add_loaded_id(loaded_ids, obj)
+        return prefetch_loaded_ids(loaded_ids, max_workers)
+
     def clear_caches(self) -> None:
         """
         Clear cached data from objects which use it in Model.
 
-        Currently only loaders use cache.
+        Loaders use cache. The Model itself caches its NodeFlowGraph.
 
         """
         for loader in self.get_loaders():
             loader.clear_cache()
+        self._node_flow_graph = None
+        self._version += 1
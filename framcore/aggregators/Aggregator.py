@@ -47,6 +47,7 @@ class Aggregator(Base, ABC):
         
         self._original_data = deepcopy(model.get_data())
         self._aggregate(model)
+        model._bump_version()  # noqa: SLF001
         self._is_last_call_aggregate = True
         if self in model._aggregators:  # noqa: SLF001
             message = f"{model} has already been aggregated with {self}. Cannot perform the same Aggregation more than once on a Model object."
@@ -73,6 +74,7 @@ class Aggregator(Base, ABC):
         self._check_type(model, Model)
         self._check_is_aggregated()
         self._disaggregate(model, self._original_data)
+        model._bump_version()  # noqa: SLF001
         self._is_last_call_aggregate = False
         self._original_data = None
         self._aggregation_map = None
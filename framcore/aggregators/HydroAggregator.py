@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from time import time
 from typing import TYPE_CHECKING
 
 from framcore.aggregators import Aggregator
@@ -10,12 +9,15 @@ from framcore.aggregators._utils import (
     _aggregate_weighted_expressions,
     _all_detailed_exprs_in_sum_expr,
     _get_level_profile_weights_from_disagg_levelprofiles,
+    _get_normalized_weights,
 )
 from framcore.attributes import AvgFlowVolume, Conversion, HydroGenerator, HydroReservoir, MaxFlowVolume, StockVolume
 from framcore.components import Component, HydroModule
 from framcore.curves import Curve
+from framcore.events import span
 from framcore.expressions import Expr, get_level_value
 from framcore.metadata import LevelExprMeta
+from framcore.querydbs import CacheDB, QueryDB
 from framcore.timeindexes import FixedFrequencyTimeIndex, SinglePeriodTimeIndex
 from framcore.timevectors import ConstantTimeVector, TimeVector
 from framcore.utils import get_hydro_downstream_energy_equivalent
@@ -61,6 +63,8 @@ class HydroAggregator(Aggregator):
     2. Move production and filling results from aggregated modules to detailed modules, weighted based on production capacity and reservoir capacity.
         - TODO: Spill and bypass results are currently ignored in the disaggregation.
     3. Delete aggregated modules.
+    The production and filling weights are evaluated once at the end of aggregation (self._set_disaggregation_weights),
+    so disaggregation does not need to query the model.
 
     Comments:
         - It is recommended to only use the same aggregator type once on the same components of a model. If you want to go from one aggregation level to
@@ -80,6 +84,8 @@ class HydroAggregator(Aggregator):
         _grouped_reservoirs (dict[str, set[str]]): Mapping of aggregated reservoirs to detailed reservoirs. agg to detailed
         _ror_threshold (float): Regulation factor (upstream reservoir capacity / yearly upstream inflow) threshold for run-of-river classification.
             Default is 0.5.
+        _production_weights (dict[str, dict[str, float] | None]): Production disaggregation weights. agg to detailed to weight
+        _filling_weights (dict[str, dict[str, float] | None]): Filling disaggregation weights. agg to detailed to weight
 
     Parent Attributes (see framcore.aggregators.Aggregator):
         _is_last_call_aggregate (bool | None): Tracks whether the last operation was an aggregation.
@@ -123,56 +129,57 @@ class HydroAggregator(Aggregator):
         self._grouped_modules: dict[str, set[str]] = defaultdict(list)  # agg to detailed
         self._grouped_reservoirs: dict[str, set[str]] = defaultdict(list)  # agg to detailed
 
+        self._production_weights: dict[str, dict[str, float] | None] = dict()  # agg to detailed to weight
+        self._filling_weights: dict[str, dict[str, float] | None] = dict()  # agg to detailed to weight
+
     def _aggregate(self, model: Model) -> None:
-        t0 = time()
+        with span(self, "_aggregate"):
+            self._aggregate_steps(model)
+
+    def _aggregate_steps(self, model: Model) -> None:
+        """Each step is timed as a span event."""
         data = model.get_data()
 
-        t = time()
-        upstream_topology = self._map_upstream_topology(data)
-        self.send_debug_event(f"_map_upstream_topology time: {round(time() - t, 3)} seconds")
+        with span(self, "_map_upstream_topology"):
+            upstream_topology = self._map_upstream_topology(data)
 
-        t = time()
-        generator_module_groups, reservoir_module_groups = self._group_modules_by_power_node(model, upstream_topology)
-        self.send_debug_event(f"_group_modules_by_power_node time: {round(time() - t, 3)} seconds")
+        with span(self, "_group_modules_by_power_node"):
+            generator_module_groups, reservoir_module_groups = self._group_modules_by_power_node(model, upstream_topology)
 
-        t = time()
-        self._group_modules_by_regulation_factor(model, generator_module_groups, reservoir_module_groups, upstream_topology)
-        self.send_debug_event(f"_group_modules_by_regulation_factor time: {round(time() - t, 3)} seconds")
+        with span(self, "_group_modules_by_regulation_factor"):
+            self._group_modules_by_regulation_factor(model, generator_module_groups, reservoir_module_groups, upstream_topology)
 
-        t = time()
-        ignore_production_capacity_modules = self._ignore_production_capacity_modules(model)
-        self.send_debug_event(f"_ignore_production_capacity_modules time: {round(time() - t, 3)} seconds")
+        with span(self, "_ignore_production_capacity_modules"):
+            ignore_production_capacity_modules = self._ignore_production_capacity_modules(model)
 
-        t = time()
-        self._aggregate_groups(model, upstream_topology, ignore_production_capacity_modules)
-        self.send_debug_event(f"_aggregate_groups time: {round(time() - t, 3)} seconds")
+        with span(self, "_aggregate_groups") as fields:
+            self._aggregate_groups(model, upstream_topology, ignore_production_capacity_modules)
+            fields["num_groups"] = len(self._grouped_modules)
+
+        with span(self, "_set_disaggregation_weights"):
+            self._set_disaggregation_weights(model)
 
         # Add reservoir modules to aggregation map
-        t = time()
-        self._aggregation_map = {dd: set([a]) for a, d in self._grouped_reservoirs.items() for dd in d}
-        self.send_debug_event(f"add reservoir modules to _aggregation_map time: {round(time() - t, 3)} seconds")
+        with span(self, "add reservoir modules to _aggregation_map"):
+            self._aggregation_map = {dd: set([a]) for a, d in self._grouped_reservoirs.items() for dd in d}
 
         # Add generator modules to aggregation map
-        t = time()
-        for a, d in self._grouped_modules.items():
-            for dd in d:
-                if dd not in self._aggregation_map:
-                    self._aggregation_map[dd] = set([a])
-                elif not data[dd].get_reservoir():  # if reservoir module already in map, skip as reservoir mapping is main mapping
-                    self._aggregation_map[dd].add(a)
-        self.send_debug_event(f"add generator modules to _aggregation_map time: {round(time() - t, 3)} seconds")
+        with span(self, "add generator modules to _aggregation_map"):
+            for a, d in self._grouped_modules.items():
+                for dd in d:
+                    if dd not in self._aggregation_map:
+                        self._aggregation_map[dd] = set([a])
+                    elif not data[dd].get_reservoir():  # if reservoir module already in map, skip as reservoir mapping is main mapping
+                        self._aggregation_map[dd].add(a)
 
         # Delete detailed modules and add remaining modules to aggregation map
-        t = time()
-        hydromodules = [key for key, component in data.items() if isinstance(component, HydroModule)]
-        for m_key in hydromodules:
-            if m_key not in self._grouped_modules:
-                if not (m_key in self._aggregation_map or m_key in self._grouped_reservoirs):
-                    self._aggregation_map[m_key] = set()
-                del model.get_data()[m_key]
-        self.send_debug_event(f"delete detailed modules time: {round(time() - t, 3)} seconds")
-
-        self.send_debug_event(f"total _aggregate: {round(time() - t0, 3)} seconds")
+        with span(self, "delete detailed modules"):
+            hydromodules = [key for key, component in data.items() if isinstance(component, HydroModule)]
+            for m_key in hydromodules:
+                if m_key not in self._grouped_modules:
+                    if not (m_key in self._aggregation_map or m_key in self._grouped_reservoirs):
+                        self._aggregation_map[m_key] = set()
+                    del model.get_data()[m_key]
 
     def _map_upstream_topology(
         self,
@@ -589,7 +596,7 @@ class HydroAggregator(Aggregator):
             if agg_production_level is None:  # keep original production if agg has no production defined
                 continue
             if len(detailed_keys) == 1:  # only one detailed module, set production directly
-                new_data[detailed_key].get_generator().get_production().set_level(agg_production_level)
+                new_data[next(iter(detailed_keys))].get_generator().get_production().set_level(agg_production_level)
                 continue
             detailed_production_levels = [new_data[detailed_key].get_generator().get_production().get_level() for detailed_key in detailed_keys]
             if any(detailed_production_levels) and not all(
@@ -601,9 +608,7 @@ class HydroAggregator(Aggregator):
                 continue
             if _all_detailed_exprs_in_sum_expr(agg_production_level, detailed_production_levels):  # if agg production is sum of detailed levels,  keep original
                 continue
-            production_weights = self._get_disaggregation_production_weights(model, detailed_keys)  # default method
-            for detailed_key in detailed_keys:
-                self._set_weighted_production(new_data[detailed_key], agg_modules[agg_key], production_weights[detailed_key])
+            self._apply_production_weights(agg_key, agg_modules[agg_key], new_data)  # default method
 
         # Set filling results in detailed modules
         for agg_key, detailed_keys in self._grouped_reservoirs.items():
@@ -614,7 +619,7 @@ class HydroAggregator(Aggregator):
             if agg_filling_level is None:  # keep original filling if agg has no filling defined
                 continue
             if len(detailed_keys) == 1:  # only one detailed module, set filling directly
-                new_data[detailed_key].get_reservoir().get_volume().set_level(agg_filling_level)
+                new_data[next(iter(detailed_keys))].get_reservoir().get_volume().set_level(agg_filling_level)
                 continue
             detailed_filling_levels = [new_data[detailed_key].get_reservoir().get_volume().get_level() for detailed_key in detailed_keys]
             if any(detailed_filling_levels) and not all(
@@ -637,12 +642,40 @@ class HydroAggregator(Aggregator):
                 agg_energy_eq_downstream,
             ):  # if agg filling is sum of detailed levels, keep original
                 continue
-            reservoir_weights = self._get_disaggregation_filling_weights(model, detailed_keys)  # default method
-            for detailed_key in detailed_keys:
-                self._set_weighted_filling(new_data[detailed_key], agg_modules[agg_key], reservoir_weights[detailed_key])
+            self._apply_filling_weights(agg_key, agg_modules[agg_key], new_data)  # default method
 
         self._grouped_modules.clear()
         self._grouped_reservoirs.clear()
+        self._production_weights.clear()
+        self._filling_weights.clear()
+
+    def _apply_production_weights(
+        self,
+        agg_key: str,
+        agg_module: HydroModule,
+        new_data: dict[str, Component | TimeVector | Curve | Expr],
+    ) -> None:
+        """Set production of the detailed modules of agg_key using the weights from _set_disaggregation_weights."""
+        production_weights = self._production_weights.get(agg_key)
+        if production_weights is None:
+            self.send_warning_event(f"All grouped modules have zero production capacity. Production not disaggregated for {agg_key}.")
+            return
+        for detailed_key, production_weight in production_weights.items():
+            self._set_weighted_production(new_data[detailed_key], agg_module, production_weight)
+
+    def _apply_filling_weights(
+        self,
+        agg_key: str,
+        agg_module: HydroModule,
+        new_data: dict[str, Component | TimeVector | Curve | Expr],
+    ) -> None:
+        """Set filling of the detailed modules of agg_key using the weights from _set_disaggregation_weights."""
+        reservoir_weights = self._filling_weights.get(agg_key)
+        if reservoir_weights is None:
+            self.send_warning_event(f"All grouped reservoirs have zero capacity. Filling not disaggregated for {agg_key}.")
+            return
+        for detailed_key, reservoir_weight in reservoir_weights.items():
+            self._set_weighted_filling(new_data[detailed_key], agg_module, reservoir_weight)
 
     def _get_deleted_group_modules(self, new_data: dict[str, Component | TimeVector | Curve | Expr]) -> set[str]:
         deleted_group_names: set[str] = set()
@@ -654,65 +687,70 @@ class HydroAggregator(Aggregator):
 
         return deleted_group_names
 
+    def _set_disaggregation_weights(self, model: Model) -> None:
+        """
+        Evaluate production and filling weights of all groups once, while the detailed modules are still in the model.
+
+        Weights are stored per aggregated module as a sparse column of the (detailed x aggregated) weight matrix,
+        so that _disaggregate only has to apply them. All queries share one CacheDB.
+        """
+        self._production_weights.clear()
+        self._filling_weights.clear()
+
+        db = CacheDB(model)
+        db.set_min_elapsed_seconds(0.0)
+
+        for agg_key, detailed_keys in self._grouped_modules.items():
+            if len(detailed_keys) > 1:
+                self._production_weights[agg_key] = self._get_disaggregation_production_weights(db, detailed_keys)
+
+        for agg_key, detailed_keys in self._grouped_reservoirs.items():
+            if len(detailed_keys) > 1:
+                self._filling_weights[agg_key] = self._get_disaggregation_filling_weights(db, detailed_keys)
+
     def _get_disaggregation_production_weights(
         self,
-        model: Model,
+        db: Model | QueryDB,
         detailed_keys: list[str],
-    ) -> dict[str, float]:
-        """Get weights to disaggregate production based on production capacity."""
-        # Calculate production capacity for each detailed module
-        data = model.get_data()
+    ) -> dict[str, float] | None:
+        """Get weights to disaggregate production based on production capacity. None if all capacities are zero."""
+        data = db.get_data()
         production_weights = dict()  # detailed_key -> production_weight
-        production_weight_factors = dict()  # detailed_key -> production_weight_factor
         for det in detailed_keys:
             det_module = data[det]
             release_capacity_level = det_module.get_release_capacity().get_level()
             generator_energy_eq = det_module.get_generator().get_energy_eq().get_level()
-            production_weight = get_level_value(
+            production_weights[det] = get_level_value(
                 release_capacity_level * generator_energy_eq,
-                db=model,
+                db=db,
                 unit="kW",
                 data_dim=self._data_dim,
                 scen_dim=self._scen_dim,
                 is_max=False,
             )
-            production_weights[det] = production_weight
-
-        # Calculate production weight for each detailed module
-        for det in detailed_keys:
-            production_weight_factors[det] = production_weights[det] / sum(production_weights.values())
-
-        return production_weight_factors
+        return _get_normalized_weights(production_weights)
 
     def _get_disaggregation_filling_weights(
         self,
-        model: Model,
+        db: Model | QueryDB,
         detailed_keys: list[str],
-    ) -> dict[str, float]:
-        """Get weights to disaggregate filling based on reservoir capacity."""
-        # Calculate reservoir capacity for each detailed module
-        data = model.get_data()
+    ) -> dict[str, float] | None:
+        """Get weights to disaggregate filling based on reservoir capacity. None if all capacities are zero."""
+        data = db.get_data()
         filling_weights = dict()  # detailed_key -> reservoir_weight
-        filling_weight_factors = dict()  # detailed_key -> reservoir_weight_factor
         for det in detailed_keys:
             det_module = data[det]
             reservoir_capacity_level = det_module.get_reservoir().get_capacity().get_level()
             reservoir_energy_eq = det_module.get_meta(self._metakey_energy_eq_downstream).get_value()
-            reservoir_weight = get_level_value(
+            filling_weights[det] = get_level_value(
                 reservoir_capacity_level * reservoir_energy_eq,
-                db=model,
+                db=db,
                 unit="GWh",
                 data_dim=self._data_dim,
                 scen_dim=self._scen_dim,
                 is_max=False,
             )
-            filling_weights[det] = reservoir_weight
-
-        # Calculate reservoir weight for each detailed module
-        for det in detailed_keys:
-            filling_weight_factors[det] = filling_weights[det] / sum(filling_weights.values())
-
-        return filling_weight_factors
+        return _get_normalized_weights(filling_weights)
 
     def _set_weighted_production(self, detailed_module: HydroModule, agg_module: HydroModule, production_weight: float) -> None:
         """Set production level and profile for detailed module based on aggregated module."""
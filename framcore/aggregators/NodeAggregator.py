@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from time import time
 from typing import TYPE_CHECKING
 
 from framcore.aggregators import Aggregator
 from framcore.aggregators._utils import _aggregate_costs
 from framcore.attributes import MaxFlowVolume, Price
-from framcore.components import Component, Demand, Node, Transmission, Flow
+from framcore.components import Component, Demand, Node, Transmission
 from framcore.curves import Curve
-from framcore.expressions import Expr
+from framcore.events import span
+from framcore.expressions import Expr, get_level_value
 from framcore.metadata import Member, Meta
+from framcore.querydbs import CacheDB
 from framcore.timeindexes import FixedFrequencyTimeIndex, SinglePeriodTimeIndex
 from framcore.timevectors import TimeVector
-from framcore.utils import get_component_to_nodes, get_transports_by_commodity, get_supported_components, get_flow_infos, get_node_to_commodity
+from framcore.utils import FlowInfoTable, NodeFlowGraph, get_component_to_nodes, get_transports_by_commodity
 
 # TODO: Support internal loss demand
 # TODO: Document method appropriate place (which docstring? module? class? __init__? _aggregate?)
@@ -68,45 +69,50 @@ class NodeAggregator(Aggregator):
 
     def _aggregate(self, model: Model) -> None:
         """Modify model, components and data."""
-        t0 = time()
+        with span(self, "_aggregate", commodity=self._commodity):
+            self._aggregate_steps(model)
+
+    def _aggregate_steps(self, model: Model) -> None:
+        """Each step is timed as a span event."""
         # Will be modified by upcoming code by adding group_nodes
         # and deleting member_nodes and redundant transports.
         data = model.get_data()
 
-        # Helper-dict to give simpler access to components in upcoming loops
-        # The components are the same instances as in data, and upcoming code
-        # will use this to modify components inplace, in self._replace_node.
-        components: dict[str, Component] = {key: c for key, c in data.items() if isinstance(c, Component)}
-
-        # This is just a helper-dict to give fast access
-        component_to_nodes: dict[str, set[str]] = get_component_to_nodes(components)
-
-        self._init_aggregate(components, data)
-        self.send_debug_event(f"init time {round(time() - t0, 3)} seconds")
-
-        # main logic
-        t = time()
-        for group_name, member_node_names in self._grouped_nodes.items():
-            member_node_names: set[str]
-            group_node = Node(commodity=self._commodity)
-            self._set_group_price(model, group_node, member_node_names, "EUR/MWh")
-            self._delete_members(data, member_node_names)
+        with span(self, "init"):
+            # Helper-dict to give simpler access to components in upcoming loops
+            # The components are the same instances as in data, and upcoming code
+            # will use this to modify components inplace, in self._replace_node.
+            components: dict[str, Component] = {key: c for key, c in data.items() if isinstance(c, Component)}
 
-            assert group_name not in data, f"{group_name}"
-            data[group_name] = group_node
+            # This is just a helper-dict to give fast access
+            component_to_nodes: dict[str, set[str]] = get_component_to_nodes(components)
 
-            self._replace_node(group_name, member_node_names, components, component_to_nodes)
-            components[group_name] = group_node
-        self.send_debug_event(f"main logic time {round(time() - t, 3)} seconds")
+            self._init_aggregate(components, data)
 
-        t = time()
-        transports = get_transports_by_commodity(components, self._commodity)
-        self._update_internal_transports(transports)
-        self._delete_internal_transports(data)
-        self._add_internal_transport_demands(model, components, transports)
-        self.send_debug_event(f"handle internal transport losses time {round(time() - t, 3)} seconds")
+        # evaluate member prices for all groups in one pass before members are deleted
+        with span(self, "evaluate member prices"):
+            price_level_values = self._get_price_level_values(model, "EUR/MWh")
 
-        self.send_debug_event(f"total time {round(time() - t0, 3)} seconds")
+        # main logic
+        with span(self, "main logic", num_groups=len(self._grouped_nodes)):
+            for group_name, member_node_names in self._grouped_nodes.items():
+                member_node_names: set[str]
+                group_node = Node(commodity=self._commodity)
+                self._set_group_price(model, group_node, member_node_names, "EUR/MWh", price_level_values)
+                self._delete_members(data, member_node_names)
+
+                assert group_name not in data, f"{group_name}"
+                data[group_name] = group_node
+
+                self._replace_node(group_name, member_node_names, components, component_to_nodes)
+                components[group_name] = group_node
+
+        with span(self, "handle internal transport losses"):
+            graph = NodeFlowGraph(components)  # shared by upcoming transport and demand lookups
+            transports = get_transports_by_commodity(graph, self._commodity)
+            self._update_internal_transports(transports)
+            self._delete_internal_transports(data)
+            self._add_internal_transport_demands(model, components, transports, graph)
 
     def _update_internal_transports(
         self,
@@ -120,23 +126,15 @@ class NodeAggregator(Aggregator):
                 # earlier to_node was added here, but it should be the transport name, right?
                 self._internal_transports.add(name)
 
-    def _get_demand_member_meta_keys(self, components: dict[str, Component]) -> set[str]:
+    def _get_demand_member_meta_keys(self, graph: NodeFlowGraph) -> set[str]:
         """We find all direct_out demands via flows from get_supported_components and collect member meta keys from them."""
         out: set[str] = set()
-        nodes_and_flows = get_supported_components(components, supported_types=(Node, Flow), forbidden_types=tuple())
-        node_to_commodity = get_node_to_commodity(nodes_and_flows)
-        for flow in nodes_and_flows.values():            
-            if not isinstance(flow, Flow):
-                continue
-            flow_infos = get_flow_infos(flow, node_to_commodity)
-            if not len(flow_infos) == 1:
-                continue
-            flow_info = flow_infos[0]
-            if flow_info.category != "direct_out":
-                continue
-            if flow_info.commodity_out != self._commodity: 
-                continue
-            demand = flow
+        flows = graph.get_flows()
+        table = graph.get_flow_info_table()
+        flow_ids = table.get_flow_ids()
+        flow_index = table.get_flow()
+        for row in table.get_single_info_rows(FlowInfoTable.DIRECT_OUT, self._commodity, is_ingoing=False).tolist():
+            demand = flows[flow_ids[flow_index[row]]]
             for key in demand.get_meta_keys():
                 meta = demand.get_meta(key)
                 if isinstance(meta, Member):
@@ -149,6 +147,7 @@ class NodeAggregator(Aggregator):
         model: Model,
         components: dict[str, Component],
         transports: dict[str, tuple[str, str]],
+        graph: NodeFlowGraph,
     ) -> None:
         """
         Add demand representing loss on internal transmission lines being removed by aggregation.
@@ -157,7 +156,7 @@ class NodeAggregator(Aggregator):
         """
         data = model.get_data()
 
-        demand_member_meta_keys = self._get_demand_member_meta_keys(components)
+        demand_member_meta_keys = self._get_demand_member_meta_keys(graph)
 
         # TODO: Document that we rely on Transmission and Demand APIs to get loss
         for key in self._internal_transports:
@@ -223,11 +222,19 @@ class NodeAggregator(Aggregator):
         group_node: Node,
         member_node_names: set[str],
         weight_unit: str,
+        price_level_values: dict[Expr, float],
     ) -> None:
         data = model.get_data()
         weights = [1.0 / len(member_node_names)] * len(member_node_names)
         prices = [data[key].get_price() for key in member_node_names]
         if all(prices):
+            cost_level_values = None
+            if any(price.get_profile() for price in prices):
+                missing = [key for key in member_node_names if data[key].get_price().get_level() is None]
+                if missing:
+                    message = f"Cannot weight price profiles of group {group_node}. Member nodes have Price without level: {missing}"
+                    raise ValueError(message)
+                cost_level_values = [price_level_values[price.get_level()] for price in prices]
             level, profile, intercept = _aggregate_costs(
                 model=model,
                 costs=prices,
@@ -235,6 +242,7 @@ class NodeAggregator(Aggregator):
                 weight_unit=weight_unit,
                 data_dim=self._data_dim,
                 scen_dim=self._scen_dim,
+                cost_level_values=cost_level_values,
             )
             group_node.get_price().set_level(level)
             group_node.get_price().set_profile(profile)
@@ -243,6 +251,30 @@ class NodeAggregator(Aggregator):
             missing = [key for key in member_node_names if data[key].get_price() is None]
             self.send_warning_event(f"Only some member nodes of group {group_node} have a Price, skip aggregate prices. Missing: {missing}")
 
+    def _get_price_level_values(self, model: Model, weight_unit: str) -> dict[Expr, float]:
+        """
+        Evaluate each distinct member price level needed to weight group price profiles.
+
+        All levels are queried in one pass through a shared CacheDB, so common subexpressions
+        and loaded vectors are only evaluated once across all groups.
+        """
+        data = model.get_data()
+        levels: dict[Expr, None] = dict()
+        for member_node_names in self._grouped_nodes.values():
+            prices = [data[key].get_price() for key in member_node_names]
+            if not all(prices) or not any(price.get_profile() for price in prices):
+                continue
+            for price in prices:
+                if price.get_level():
+                    levels[price.get_level()] = None
+
+        if not levels:
+            return dict()
+
+        db = CacheDB(model)
+        db.set_min_elapsed_seconds(0.0)
+        return {level: get_level_value(level, db, weight_unit, self._data_dim, self._scen_dim, False) for level in levels}
+
     def _replace_node(
         self,
         group_name: str,
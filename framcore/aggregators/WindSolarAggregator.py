@@ -8,6 +8,7 @@ from framcore.aggregators._utils import (
     _aggregate_result_volumes,
     _aggregate_weighted_expressions,
     _all_detailed_exprs_in_sum_expr,
+    _get_normalized_weights,
 )
 from framcore.aggregators.Aggregator import Aggregator  # full import path so inheritance works
 from framcore.attributes import AvgFlowVolume, Cost
@@ -39,6 +40,7 @@ class _WindSolarAggregator(Aggregator):
     1. Restore original components from self._original_data.
     2. Distribute production from aggregated components back to the original components:
         - Results are weighted based on the weighting method (now only max_capacity supported).
+        - The weights are evaluated once during aggregation and stored in self._production_weights.
     3. Delete aggregated components from the model.
 
     Comments:
@@ -55,6 +57,7 @@ class _WindSolarAggregator(Aggregator):
         _data_dim (SinglePeriodTimeIndex | None): Data dimension for eager evaluation.
         _scen_dim (FixedFrequencyTimeIndex | None): Scenario dimension for eager evaluation.
         _grouped_components (dict[str, set[str]]): Mapping of aggregated components to their detailed components.  agg to detailed
+        _production_weights (dict[str, dict[str, float] | None]): Production disaggregation weights. agg to detailed to weight
 
     Parent Attributes (see framcore.aggregators.Aggregator):
         _is_last_call_aggregate (bool | None): Tracks whether the last operation was an aggregation.
@@ -80,6 +83,7 @@ class _WindSolarAggregator(Aggregator):
         self._data_dim = data_dim
         self._scen_dim = scen_dim
         self._grouped_components: dict[str, set[str]] = defaultdict(set)
+        self._production_weights: dict[str, dict[str, float] | None] = dict()  # agg to detailed to weight
 
     def _aggregate(self, model: Model) -> None:
         data = model.get_data()
@@ -116,6 +120,7 @@ class _WindSolarAggregator(Aggregator):
 
     def _aggregate_groups(self, model: Model) -> None:
         """Aggregate each group of components into a single component."""
+        self._production_weights.clear()
         for group_id, member_ids in self._grouped_components.items():
             self._aggregate_group(model, group_id, member_ids)
 
@@ -125,15 +130,15 @@ class _WindSolarAggregator(Aggregator):
         data = model.get_data()
         members = [data[member_id] for member_id in member_ids]
 
-        # Weights
+        # Weights, also used as production weights in disaggregation
         capacity_levels = [member.get_max_capacity().get_level() for member in members]
         capacity_profiles = [member.get_max_capacity().get_profile() for member in members]
         vocs = [member.get_voc() for member in members]
-        if any(capacity_profiles) or any(vocs):  # only calc capacity weights if needed
-            capacity_level_values = [get_level_value(cl, model, "MW", self._data_dim, self._scen_dim, True) for cl in capacity_levels]
-            if sum(capacity_level_values) == 0.0:
-                message = "All grouped components do not contribute to weights (capacity = 0). Simplified aggregation."
-                self.send_warning_event(message)
+        capacity_level_values = [get_level_value(cl, model, "MW", self._data_dim, self._scen_dim, True) for cl in capacity_levels]
+        self._production_weights[group_id] = _get_normalized_weights(dict(zip(member_ids, capacity_level_values, strict=True)))
+        if (any(capacity_profiles) or any(vocs)) and sum(capacity_level_values) == 0.0:  # only warn if weights are needed here
+            message = "All grouped components do not contribute to weights (capacity = 0). Simplified aggregation."
+            self.send_warning_event(message)
 
         # Production capacity
         capacity_levels = [member.get_max_capacity().get_level() for member in members]
@@ -157,7 +162,14 @@ class _WindSolarAggregator(Aggregator):
         # Variable operational cost
         voc = None
         if any(vocs) and (sum(capacity_level_values) != 0.0):
-            voc_level, voc_profile, voc_intercept = _aggregate_costs(model, vocs, outside_weights=capacity_level_values, weight_unit="EUR/MWh")
+            voc_level, voc_profile, voc_intercept = _aggregate_costs(
+                model=model,
+                costs=vocs,
+                weights=capacity_level_values,
+                weight_unit="EUR/MWh",
+                data_dim=self._data_dim,
+                scen_dim=self._scen_dim,
+            )
             voc = Cost(voc_level, voc_profile, voc_intercept)
 
         new_wind = Wind(
@@ -194,7 +206,7 @@ class _WindSolarAggregator(Aggregator):
             if agg_production_level is None:  # keep original production if agg has no production defined
                 continue
             if len(detailed_keys) == 1:  # only one detailed module, set production directly
-                new_data[detailed_key].get_production().set_level(agg_production_level)
+                new_data[next(iter(detailed_keys))].get_production().set_level(agg_production_level)
                 continue
             detailed_production_levels = [new_data[detailed_key].get_production().get_level() for detailed_key in detailed_keys]
             if any(detailed_production_levels) and not all(
@@ -206,12 +218,23 @@ class _WindSolarAggregator(Aggregator):
                 continue
             if _all_detailed_exprs_in_sum_expr(agg_production_level, detailed_production_levels):  # if agg production is sum of detailed levels,  keep original
                 continue
-            capacity_levels = [new_data[detailed_key].get_max_capacity().get_level() for detailed_key in detailed_keys]
-            capacity_level_values = [get_level_value(cl, model, "MW", self._data_dim, self._scen_dim, True) for cl in capacity_levels]
-            capacity_level_value_weights = [cl / sum(capacity_level_values) for cl in capacity_level_values]
-            production_weights = {detailed_key: weight for detailed_key, weight in zip(detailed_keys, capacity_level_value_weights, strict=False)}
-            for detailed_key in detailed_keys:
-                self._set_weighted_production(new_data[detailed_key], agg_components[agg_key], production_weights[detailed_key])  # default
+            self._apply_production_weights(agg_key, agg_components[agg_key], new_data)  # default
+
+        self._production_weights.clear()
+
+    def _apply_production_weights(
+        self,
+        agg_key: str,
+        agg_component: Component,
+        new_data: dict[str, Component | TimeVector | Curve | Expr],
+    ) -> None:
+        """Set production of the detailed components of agg_key using the weights computed in _aggregate_group."""
+        production_weights = self._production_weights.get(agg_key)
+        if production_weights is None:
+            self.send_warning_event(f"All grouped components have zero capacity. Production not disaggregated for {agg_key}.")
+            return
+        for detailed_key, production_weight in production_weights.items():
+            self._set_weighted_production(new_data[detailed_key], agg_component, production_weight)
 
     def _get_deleted_group_components(self, new_data: dict[str, Component | TimeVector | Curve | Expr]) -> set[str]:
         """Identify which aggregated components have been deleted from the model."""
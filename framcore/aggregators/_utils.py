@@ -2,6 +2,8 @@
 
 from math import isclose
 
+import numpy as np
+
 from framcore.attributes import AvgFlowVolume, Cost, LevelProfile
 from framcore.expressions import Expr, get_level_value
 from framcore.Model import Model
@@ -89,14 +91,24 @@ def _aggregate_weighted_expressions(exprs: list[Expr], weights: list[float]) ->
         raise ValueError(message)
     if all(exprs[0] == e for e in exprs):
         return exprs[0]
+    total_weight = sum(weights)
     weights_dict = dict()
     for e, w in zip(exprs, weights, strict=True):
         if e not in weights_dict:
             weights_dict[e] = 0.0
-        weights_dict[e] += w / sum(weights)
+        weights_dict[e] += w / total_weight
     return sum([w * e for e, w in weights_dict.items()])
 
 
+def _get_normalized_weights(weight_values: dict[str, float]) -> dict[str, float] | None:
+    """Return weight values scaled to sum to 1, or None if they sum to 0."""
+    values = np.fromiter(weight_values.values(), dtype=np.float64, count=len(weight_values))
+    total = values.sum()
+    if total == 0.0:
+        return None
+    return dict(zip(weight_values.keys(), (values / total).tolist(), strict=True))
+
+
 def _is_weight_flow_expr(expr: Expr) -> bool:
     """Check if expr is weight * FlowExpr, which indicates it comes from disaggregation."""
     if expr.is_leaf():
@@ -142,8 +154,13 @@ def _aggregate_costs(
     weight_unit: str,
     data_dim: SinglePeriodTimeIndex,
     scen_dim: FixedFrequencyTimeIndex,
+    cost_level_values: list[float] | None = None,
 ) -> tuple[Expr, Expr | None, Expr | None]:
-    """Aggregate a list of costs with weights. Aggregated cost has weighted level, profile and intercept."""
+    """
+    Aggregate a list of costs with weights. Aggregated cost has weighted level, profile and intercept.
+
+    cost_level_values can hold precomputed level values (in weight_unit) of the costs, to avoid querying them here.
+    """
     # Initialize default values
     aggregated_level = None
     aggregated_profile = None
@@ -159,8 +176,9 @@ def _aggregate_costs(
     if any(cost_profiles):
         one_profile = Expr(src=ConstantTimeVector(1.0, is_zero_one_profile=False), is_profile=True)
         cost_profiles = [profile if profile else one_profile for profile in cost_profiles]
-        cost_level_values = [get_level_value(level, model, weight_unit, data_dim, scen_dim, False) for level in cost_levels]
-        profile_weights = [clv * weight for clv, weight in zip(cost_level_values, weights, strict=True)]
+        if cost_level_values is None:
+            cost_level_values = [get_level_value(level, model, weight_unit, data_dim, scen_dim, False) for level in cost_levels]
+        profile_weights = (np.asarray(cost_level_values, dtype=np.float64) * np.asarray(weights, dtype=np.float64)).tolist()
         aggregated_profile = _aggregate_weighted_expressions(cost_profiles, profile_weights)
 
     # Handle intercepts
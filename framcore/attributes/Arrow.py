@@ -22,6 +22,8 @@ class Arrow(Base):
     coefficient = conversion * (1 / efficiency) * (1 - loss)
     """
 
+    __slots__ = ("_conversion", "_efficiency", "_is_ingoing", "_loss", "_node")
+
     def __init__(
         self,
         node: str,
@@ -26,6 +26,8 @@ class ElasticDemand(Base):
 
     """
 
+    __slots__ = ("_max_price", "_min_price", "_normal_price", "_price_elasticity")
+
     def __init__(
         self,
         price_elasticity: Elasticity,
@@ -3,9 +3,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from framcore import Base
+from framcore.curves import Curve, CurveBreakpoints, LoadedCurve
+from framcore.expressions._utils import _load_model_and_create_model_db
 
 if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from framcore import Model
     from framcore.loaders import Loader
+    from framcore.querydbs import QueryDB
 
 
 class ReservoirCurve(Base):
@@ -14,24 +20,71 @@ class ReservoirCurve(Base):
 
     Attributes
     ----------
-    _value : str | None
-        The value representing the reservoir curve.
+    _value : str | Curve | None
+        The reservoir curve, or the data key of the reservoir curve in the model.
 
     """
 
-    def __init__(self, value: str | None) -> None:
+    __slots__ = ("_value",)
+
+    def __init__(self, value: str | Curve | None) -> None:
         """
         Initialize a ReservoirCurve instance.
 
         Parameters
         ----------
-        value : str | None
-            The value representing the reservoir curve.
+        value : str | Curve | None
+            The reservoir curve, or the data key of the reservoir curve in the model.
 
         """
-        self._check_type(value, (str, type(None)))
+        self._check_type(value, (str, Curve, type(None)))
         self._value = value
 
+    def get_value(self) -> str | Curve | None:
+        """Return the reservoir curve or its data key."""
+        return self._value
+
+    def get_curve(self, db: QueryDB | Model | None = None) -> Curve | None:
+        """
+        Return the reservoir curve.
+
+        Parameters
+        ----------
+        db : QueryDB | Model | None
+            Where to look up the curve if the value is a data key.
+
+        """
+        if not isinstance(self._value, str):
+            return self._value
+        if db is None:
+            message = f"Reservoir curve is data key '{self._value}'. Give db to look it up."
+            raise ValueError(message)
+
+        curve = _load_model_and_create_model_db(db).get(self._value)
+        self._check_type(curve, Curve)
+        return curve
+
+    def evaluate(self, x: ArrayLike, db: QueryDB | Model | None = None, mode: str = CurveBreakpoints.LINEAR) -> NDArray:
+        """
+        Interpolate the reservoir curve at x, e.g. head at reservoir volumes.
+
+        Parameters
+        ----------
+        x : ArrayLike
+            Points on the x axis of the curve (any shape).
+        db : QueryDB | Model | None
+            Where to look up the curve if the value is a data key.
+        mode : str
+            linear or monotone_spline. See CurveBreakpoints.
+
+        """
+        curve = self.get_curve(db)
+        if curve is None:
+            message = "ReservoirCurve has no curve."
+            raise ValueError(message)
+        return curve.evaluate(x, mode)
+
     def add_loaders(self, loaders: set[Loader]) -> None:
         """Add all loaders stored in attributes to loaders."""
-        return
+        if isinstance(self._value, LoadedCurve):
+            loaders.add(self._value.get_loader())
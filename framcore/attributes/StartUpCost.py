@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 class StartUpCost(Base):
     """StartUpCost class representing the startup cost of a Component."""
 
+    __slots__ = ("_min_stable_load", "_part_load_efficiency", "_start_hours", "_startup_cost")
+
     def __init__(
         self,
         startup_cost: Cost,
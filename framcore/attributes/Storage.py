@@ -17,6 +17,18 @@ class Storage(Base):
     used, not add more.
     """
 
+    __slots__ = (
+        "_capacity",
+        "_cost_terms",
+        "_initial_storage_percentage",
+        "_loss",
+        "_max_soft_bound",
+        "_min_soft_bound",
+        "_reservoir_curve",
+        "_target_bound",
+        "_volume",
+    )
+
     def __init__(
         self,
         capacity: StockVolume,
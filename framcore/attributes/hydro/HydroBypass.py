@@ -6,6 +6,8 @@ from framcore.fingerprints import Fingerprint
 class HydroBypass(Base):
     """Bypass class representing a hydro bypass attribute."""
 
+    __slots__ = ("_capacity", "_to_module", "_volume")
+
     def __init__(
         self,
         to_module: str | None,
@@ -9,6 +9,8 @@ from framcore.timevectors import TimeVector
 class HydroGenerator(Base):
     """Generator class representing a hydro generator component."""
 
+    __slots__ = ("_energy_eq", "_nominal_head", "_power_node", "_pq_curve", "_production", "_tailwater_elevation")
+
     def __init__(
         self,
         power_node: str,
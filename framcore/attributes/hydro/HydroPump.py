@@ -8,6 +8,21 @@ from framcore.timevectors import TimeVector
 class HydroPump(Base):
     """Pump class representing a hydro pump component."""
 
+    __slots__ = (
+        "_energy_eq",
+        "_from_module",
+        "_hmax",
+        "_hmin",
+        "_power_capacity",
+        "_power_consumption",
+        "_power_node",
+        "_qmax",
+        "_qmin",
+        "_to_module",
+        "_water_capacity",
+        "_water_consumption",
+    )
+
     def __init__(
         self,
         power_node: str,
@@ -116,11 +131,11 @@ class HydroPump(Base):
 
     def get_head_min(self) -> Expr:
         """Get min fall height of hydro pump."""
-        return self._head_min
+        return self._hmin
 
     def set_head_min(self, head_min: Expr | str | None) -> None:
         """Set min fall height."""
-        self._head_min = ensure_expr(head_min)
+        self._hmin = ensure_expr(head_min)
 
     def get_head_max(self) -> Expr:
         """Get max fall height of hydro pump."""
@@ -132,19 +147,19 @@ class HydroPump(Base):
 
     def get_q_min(self) -> Expr:
         """Get Q min of hydro pump."""
-        return self._q_min
+        return self._qmin
 
     def set_qmin(self, q_min: Expr | str | None) -> None:
         """Set Q min."""
-        self._q_min = ensure_expr(q_min)
+        self._qmin = ensure_expr(q_min)
 
     def get_q_max(self) -> Expr:
         """Get Q max of hydro pump."""
-        return self._q_max
+        return self._qmax
 
     def set_qmax(self, q_max: Expr | str | None) -> None:
         """Set Q max."""
-        self._q_max = ensure_expr(q_max)
+        self._qmax = ensure_expr(q_max)
 
     def _get_fingerprint(self) -> Fingerprint:
         return self.get_fingerprint_default(
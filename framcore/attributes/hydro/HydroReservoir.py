@@ -5,6 +5,8 @@ from framcore.attributes.Storage import Storage
 class HydroReservoir(Storage):
     """Reservoir class representing a hydro reservoir attribute."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         capacity: StockVolume,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -29,6 +30,8 @@ if TYPE_CHECKING:
 class LevelProfile(Base, ABC):
     """Attributes representing data the form level * profile + intercept."""
 
+    __slots__ = ("_intercept", "_level", "_level_shift", "_profile", "_scale")
+
     # must be overwritten by subclass when otherwise
     # don't change the defaults
     _IS_ABSTRACT: bool = True
@@ -290,9 +293,46 @@ class LevelProfile(Base, ABC):
         level_period: SinglePeriodTimeIndex,
         unit: str | None,
         is_float32: bool = True,
+        out: NDArray | None = None,
     ) -> NDArray:
-        """Return vector with values along the given scenario horizon using level over level_period."""
-        return self._get_scenario_vector(db, scenario_horizon, level_period, unit, is_float32)
+        """
+        Return vector with values along the given scenario horizon using level over level_period.
+
+        If out is given, values are written into out and out is returned. This avoids allocating
+        the result and any temporaries. out must be a float vector with one value per scenario period.
+        """
+        if out is None:
+            return self._get_scenario_vector(db, scenario_horizon, level_period, unit, is_float32)
+        self._check_out_vector(out, scenario_horizon.get_num_periods())
+        level_value, profile_vector, intercept = self._get_scenario_parts(db, scenario_horizon, level_period, unit, is_float32)
+        self._write_scenario_window(out, level_value, profile_vector, intercept, 0, out.size)
+        return out
+
+    def iter_scenario_vector(
+        self,
+        db: QueryDB | Model,
+        scenario_horizon: FixedFrequencyTimeIndex,
+        level_period: SinglePeriodTimeIndex,
+        unit: str | None,
+        window: int,
+        is_float32: bool = True,
+    ) -> Iterator[NDArray]:
+        """
+        Yield the scenario vector in consecutive windows of at most window periods.
+
+        Level and intercept are evaluated once, and each window is written into the same buffer
+        of size window. Copy the yielded vector if it should be kept after the next iteration.
+        """
+        self._check_type(window, int)
+        self._check_int(window, lower_bound=1, upper_bound=None)
+        num_periods = scenario_horizon.get_num_periods()
+        level_value, profile_vector, intercept = self._get_scenario_parts(db, scenario_horizon, level_period, unit, is_float32)
+        buffer = np.empty(min(window, num_periods), dtype=np.float32 if is_float32 else np.float64)
+        for start in range(0, num_periods, window):
+            stop = min(start + window, num_periods)
+            chunk = buffer[: stop - start]
+            self._write_scenario_window(chunk, level_value, profile_vector, intercept, start, stop)
+            yield chunk
 
     def get_data_value(
         self,
@@ -488,6 +528,28 @@ class LevelProfile(Base, ABC):
         is_float32: bool = True,
     ) -> NDArray:
         """Return vector with values along the given scenario horizon using level over level_period."""
+        level_value, profile_vector, intercept = self._get_scenario_parts(db, scenario_horizon, level_period, unit, is_float32)
+
+        if profile_vector is None:
+            profile_vector = np.ones(
+                scenario_horizon.get_num_periods(),
+                dtype=np.float32 if is_float32 else np.float64,
+            )
+
+        if intercept is None:
+            return level_value * profile_vector
+
+        return level_value * profile_vector + intercept
+
+    def _get_scenario_parts(
+        self,
+        db: QueryDB | Model,
+        scenario_horizon: FixedFrequencyTimeIndex,
+        level_period: SinglePeriodTimeIndex,
+        unit: str | None,
+        is_float32: bool,
+    ) -> tuple[float, NDArray | None, float | None]:
+        """Return level value, profile vector (None if no profile) and intercept (None if no intercept)."""
         # NB! don't type check db, as this is done in get_level_value and get_profile_vector
         self._check_type(scenario_horizon, FixedFrequencyTimeIndex)
         self._check_type(level_period, SinglePeriodTimeIndex)
@@ -510,12 +572,8 @@ class LevelProfile(Base, ABC):
 
         profile_expr = self.get_profile()
 
-        if profile_expr is None:
-            profile_vector = np.ones(
-                scenario_horizon.get_num_periods(),
-                dtype=np.float32 if is_float32 else np.float64,
-            )
-        else:
+        profile_vector = None
+        if profile_expr is not None:
             profile_vector = get_profile_vector(
                 expr=profile_expr,
                 db=db,
@@ -536,10 +594,33 @@ class LevelProfile(Base, ABC):
                 is_max=self._IS_MAX_AND_ZERO_ONE,
             )
 
-        if intercept is None:
-            return level_value * profile_vector
+        return level_value, profile_vector, intercept
 
-        return level_value * profile_vector + intercept
+    def _check_out_vector(self, out: NDArray, num_periods: int) -> None:
+        self._check_type(out, np.ndarray)
+        if out.shape != (num_periods,):
+            message = f"Expected out with shape ({num_periods},), got {out.shape}."
+            raise ValueError(message)
+        if not np.issubdtype(out.dtype, np.floating):
+            message = f"Expected out with float dtype, got {out.dtype}."
+            raise ValueError(message)
+
+    def _write_scenario_window(
+        self,
+        out: NDArray,
+        level_value: float,
+        profile_vector: NDArray | None,
+        intercept: float | None,
+        start: int,
+        stop: int,
+    ) -> None:
+        """Write level * profile[start:stop] + intercept into out without temporaries. Never modify profile_vector, it may be cached."""
+        if profile_vector is None:
+            out.fill(level_value)
+        else:
+            np.multiply(profile_vector[start:stop], level_value, out=out)
+        if intercept is not None:
+            np.add(out, intercept, out=out)
 
     def _has_same_behaviour(self, other: LevelProfile) -> bool:
         return all(
@@ -595,24 +676,28 @@ class LevelProfile(Base, ABC):
 class FlowVolume(LevelProfile):
     """Represents a flow volume attribute, indicating that the attribute is a flow variable."""
 
+    __slots__ = ()
+
     _IS_FLOW = True
 
 
 class Coefficient(LevelProfile):
     """Represents a coefficient attribute, used as a base class for various coefficient types."""
 
-    pass
+    __slots__ = ()
 
 
 class ArrowCoefficient(Coefficient):
     """Represents an arrow coefficient attribute, used for efficiency, loss, and conversion coefficients."""
 
-    pass
+    __slots__ = ()
 
 
 class ShaddowPrice(Coefficient):
     """Represents a shadow price attribute, indicating that the attribute has unit might be negative."""
 
+    __slots__ = ()
+
     _IS_UNITLESS = False
     _IS_NOT_NEGATIVE = False
 
@@ -620,6 +705,8 @@ class ShaddowPrice(Coefficient):
 class ObjectiveCoefficient(Coefficient):
     """Represents an objective coefficient attribute, indicating cost or revenue coefficients in the objective function."""
 
+    __slots__ = ()
+
     _IS_UNITLESS = False
     _IS_NOT_NEGATIVE = False
 
@@ -630,18 +717,24 @@ class ObjectiveCoefficient(Coefficient):
 class Price(ShaddowPrice):
     """Represents a price attribute, inheriting from ShaddowPrice."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
 
 
 class WaterValue(ShaddowPrice):
     """Represents a water value attribute, inheriting from ShaddowPrice."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
 
 
 class Cost(ObjectiveCoefficient):
     """Represents a cost attribute, indicating cost coefficients in the objective function."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
     _IS_COST = True
 
@@ -649,6 +742,8 @@ class Cost(ObjectiveCoefficient):
 class ReservePrice(ObjectiveCoefficient):
     """Represents a reserve price attribute, indicating revenue coefficients in the objective function."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
     _IS_COST = False
 
@@ -656,6 +751,8 @@ class ReservePrice(ObjectiveCoefficient):
 class Elasticity(Coefficient):  # TODO: How do this work?
     """Represents an elasticity coefficient attribute, indicating a unitless coefficient."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
     _IS_UNITLESS = True
 
@@ -663,6 +760,8 @@ class Elasticity(Coefficient):  # TODO: How do this work?
 class Proportion(Coefficient):  # TODO: How do this work?
     """Represents a proportion coefficient attribute, indicating a unitless coefficient."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
     _IS_UNITLESS = True
 
@@ -670,12 +769,16 @@ class Proportion(Coefficient):  # TODO: How do this work?
 class Hours(Coefficient):  # TODO: How do this work?
     """Represents an hours coefficient attribute, indicating a time-related coefficient."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
 
 
 class Efficiency(ArrowCoefficient):
     """Represents an efficiency coefficient attribute, indicating a unitless coefficient."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
     _IS_UNITLESS = True
 
@@ -683,6 +786,8 @@ class Efficiency(ArrowCoefficient):
 class Loss(ArrowCoefficient):
     """Represents a loss coefficient attribute, indicating a unitless coefficient."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
     _IS_UNITLESS = True
 
@@ -690,18 +795,24 @@ class Loss(ArrowCoefficient):
 class Conversion(ArrowCoefficient):
     """Represents a conversion coefficient attribute, used for conversion factors in the model."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
 
 
 class AvgFlowVolume(FlowVolume):
     """Represents an average flow volume attribute, indicating a flow variable with average values."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
 
 
 class MaxFlowVolume(FlowVolume):
     """Represents a maximum flow volume attribute, indicating a flow variable with maximum values."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
     _IS_MAX_AND_ZERO_ONE = True
 
@@ -709,6 +820,8 @@ class MaxFlowVolume(FlowVolume):
 class StockVolume(LevelProfile):
     """Represents a stock volume attribute, indicating a stock variable with maximum values."""
 
+    __slots__ = ()
+
     _IS_ABSTRACT = False
     _IS_STOCK = True
     _IS_MAX_AND_ZERO_ONE = True
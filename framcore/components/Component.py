@@ -6,20 +6,55 @@ from collections.abc import Iterable
 from framcore import Base
 from framcore.metadata import Meta
 
+# Fields which can be set without invalidating the cached result of get_simpler_components.
+_KEEPS_SIMPLER_COMPONENTS = frozenset(("_parent", "_cached_simpler_components"))
+
+_set_field = object.__setattr__
+
 
 class Component(Base, ABC):
-    """Component interface class."""
+    """
+    Component interface class.
+
+    The result of get_simpler_components is cached, so repeated graph extraction (e.g. get_supported_components)
+    on an unchanged model reuses the same child components. The cache is cleared when a field of the component is
+    set (e.g. by setters), and by add_meta and replace_node. Fields the decomposition reads by value from nested
+    objects (e.g. the power node of a HydroGenerator) should be changed through replace_node, or followed by
+    clear_simpler_components. The cache is not copied, pickled or part of the fingerprint.
+    """
+
+    __slots__ = ("_cached_simpler_components", "_meta", "_parent")
 
     def __init__(self) -> None:
         """Set mandatory private variables."""
         self._parent: Component | None = None
         self._meta: dict[str, Meta] = dict()
 
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set field and clear cached simpler components unless the field does not affect them."""
+        _set_field(self, name, value)
+        if name not in _KEEPS_SIMPLER_COMPONENTS:
+            _set_field(self, "_cached_simpler_components", None)
+
+    def __getstate__(self) -> object:
+        """Drop cached simpler components when pickled or copied, since they point to self as parent."""
+        state = super().__getstate__()
+        if isinstance(state, tuple) and "_cached_simpler_components" in state[1]:
+            slots = dict(state[1])
+            del slots["_cached_simpler_components"]
+            state = (state[0], slots)
+        return state
+
+    def clear_simpler_components(self) -> None:
+        """Clear cached result of get_simpler_components. Call after changing nested objects the decomposition reads."""
+        self._cached_simpler_components = None
+
     def add_meta(self, key: str, value: Meta) -> None:
         """Add metadata to component. Overwrite if already exist."""
         self._check_type(key, str)
         self._check_type(value, Meta)
         self._meta[key] = value
+        self._cached_simpler_components = None
 
     def get_meta(self, key: str) -> Meta | None:
         """Get metadata from component or return None if not exist."""
@@ -43,7 +78,13 @@ class Component(Base, ABC):
         Insert self as parent in each child.
 
         Transfer metadata to each child.
+
+        The result is cached and reused by later calls with the same base_name until self is changed,
+        see Component. The returned dict is new on each call, but the child components are shared.
         """
+        cached = getattr(self, "_cached_simpler_components", None)
+        if cached is not None and cached[0] == base_name:
+            return dict(cached[1])
         self._check_type(base_name, str)
         components = self._get_simpler_components(base_name)
         assert base_name not in components, f"base_name: {base_name}\ncomponent: {self}"
@@ -59,7 +100,8 @@ class Component(Base, ABC):
             value = self.get_meta(key)
             for c in components.values():
                 c.add_meta(key, value)
-        return components
+        self._cached_simpler_components = (base_name, components)
+        return dict(components)
 
     def get_parent(self) -> Component | None:
         """Return parent if any, else None."""
@@ -89,6 +131,7 @@ class Component(Base, ABC):
         self._check_type(old, str)
         self._check_type(new, str)
         self._replace_node(old, new)
+        self._cached_simpler_components = None
 
     def _check_component_not_self(self, other: Component | None) -> None:
         if not isinstance(other, Component):
@@ -9,6 +9,8 @@ from framcore.timevectors import TimeVector
 class Demand(Component):
     """Demand class representing a simple demand with possible reserve price. Subclass of Component."""
 
+    __slots__ = ("_capacity", "_consumption", "_elastic_demand", "_node", "_reserve_price", "_temperature_profile")
+
     def __init__(
         self,
         node: str,
@@ -56,7 +58,7 @@ class Demand(Component):
     def set_node(self, node: str) -> None:
         """Set the node of the demand component."""
         self._check_type(node, str)
-        self.node = node
+        self._node = node
 
     def get_reserve_price(self) -> ReservePrice | None:
         """Get the reserve price level of the demand component."""
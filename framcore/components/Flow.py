@@ -14,6 +14,18 @@ if TYPE_CHECKING:
 class Flow(Component):
     """Represents a commodity flow in or out of one or more nodes."""
 
+    __slots__ = (
+        "_arrow_volumes",
+        "_arrows",
+        "_cost_terms",
+        "_is_exogenous",
+        "_main_node",
+        "_max_capacity",
+        "_min_capacity",
+        "_startupcost",
+        "_volume",
+    )
+
     def __init__(
         self,
         main_node: str,
@@ -5,6 +5,22 @@ from framcore.components import Component, Flow, Node
 class HydroModule(Component):
     """HydroModule class representing a hydro module component."""
 
+    __slots__ = (
+        "_bypass",
+        "_commodity",
+        "_generator",
+        "_hydraulic_coupling",
+        "_inflow",
+        "_pump",
+        "_release_capacity",
+        "_release_to",
+        "_release_volume",
+        "_reservoir",
+        "_spill_to",
+        "_spill_volume",
+        "_water_value",
+    )
+
     # We add this to module name to get corresponding node name
     _NODE_NAME_POSTFIX = "_node"
 
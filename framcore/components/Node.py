@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 class Node(Component):
     """Node class. Subclass of Component."""
 
+    __slots__ = ("_commodity", "_is_exogenous", "_price", "_storage")
+
     def __init__(
         self,
         commodity: str,
@@ -22,6 +22,16 @@ class Thermal(_PowerPlant):
     This class is compatible with ThermalAggregator.
     """
 
+    __slots__ = (
+        "_efficiency",
+        "_emission_coefficient",
+        "_emission_demand",
+        "_emission_node",
+        "_fuel_demand",
+        "_fuel_node",
+        "_startupcost",
+    )
+
     def __init__(
         self,
         power_node: str,
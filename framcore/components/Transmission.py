@@ -15,6 +15,19 @@ class Transmission(Component):
 
     """
 
+    __slots__ = (
+        "_from_node",
+        "_ingoing_volume",
+        "_loss",
+        "_max_capacity",
+        "_min_capacity",
+        "_outgoing_volume",
+        "_ramp_down",
+        "_ramp_up",
+        "_tariff",
+        "_to_node",
+    )
+
     def __init__(
         self,
         from_node: str,
@@ -12,6 +12,8 @@ class _PowerPlant(Component):
     Functions that are dependent on commodity nodes other than power are defined in the spesific power plant components.
     """
 
+    __slots__ = ("_max_capacity", "_min_capacity", "_power_node", "_production", "_voc")
+
     def __init__(
         self,
         power_node: str,
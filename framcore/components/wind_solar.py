@@ -16,6 +16,8 @@ class _WindSolar(_PowerPlant):
     subclass since other subclases are dependent on fuel and emission nodes.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         power_node: str,
@@ -58,10 +60,10 @@ class _WindSolar(_PowerPlant):
 class Wind(_WindSolar):
     """Wind power component."""
 
-    pass
+    __slots__ = ()
 
 
 class Solar(_WindSolar):
     """Solar power component."""
 
-    pass
+    __slots__ = ()
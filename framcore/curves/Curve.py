@@ -1,10 +1,13 @@
 """Curve interface."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 from framcore import Base
+from framcore.curves.CurveBreakpoints import CurveBreakpoints
 
 
 class Curve(Base, ABC):
@@ -42,3 +45,37 @@ class Curve(Base, ABC):
 
         """
         pass
+
+    def get_breakpoints(self, mode: str = CurveBreakpoints.LINEAR) -> CurveBreakpoints:
+        """Return breakpoints of the curve prepared for interpolation in mode (linear or monotone_spline)."""
+        return CurveBreakpoints(self.get_x_axis(is_float32=False), self.get_y_axis(is_float32=False), mode)
+
+    def evaluate(self, x: ArrayLike, mode: str = CurveBreakpoints.LINEAR) -> NDArray:
+        """
+        Interpolate the curve at x.
+
+        Args:
+            x (ArrayLike): Points on the x axis (any shape).
+            mode (str): linear or monotone_spline. See CurveBreakpoints.
+
+        Returns:
+            NDArray: float64 array of the same shape as x.
+
+        """
+        return self.get_breakpoints(mode).evaluate(x)
+
+    @staticmethod
+    def evaluate_many(curves: list[Curve], x: ArrayLike, mode: str = CurveBreakpoints.LINEAR) -> NDArray:
+        """
+        Interpolate many curves in one vectorized pass.
+
+        Args:
+            curves (list[Curve]): Curves to evaluate.
+            x (ArrayLike): Shape (n_points,) to evaluate all curves at the same points, or (n_curves, n_points).
+            mode (str): linear or monotone_spline. See CurveBreakpoints.
+
+        Returns:
+            NDArray: float64 array of shape (n_curves, n_points).
+
+        """
+        return CurveBreakpoints.evaluate_many([curve.get_breakpoints(mode) for curve in curves], x)
@@ -0,0 +1,202 @@
+"""Breakpoints of a curve prepared for fast interpolation."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from framcore import Base
+
+
+class CurveBreakpoints(Base):
+    """
+    Breakpoints of a curve sorted by x, with the polynomial coefficients of each interval precomputed.
+
+    Modes:
+        linear: Piecewise linear interpolation, like np.interp.
+        monotone_spline: Piecewise cubic Hermite interpolation with Fritsch-Carlson slopes (PCHIP). Smooth, keeps
+            monotonicity of the data and does not overshoot between breakpoints.
+
+    Outside the breakpoints, the curve is extrapolated with the first and last y value, like np.interp.
+    """
+
+    LINEAR = "linear"
+    MONOTONE_SPLINE = "monotone_spline"
+
+    _MODES = (LINEAR, MONOTONE_SPLINE)
+
+    def __init__(self, x_axis: ArrayLike, y_axis: ArrayLike, mode: str = LINEAR) -> None:
+        """
+        Sort breakpoints by x and precompute interval coefficients.
+
+        Args:
+            x_axis (ArrayLike): 1-D x values of breakpoints. Must be finite and unique.
+            y_axis (ArrayLike): 1-D y values of breakpoints. Must be finite and have the same length as x_axis.
+            mode (str): linear or monotone_spline.
+
+        """
+        if mode not in self._MODES:
+            message = f"Expected mode in {self._MODES}, got {mode}."
+            raise ValueError(message)
+        x = np.asarray(x_axis, dtype=np.float64)
+        y = np.asarray(y_axis, dtype=np.float64)
+        if x.ndim != 1 or y.shape != x.shape or x.size == 0:
+            message = f"Expected non-empty 1-D x and y axes of equal length, got shapes {x.shape} and {y.shape}."
+            raise ValueError(message)
+        if not (np.all(np.isfinite(x)) and np.all(np.isfinite(y))):
+            message = "Curve breakpoints must be finite."
+            raise ValueError(message)
+
+        order = np.argsort(x, kind="stable")
+        x = x[order]
+        y = y[order]
+        if np.any(np.diff(x) == 0):
+            message = f"Curve has duplicate x values {np.unique(x[1:][np.diff(x) == 0]).tolist()}."
+            raise ValueError(message)
+
+        self._mode = mode
+        self._x = x
+        self._y = y
+        self._coefficients = self._get_coefficients(x, y, mode)
+        for array in (self._x, self._y, self._coefficients):
+            array.setflags(write=False)
+
+    def __repr__(self) -> str:
+        """Return short representation."""
+        return f"{type(self).__name__}(mode={self._mode}, num_breakpoints={self._x.size})"
+
+    def get_mode(self) -> str:
+        """Return interpolation mode."""
+        return self._mode
+
+    def get_x(self) -> NDArray:
+        """Return sorted x values of breakpoints."""
+        return self._x
+
+    def get_y(self) -> NDArray:
+        """Return y values of breakpoints in order of sorted x values."""
+        return self._y
+
+    def evaluate(self, x: ArrayLike) -> NDArray:
+        """Interpolate curve at x (any shape). Return float64 array of the same shape."""
+        x = np.asarray(x, dtype=np.float64)
+        if self._x.size == 1:
+            return np.full(x.shape, self._y[0])
+        x = np.clip(x, self._x[0], self._x[-1])
+        index = np.clip(np.searchsorted(self._x, x, side="right") - 1, 0, self._x.size - 2)
+        return self._evaluate_intervals(self._x, self._y, self._coefficients, index, x, self._is_linear())
+
+    @staticmethod
+    def evaluate_many(breakpoints: list[CurveBreakpoints], x: ArrayLike) -> NDArray:
+        """
+        Interpolate many curves in one vectorized pass.
+
+        Args:
+            breakpoints (list[CurveBreakpoints]): Curves to evaluate. Modes can differ.
+            x (ArrayLike): Shape (n_points,) to evaluate all curves at the same points, or (n_curves, n_points)
+                to evaluate each curve at its own points.
+
+        Returns:
+            NDArray: float64 array of shape (n_curves, n_points).
+
+        """
+        num_curves = len(breakpoints)
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 1:
+            x = np.broadcast_to(x, (num_curves, x.size))
+        if x.ndim != 2 or x.shape[0] != num_curves:  # noqa: PLR2004
+            message = f"Expected x of shape (n_points,) or ({num_curves}, n_points), got {x.shape}."
+            raise ValueError(message)
+        if num_curves == 0:
+            return np.zeros(x.shape)
+
+        # curve i gets knots with keys in [2i, 2i + 1], so one searchsorted finds intervals of all curves
+        sizes = np.array([b._x.size for b in breakpoints])  # noqa: SLF001
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        first = np.array([b._x[0] for b in breakpoints])  # noqa: SLF001
+        last = np.array([b._x[-1] for b in breakpoints])  # noqa: SLF001
+        span = np.where(last > first, last - first, 1.0)
+
+        knots_x = np.concatenate([b._x for b in breakpoints])  # noqa: SLF001
+        knots_y = np.concatenate([b._y for b in breakpoints])  # noqa: SLF001
+        coefficients = np.concatenate([b._coefficients for b in breakpoints])  # noqa: SLF001
+        curve_of_knot = np.repeat(np.arange(num_curves), sizes)
+        knot_keys = 2.0 * curve_of_knot + (knots_x - first[curve_of_knot]) / span[curve_of_knot]
+
+        x = np.clip(x, first[:, None], last[:, None])
+        keys = 2.0 * np.arange(num_curves)[:, None] + (x - first[:, None]) / span[:, None]
+        index = np.searchsorted(knot_keys, keys, side="right") - 1
+        index = np.clip(index, starts[:, None], (starts + np.maximum(sizes - 2, 0))[:, None])
+
+        is_linear = all(b._is_linear() for b in breakpoints)  # noqa: SLF001
+        return CurveBreakpoints._evaluate_intervals(knots_x, knots_y, coefficients, index, x, is_linear)
+
+    def _is_linear(self) -> bool:
+        return self._mode == self.LINEAR or self._x.size < 3  # noqa: PLR2004
+
+    @staticmethod
+    def _evaluate_intervals(
+        knots_x: NDArray,
+        knots_y: NDArray,
+        coefficients: NDArray,
+        index: NDArray,
+        x: NDArray,
+        is_linear: bool,
+    ) -> NDArray:
+        """Return y = y[k] + c1[k] s + c2[k] s^2 + c3[k] s^3 with s = x - x[k] for interval k starting at breakpoint k."""
+        s = x - knots_x[index]
+        if is_linear:
+            y = coefficients[index, 0]
+        else:  # Horner, in place to keep peak memory at a few arrays of the size of x
+            y = coefficients[index, 2]
+            y *= s
+            y += coefficients[index, 1]
+            y *= s
+            y += coefficients[index, 0]
+        y *= s
+        y += knots_y[index]
+        return y
+
+    @classmethod
+    def _get_coefficients(cls, x: NDArray, y: NDArray, mode: str) -> NDArray:
+        """Return (n, 3) array of c1, c2, c3 of the interval starting at each breakpoint. The last row is zero."""
+        coefficients = np.zeros((x.size, 3))
+        if x.size < 2:  # noqa: PLR2004
+            return coefficients
+        h = np.diff(x)
+        delta = np.diff(y) / h
+        if mode == cls.LINEAR or x.size == 2:  # noqa: PLR2004
+            coefficients[:-1, 0] = delta
+            return coefficients
+
+        d = cls._get_monotone_slopes(h, delta)
+        coefficients[:-1, 0] = d[:-1]
+        coefficients[:-1, 1] = (3 * delta - 2 * d[:-1] - d[1:]) / h
+        coefficients[:-1, 2] = (d[:-1] + d[1:] - 2 * delta) / h**2
+        return coefficients
+
+    @staticmethod
+    def _get_monotone_slopes(h: NDArray, delta: NDArray) -> NDArray:
+        """Fritsch-Carlson slopes at breakpoints, as in PCHIP."""
+        d = np.zeros(h.size + 1)
+
+        w1 = 2 * h[1:] + h[:-1]
+        w2 = h[1:] + 2 * h[:-1]
+        is_same_sign = delta[:-1] * delta[1:] > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            harmonic = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+        d[1:-1] = np.where(is_same_sign, harmonic, 0.0)
+
+        d[0] = _get_edge_slope(h[0], h[1], delta[0], delta[1])
+        d[-1] = _get_edge_slope(h[-1], h[-2], delta[-1], delta[-2])
+        return d
+
+
+def _get_edge_slope(h0: float, h1: float, delta0: float, delta1: float) -> float:
+    """Three-point slope at an end breakpoint, limited to keep the end interval monotone."""
+    d = ((2 * h0 + h1) * delta0 - h0 * delta1) / (h0 + h1)
+    if np.sign(d) != np.sign(delta0):
+        return 0.0
+    if np.sign(delta0) != np.sign(delta1) and abs(d) > 3 * abs(delta0):
+        return 3 * delta0
+    return float(d)
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 from numpy.typing import NDArray
 
-from framcore.curves import Curve
+from framcore.curves import Curve, CurveBreakpoints
 from framcore.fingerprints import Fingerprint
 
 if TYPE_CHECKING:
@@ -39,6 +39,10 @@ class LoadedCurve(Curve):
         Returns the unit for the y-axis.
     get_loader()
         Returns the loader instance.
+    get_breakpoints(mode)
+        Returns cached breakpoints of the curve, prepared for interpolation.
+    clear_cache()
+        Clears the cached breakpoints.
     get_fingerprint()
         Returns the fingerprint of the curve.
 
@@ -62,6 +66,14 @@ class LoadedCurve(Curve):
         # TODO: get from loader
         self._reference_period = None
 
+        self._breakpoints: dict[str, tuple[NDArray, NDArray, CurveBreakpoints]] = dict()
+
+    def __getstate__(self) -> dict:
+        """Drop cached breakpoints when pickled or deepcopied. The loader is the source of the data."""
+        state = self.__dict__.copy()
+        state["_breakpoints"] = dict()
+        return state
+
     def __repr__(self) -> str:
         """Return a string representation of the LoadedCurve instance."""
         return f"{type(self).__name__}(curve_id={self._curve_id},loader={self._loader},x_unit={self.get_x_unit()}),y_unit={self.get_y_unit()}),"
@@ -91,7 +103,7 @@ class LoadedCurve(Curve):
         """
         x_axis = self._loader.get_x_axis(self._curve_id)
         if is_float32:
-            x_axis = x_axis.astype(np.float32)
+            x_axis = x_axis.astype(np.float32, copy=False)
         return x_axis
 
     def get_y_axis(self, is_float32: bool) -> NDArray:
@@ -107,7 +119,7 @@ class LoadedCurve(Curve):
         """
         y_axis = self._loader.get_y_axis(self._curve_id)
         if is_float32:
-            y_axis = y_axis.astype(np.float32)
+            y_axis = y_axis.astype(np.float32, copy=False)
         return y_axis
 
     def get_x_unit(self) -> str:
@@ -146,10 +158,46 @@ class LoadedCurve(Curve):
         """
         return self._loader
 
+    def get_breakpoints(self, mode: str = CurveBreakpoints.LINEAR) -> CurveBreakpoints:
+        """
+        Return breakpoints of the curve prepared for interpolation in mode.
+
+        Breakpoints are computed once per mode and cached with the curve. The cache is only used
+        while the loader returns the same axis arrays, so it is refreshed when the loader cache is
+        cleared or its source is changed.
+
+        Parameters
+        ----------
+        mode : str
+            linear or monotone_spline. See CurveBreakpoints.
+
+        Returns
+        -------
+        CurveBreakpoints
+            Breakpoints sorted by x with precomputed interval coefficients.
+
+        """
+        x_axis = self._loader.get_x_axis(self._curve_id)
+        y_axis = self._loader.get_y_axis(self._curve_id)
+        cached = self._breakpoints.get(mode)
+        if cached is not None and cached[0] is x_axis and cached[1] is y_axis:
+            return cached[2]
+        breakpoints = CurveBreakpoints(x_axis, y_axis, mode)
+        self._breakpoints[mode] = (x_axis, y_axis, breakpoints)
+        return breakpoints
+
+    def clear_cache(self) -> None:
+        """Clear cached breakpoints of the curve. The loader cache is not cleared."""
+        self._breakpoints.clear()
+
     def get_fingerprint(self) -> Fingerprint:
         """
         Return the fingerprint of the curve.
 
-        The method is not implemented yet.
+        Returns
+        -------
+        Fingerprint
+            Fingerprint of the units and axes of the curve in the loader.
+
         """
-        raise NotImplementedError("Not implemented yet.")
+        return self._loader.get_fingerprint(self._curve_id)
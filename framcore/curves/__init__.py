@@ -1,9 +1,11 @@
 # framcore/curves/__init__.py
 
+from framcore.curves.CurveBreakpoints import CurveBreakpoints
 from framcore.curves.Curve import Curve
 from framcore.curves.LoadedCurve import LoadedCurve
 
 __all__ = [
     "Curve",
+    "CurveBreakpoints",
     "LoadedCurve",
 ]
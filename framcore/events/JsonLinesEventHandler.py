@@ -0,0 +1,43 @@
+"""Event handler writing events to a JSON lines file."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from framcore.events.events import _make_event_record
+
+
+class JsonLinesEventHandler:
+    """
+    Append events to a file with one JSON object per line (time, type, sender and event fields).
+
+    Values that are not JSON serializable are written as str.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Append events to path. Call close when done."""
+        self._path = Path(path)
+        self._file = self._path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def handle_event(self, sender: object, event_type: str, **kwargs: object) -> None:
+        """Write event as one line."""
+        line = json.dumps(_make_event_record(sender, event_type, **kwargs), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def get_path(self) -> Path:
+        """Get path of the file."""
+        return self._path
+
+    def flush(self) -> None:
+        """Flush written events to the file."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,39 @@
+"""Event handler keeping the latest events in memory."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+from framcore.events.events import _make_event_record
+
+
+class RingBufferEventHandler:
+    """Keep the latest capacity events in memory as dicts with time, type, sender and event fields."""
+
+    def __init__(self, capacity: int = 10000) -> None:
+        """Keep at most capacity events. Older events are dropped."""
+        if not isinstance(capacity, int) or capacity < 1:
+            message = f"Expected capacity to be positive int. Got {capacity}"
+            raise ValueError(message)
+        self._events: deque[dict[str, object]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def handle_event(self, sender: object, event_type: str, **kwargs: object) -> None:
+        """Store event."""
+        record = _make_event_record(sender, event_type, **kwargs)
+        with self._lock:
+            self._events.append(record)
+
+    def get_events(self, event_type: str | None = None) -> list[dict[str, object]]:
+        """Get stored events, oldest first. Only events of event_type if given."""
+        with self._lock:
+            events = list(self._events)
+        if event_type is None:
+            return events
+        return [e for e in events if e["type"] == event_type]
+
+    def clear(self) -> None:
+        """Remove stored events."""
+        with self._lock:
+            self._events.clear()
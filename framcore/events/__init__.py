@@ -1,21 +1,39 @@
 # framcore/events/__init__.py
 
 from framcore.events.events import (
+    get_counters,
     get_event_handler,
+    get_event_level,
+    increment_counter,
+    is_event_enabled,
+    reset_counters,
     set_event_handler,
+    set_event_level,
     send_debug_event,
     send_error_event,
     send_event,
     send_info_event,
     send_warning_event,
+    span,
 )
+from framcore.events.JsonLinesEventHandler import JsonLinesEventHandler
+from framcore.events.RingBufferEventHandler import RingBufferEventHandler
 
 __all__ = [
+    "JsonLinesEventHandler",
+    "RingBufferEventHandler",
+    "get_counters",
     "get_event_handler",
+    "get_event_level",
+    "increment_counter",
+    "is_event_enabled",
+    "reset_counters",
     "send_debug_event",
     "send_error_event",
     "send_event",
     "send_info_event",
     "send_warning_event",
     "set_event_handler",
+    "set_event_level",
+    "span",
 ]
@@ -4,10 +4,31 @@ Event system.
 All code in the core use these functions to communicate events.
 
 Calling systems (e.g. workflow codes) can get events by hooking into SEND_EVENT_CHANNEL.
+
+Events below the event level (see set_event_level) are dropped before they reach the handler.
+Use is_event_enabled to skip building expensive messages, span to time code blocks and
+increment_counter to count things without sending events.
 """
 
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter, time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 _EVENT_HANDLER = None
 
+_EVENT_LEVELS = {"debug": 10, "span": 10, "info": 20, "warning": 30, "error": 40}
+_event_level = _EVENT_LEVELS["debug"]
+
+_COUNTERS: Counter = Counter()
+_COUNTERS_LOCK = threading.Lock()
+
 
 def set_event_handler(handler: object | None) -> None:
     """Set event handler if any."""
@@ -23,8 +44,29 @@ def get_event_handler() -> object | None:
     return _EVENT_HANDLER
 
 
+def set_event_level(level: str) -> None:
+    """Drop events below level (debug, info, warning or error) before they are sent. Default debug."""
+    global _event_level  # noqa: PLW0603
+    if level not in ("debug", "info", "warning", "error"):
+        message = f"Unknown event level {level}. Expected debug, info, warning or error."
+        raise ValueError(message)
+    _event_level = _EVENT_LEVELS[level]
+
+
+def get_event_level() -> str:
+    """Get lowest event level that is sent."""
+    return next(name for name, value in _EVENT_LEVELS.items() if value == _event_level)
+
+
+def is_event_enabled(event_type: str) -> bool:
+    """Return True if events of event_type are sent. Check this before formatting expensive messages."""
+    return _EVENT_LEVELS.get(event_type, _event_level) >= _event_level
+
+
 def send_event(sender: object, event_type: str, **kwargs: dict[str, object]) -> None:
     """All events in core should use this."""
+    if not is_event_enabled(event_type):
+        return
     if _EVENT_HANDLER is None:
         print(event_type, kwargs)
     else:
@@ -49,3 +91,48 @@ def send_info_event(sender: object, message: str) -> None:
 def send_debug_event(sender: object, message: str) -> None:
     """Use this to send debug event."""
     send_event(sender, "debug", message=message)
+
+
+@contextmanager
+def span(sender: object, name: str, **fields: object) -> Iterator[dict[str, object]]:
+    """
+    Time the with block and send a span event with name, seconds and fields when it exits.
+
+    Fields (e.g. component ids) can be added to the yielded dict inside the block.
+    Does nothing if span events are disabled (event level above debug).
+    """
+    if not is_event_enabled("span"):
+        yield fields
+        return
+    t0 = perf_counter()
+    try:
+        yield fields
+    finally:
+        send_event(sender, "span", name=name, seconds=perf_counter() - t0, **fields)
+
+
+def increment_counter(name: str, value: int | float = 1) -> None:
+    """Add value to counter name. Counters are not sent as events, read them with get_counters."""
+    with _COUNTERS_LOCK:
+        _COUNTERS[name] += value
+
+
+def get_counters() -> dict[str, int | float]:
+    """Get copy of all counters."""
+    with _COUNTERS_LOCK:
+        return dict(_COUNTERS)
+
+
+def reset_counters() -> None:
+    """Remove all counters."""
+    with _COUNTERS_LOCK:
+        _COUNTERS.clear()
+
+
+def _make_event_record(sender: object, event_type: str, **kwargs: object) -> dict[str, object]:
+    """Return event as flat dict with time, type and sender name instead of sender object."""
+    if isinstance(sender, type) or (callable(sender) and hasattr(sender, "__qualname__")):
+        sender_name = sender.__qualname__
+    else:
+        sender_name = type(sender).__name__
+    return {"time": time(), "type": event_type, "sender": sender_name, **kwargs}
@@ -9,7 +9,9 @@ from framcore.expressions.units import (
 )
 
 from framcore.expressions.queries import (
+    add_loaded_id,
     get_level_value,
+    get_loaded_ids_from_expr,
     get_profile_vector,
     get_units_from_expr,
     get_timeindexes_from_expr,
@@ -17,8 +19,10 @@ from framcore.expressions.queries import (
 
 __all__ = [
     "Expr",
+    "add_loaded_id",
     "ensure_expr",
     "get_level_value",
+    "get_loaded_ids_from_expr",
     "get_profile_vector",
     "get_timeindexes_from_expr",
     "get_unit_conversion_factor",
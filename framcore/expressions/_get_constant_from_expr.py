@@ -15,8 +15,6 @@ from __future__ import annotations
 from time import time
 from typing import TYPE_CHECKING
 
-import sympy
-
 from framcore.curves import Curve
 from framcore.events import send_warning_event
 from framcore.expressions import Expr
@@ -28,33 +26,13 @@ from framcore.timevectors import ConstantTimeVector, TimeVector
 
 if TYPE_CHECKING:
     from framcore import Model
+    from framcore.querydbs import QueryMetrics
 
 _DEBUG = False
 _DEBUG_ROUND_DECIMALS = 5
 _WARN_IF_FALLBACK = True
 _WARN_MAX_ELAPSED_SECONDS = 0.1
 
-_NUM_LEAF = 0
-_NUM_FALLBACK = 0
-_NUM_FASTPATH_PRODUCT = 0
-_NUM_FASTPATH_AGGREGATION = 0
-_NUM_FASTPATH_SUM = 0
-
-
-def _get_case_counts() -> dict[str, int]:
-    """
-    Return dict of counts for different cases of _get_constant_from_expr.
-
-    Useful for fastpath development.
-    """
-    return {
-        "fastpath_leaf": _NUM_LEAF,
-        "fallback": _NUM_FALLBACK,
-        "fastpath_sum": _NUM_FASTPATH_SUM,
-        "fastpath_product": _NUM_FASTPATH_PRODUCT,
-        "fastpath_aggregation": _NUM_FASTPATH_AGGREGATION,
-    }
-
 
 def _get_constant_from_expr(
     expr: Expr,
@@ -83,39 +61,25 @@ def _get_constant_from_expr(
         is_max,
     )
 
-    # counts for debug and optimization
-    global _NUM_LEAF  # noqa: PLW0603
-    global _NUM_FALLBACK  # noqa: PLW0603
-    global _NUM_FASTPATH_PRODUCT  # noqa: PLW0603
-    global _NUM_FASTPATH_AGGREGATION  # noqa: PLW0603
-    global _NUM_FASTPATH_SUM  # noqa: PLW0603
-
-    fastpath = None
-
-    if real_expr.is_leaf():
-        _NUM_LEAF += 1
-        fastpath = _fastpath_leaf(constants_with_units, real_expr, unit)
+    # timings for debug and optimization, see QueryDB.enable_metrics
+    metrics = db.get_metrics()
 
-    elif _is_fastpath_sum(expr):
-        _NUM_FASTPATH_SUM += 1
-        fastpath = _fastpath_sum(constants_with_units, real_expr, unit)
-
-    elif _is_fastpath_product(real_expr):
-        _NUM_FASTPATH_PRODUCT += 1
-        fastpath = _fastpath_product(constants_with_units, real_expr, unit)
-
-    elif _is_fastpath_aggregation(real_expr):
-        _NUM_FASTPATH_AGGREGATION += 1
-        fastpath = _fastpath_aggregation(constants_with_units, real_expr, unit)
+    if metrics is None:
+        __, fastpath = _get_fastpath(constants_with_units, expr, real_expr, unit)
+    else:
+        fastpath = _get_fastpath_with_metrics(metrics, constants_with_units, expr, real_expr, unit)
 
     if fastpath is not None and _DEBUG is not True:
         return fastpath
 
-    _NUM_FALLBACK += 1
     t = time()
     fallback = _sympy_fallback(constants_with_units, expr_str, unit)
     elapsed_seconds_fallback = time() - t
 
+    if metrics is not None:
+        metrics.record_evaluation("fallback", elapsed_seconds_fallback)
+        metrics.record_fallback_expr(expr_str, elapsed_seconds_fallback)
+
     if _DEBUG and fastpath is not None and round(fastpath, _DEBUG_ROUND_DECIMALS) != round(fallback, _DEBUG_ROUND_DECIMALS):
         message = f"Different results!\nExpr {real_expr}\nwith symbolic representation {expr_str}\nfastpath {fastpath} and fallback {fallback}"
         raise RuntimeError(message)
@@ -127,6 +91,43 @@ def _get_constant_from_expr(
     return fallback
 
 
+def _get_fastpath(
+    constants_with_units: dict[str, tuple],
+    expr: Expr,
+    real_expr: Expr,
+    unit: str | None,
+) -> tuple[str | None, float | None]:
+    """Return name and result of the fastpath case matching real_expr, or (None, None) if no case matches."""
+    if real_expr.is_leaf():
+        return "fastpath_leaf", _fastpath_leaf(constants_with_units, real_expr, unit)
+
+    if _is_fastpath_sum(expr):
+        return "fastpath_sum", _fastpath_sum(constants_with_units, real_expr, unit)
+
+    if _is_fastpath_product(real_expr):
+        return "fastpath_product", _fastpath_product(constants_with_units, real_expr, unit)
+
+    if _is_fastpath_aggregation(real_expr):
+        return "fastpath_aggregation", _fastpath_aggregation(constants_with_units, real_expr, unit)
+
+    return None, None
+
+
+def _get_fastpath_with_metrics(
+    metrics: QueryMetrics,
+    constants_with_units: dict[str, tuple],
+    expr: Expr,
+    real_expr: Expr,
+    unit: str | None,
+) -> float | None:
+    """Call _get_fastpath and record the elapsed time of the matching case in metrics."""
+    t = time()
+    case, fastpath = _get_fastpath(constants_with_units, expr, real_expr, unit)
+    if case is not None:
+        metrics.record_evaluation(case, time() - t)
+    return fastpath
+
+
 def _update_constants_with_units(
     constants_with_units: dict[str, tuple],
     real_expr: Expr,
@@ -461,6 +462,8 @@ def _get_fastpath_aggregation_denominator_dict(
 
 def _sympy_fallback(constants_with_units: dict[str, tuple], expr_str: str, target_unit: str | None) -> float:
     """Convert expr to sympy expr, substitue in constants with units, and let sympy evaluate."""
+    import sympy  # noqa: PLC0415  (deferred, see units.py)
+
     expr_sym = sympy.sympify(expr_str)
     for src, (sym, value, unit) in constants_with_units.items():
         sympy_sym = sympy.Symbol(sym)
@@ -1,22 +1,22 @@
 from __future__ import annotations
 
-import time
 from typing import TYPE_CHECKING
 
 import numpy as np
 from numpy.typing import NDArray
 
-from framcore.curves import Curve
+from framcore.curves import Curve, LoadedCurve
 from framcore.expressions import Expr
 from framcore.expressions._get_constant_from_expr import _get_constant_from_expr
 from framcore.expressions._utils import _load_model_and_create_model_db
 from framcore.expressions.units import get_unit_conversion_factor
 from framcore.querydbs import QueryDB
 from framcore.timeindexes import FixedFrequencyTimeIndex, SinglePeriodTimeIndex, TimeIndex
-from framcore.timevectors import TimeVector
+from framcore.timevectors import LoadedTimeVector, TimeVector
 
 if TYPE_CHECKING:
     from framcore import Model
+    from framcore.loaders import Loader
 
 
 def get_level_value(
@@ -118,6 +118,29 @@ def get_timeindexes_from_expr(db: QueryDB | Model, expr: Expr) -> set[TimeIndex]
     return timeindexes
 
 
+def get_loaded_ids_from_expr(db: QueryDB | Model, expr: Expr) -> dict[Loader, set[str]]:
+    """
+    Find ids of all loaded time vectors and curves behind an expression, grouped by loader.
+
+    Useful for loading data in bulk before queries (see Model.prefetch).
+    """
+    db = _load_model_and_create_model_db(db)
+
+    loaded_ids: dict[Loader, set[str]] = dict()
+
+    _recursively_update_loaded_ids(loaded_ids, db, expr)
+
+    return loaded_ids
+
+
+def add_loaded_id(loaded_ids: dict[Loader, set[str]], obj: object) -> None:
+    """Add loader and id of obj to loaded_ids if obj is a LoadedTimeVector or LoadedCurve."""
+    if isinstance(obj, LoadedTimeVector):
+        loaded_ids.setdefault(obj.get_loader(), set()).add(obj.get_vector_id())
+    elif isinstance(obj, LoadedCurve):
+        loaded_ids.setdefault(obj.get_loader(), set()).add(obj.get_unique_name())
+
+
 def _get_level_value(
     expr: Expr,
     db: QueryDB,
@@ -130,14 +153,7 @@ def _get_level_value(
     assert isinstance(expr, Expr), f"{expr}"
 
     cache_key = ("_get_constant_from_expr", expr, unit, data_dim, scen_dim, is_max)
-    if db.has_key(cache_key):
-        return db.get(cache_key)
-    t0 = time.perf_counter()
-    output_value = _get_constant_from_expr(expr, db, unit, data_dim, scen_dim, is_max)
-    t1 = time.perf_counter()
-    db.put(cache_key, output_value, elapsed_seconds=t1 - t0)
-
-    return output_value
+    return db.get_or_compute(cache_key, lambda: _get_constant_from_expr(expr, db, unit, data_dim, scen_dim, is_max))
 
 
 def _get_profile_vector(
@@ -165,14 +181,8 @@ def _get_profile_vector(
 
         assert isinstance(obj, TimeVector)
         cache_key = ("_get_profile_vector_from_timevector", obj, data_dim, scen_dim, is_zero_one, is_float32)
-        if db.has_key(cache_key):
-            vector: NDArray = db.get(cache_key)
-            return vector.copy()
-        t0 = time.perf_counter()
-        vector = _get_profile_vector_from_timevector(obj, scen_dim, is_zero_one, is_float32)
-        t1 = time.perf_counter()
-        db.put(cache_key, vector, elapsed_seconds=t1 - t0)
-        return vector
+        vector: NDArray = db.get_or_compute(cache_key, lambda: _get_profile_vector_from_timevector(obj, scen_dim, is_zero_one, is_float32))
+        return vector.copy()  # callers modify the vector inplace, and it may be cached or shared with other threads
 
     ops, args = expr.get_operations(expect_ops=True, copy_list=False)
 
@@ -295,6 +305,20 @@ def _recursively_update_units(units: set[str], db: QueryDB, expr: Expr) -> None:
         _recursively_update_units(units, db, arg)
 
 
+def _recursively_update_loaded_ids(loaded_ids: dict[Loader, set[str]], db: QueryDB, expr: Expr) -> None:
+    if expr.is_leaf():
+        src = expr.get_src()
+        obj = src if isinstance(src, TimeVector | Curve) else db.get(key=src)
+        if isinstance(obj, Expr):
+            _recursively_update_loaded_ids(loaded_ids, db, obj)
+        else:
+            add_loaded_id(loaded_ids, obj)
+        return
+    __, args = expr.get_operations(expect_ops=False, copy_list=False)
+    for arg in args:
+        _recursively_update_loaded_ids(loaded_ids, db, arg)
+
+
 def _recursively_update_timeindexes(timeindexes: set[TimeIndex], db: QueryDB, expr: Expr) -> None:
     if expr.is_leaf():
         src = expr.get_src()
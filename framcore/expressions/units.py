@@ -1,50 +1,67 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sympy import Expr as SymPyExpr
+
+# sympy is only needed by the fallback for conversions without a fastpath. It is imported on first use, since
+# importing sympy and sympy.physics.units takes about half a second and dominates the import time of framcore.
+
+
+def __getattr__(name: str) -> object:
+    """Create sympy based module attributes EUR and _SUPPORTED_UNITS on first access."""
+    if name == "_SUPPORTED_UNITS":
+        return _get_supported_units()
+    if name == "EUR":
+        return _get_supported_units()["EUR"]
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
+
+
+@functools.cache
+def _get_supported_units() -> dict[str, SymPyExpr]:
+    """Return supported unit strings mapped to sympy units. Imports sympy on first call."""
+    from sympy.physics.units import Quantity, giga, gram, hour, kilo, mega, meter, second, tera, tonne, watt, year  # noqa: PLC0415
+
+    eur = Quantity("EUR", abbrev="€")
+    return {
+        "second": second,
+        "s": second,
+        "hour": hour,
+        "h": hour,
+        "year": year,
+        "y": year,
+        "watt": watt,
+        "g": gram,
+        "gram": gram,
+        "kg": kilo * gram,
+        "t": tonne,
+        "tonne": tonne,
+        "meter": meter,
+        "m": meter,
+        "m3": meter**3,
+        "Mm3": mega * meter**3,
+        "m3/s": meter**3 / second,
+        "kilo": kilo,
+        "mega": mega,
+        "giga": giga,
+        "tera": tera,
+        "kWh": kilo * watt * hour,
+        "MWh": mega * watt * hour,
+        "GWh": giga * watt * hour,
+        "TWh": tera * watt * hour,
+        "kW": kilo * watt,
+        "MW": mega * watt,
+        "GW": giga * watt,
+        "TW": tera * watt,
+        "EUR": eur,
+        "€": eur,
+    }
 
-import sympy
-from sympy import Expr as SymPyExpr
-from sympy.core.power import Pow
-from sympy.core.symbol import Symbol
-from sympy.physics.units import Quantity, giga, gram, hour, kilo, mega, meter, second, tera, tonne, watt, year
-from sympy.physics.units.prefixes import Prefix
-
-EUR = Quantity("EUR", abbrev="€")
-
-_SUPPORTED_UNITS = {
-    "second": second,
-    "s": second,
-    "hour": hour,
-    "h": hour,
-    "year": year,
-    "y": year,
-    "watt": watt,
-    "g": gram,
-    "gram": gram,
-    "kg": kilo * gram,
-    "t": tonne,
-    "tonne": tonne,
-    "meter": meter,
-    "m": meter,
-    "m3": meter**3,
-    "Mm3": mega * meter**3,
-    "m3/s": meter**3 / second,
-    "kilo": kilo,
-    "mega": mega,
-    "giga": giga,
-    "tera": tera,
-    "kWh": kilo * watt * hour,
-    "MWh": mega * watt * hour,
-    "GWh": giga * watt * hour,
-    "TWh": tera * watt * hour,
-    "kW": kilo * watt,
-    "MW": mega * watt,
-    "GW": giga * watt,
-    "TW": tera * watt,
-    "EUR": EUR,
-    "€": EUR,
-}
 
 _FASTPATH_CONVERSION_FACTORS = {
     ("MW", "GW"): 0.001,
@@ -176,8 +193,14 @@ def _fallback_get_unit_conversion_factor(from_unit: str, to_unit: str) -> float
 
 def _unit_str_to_sym(unit: str) -> SymPyExpr:
     """Convert str unit to valid sympy representation or error."""
+    import sympy  # noqa: PLC0415
+    from sympy.core.power import Pow  # noqa: PLC0415
+    from sympy.core.symbol import Symbol  # noqa: PLC0415
+    from sympy.physics.units import Quantity  # noqa: PLC0415
+    from sympy.physics.units.prefixes import Prefix  # noqa: PLC0415
+
     unit = unit.strip()
-    x = sympy.sympify(unit, locals=_SUPPORTED_UNITS)
+    x = sympy.sympify(unit, locals=_get_supported_units())
     unsupported_args = [arg for arg in x.args if not (isinstance(arg, Prefix | Quantity | Pow | Symbol) or arg.is_number)]
     if unsupported_args:
         message = f"Unit string '{unit}' not valid. Unsupported args: {unsupported_args}"
@@ -187,9 +210,11 @@ def _unit_str_to_sym(unit: str) -> SymPyExpr:
 
 def _get_scalar_from_expr(expr_sym: SymPyExpr) -> float | str:
     """Get scalar value from a sympy expression."""
+    from sympy.physics.units.prefixes import Prefix  # noqa: PLC0415
+
     simplified_expr = expr_sym.simplify()
     if not simplified_expr.is_number:
-        for prefix in _SUPPORTED_UNITS.values():
+        for prefix in _get_supported_units().values():
             if isinstance(prefix, Prefix):
                 expr_sym = expr_sym.subs(prefix, prefix.scale_factor)
         simplified_expr = expr_sym.simplify()
@@ -0,0 +1,146 @@
+"""Cache of numpy arrays in shared memory."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import weakref
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from framcore import Base
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from multiprocessing.shared_memory import SharedMemory
+
+    from numpy.typing import NDArray
+
+# Before Python 3.13, SharedMemory registers attached blocks with the resource tracker (on POSIX)
+_IS_TRACKED_ON_ATTACH = sys.version_info < (3, 13) and os.name == "posix"
+
+
+class SharedArrayCache(Base):
+    """
+    Cache numpy arrays in multiprocessing.shared_memory blocks.
+
+    When pickled, only block names, shapes and dtypes are stored. After unpickling in another process
+    (e.g. a worker in a process pool), cached arrays are re-attached to the same physical memory instead
+    of being reloaded. Only the cache that created a block writes to it and unlinks it, when closed or
+    garbage collected. Arrays loaded by an unpickled copy are kept local to that process.
+
+    Cached arrays are read-only.
+    """
+
+    def __init__(self) -> None:
+        """Create empty cache owning the blocks it creates."""
+        self._is_owner = True
+        self._specs: dict[Hashable, tuple[str, tuple[int, ...], str]] = dict()
+        self._arrays: dict[Hashable, NDArray] = dict()
+        self._blocks: list[SharedMemory] = []
+        self._finalizer = weakref.finalize(self, _release_blocks, self._blocks, True)
+
+    def __getstate__(self) -> dict:
+        """Pickle only the names, shapes and dtypes of the shared blocks."""
+        return {"_specs": dict(self._specs)}
+
+    def __setstate__(self, state: dict) -> None:
+        """Blocks are attached lazily. Unpickled copies never unlink blocks."""
+        self._is_owner = False
+        self._specs = state["_specs"]
+        self._arrays = dict()
+        self._blocks = []
+        self._finalizer = weakref.finalize(self, _release_blocks, self._blocks, False)
+
+    def __repr__(self) -> str:
+        """Avoid printing cached arrays."""
+        return f"{type(self).__name__}(num_shared={len(self._specs)}, is_owner={self._is_owner})"
+
+    def get(self, key: Hashable, load: Callable[[], NDArray]) -> NDArray:
+        """Return cached array behind key. Call load and cache its result if not cached or shared block is gone."""
+        if key in self._arrays:
+            return self._arrays[key]
+
+        if key in self._specs:
+            array = self._attach(key)
+            if array is not None:
+                return array
+
+        values = np.asarray(load())
+        if key in self._arrays:  # cached by load itself, e.g. an overridden loader method calling super()
+            return self._arrays[key]
+        if self._is_owner and not values.dtype.hasobject:
+            array = self._create(key, values)
+        else:
+            array = values.view()
+            array.setflags(write=False)
+        self._arrays[key] = array
+        return array
+
+    def get_num_bytes(self) -> int:
+        """Return number of bytes in shared blocks known to this cache."""
+        return sum(int(np.prod(shape)) * np.dtype(dtype).itemsize for __, shape, dtype in self._specs.values())
+
+    def close(self) -> None:
+        """Detach from all blocks. Unlink them if this cache created them."""
+        self._arrays.clear()
+        self._specs.clear()
+        self._finalizer()
+        self._finalizer = weakref.finalize(self, _release_blocks, self._blocks, self._is_owner)
+
+    def _create(self, key: Hashable, values: NDArray) -> NDArray:
+        from multiprocessing.shared_memory import SharedMemory  # noqa: PLC0415  (slow import, most processes never share)
+
+        block = SharedMemory(create=True, size=max(1, values.nbytes))
+        self._blocks.append(block)
+        array = np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)
+        array[...] = values
+        array.setflags(write=False)
+        self._specs[key] = (block.name, values.shape, values.dtype.str)
+        self._arrays[key] = array
+        return array
+
+    def _attach(self, key: Hashable) -> NDArray | None:
+        name, shape, dtype = self._specs[key]
+        try:
+            block = _attach_shared_memory(name)
+        except FileNotFoundError:  # owner is gone, reload
+            del self._specs[key]
+            return None
+        self._blocks.append(block)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        array.setflags(write=False)
+        self._arrays[key] = array
+        return array
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    """Attach without resource tracking, so the resource tracker of an attaching process does not unlink the block at exit."""
+    from multiprocessing.shared_memory import SharedMemory  # noqa: PLC0415
+
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    block = SharedMemory(name=name)
+    if _IS_TRACKED_ON_ATTACH:
+        from multiprocessing import resource_tracker  # noqa: PLC0415
+
+        resource_tracker.unregister(block._name, "shared_memory")  # noqa: SLF001
+    return block
+
+
+def _release_blocks(blocks: list[SharedMemory], is_owner: bool) -> None:
+    for block in blocks:
+        with contextlib.suppress(BufferError):  # arrays handed out still reference the buffer, memory is freed when they are
+            block.close()
+        if is_owner:
+            if _IS_TRACKED_ON_ATTACH:
+                # a process sharing our resource tracker (e.g. a forked worker) may have unregistered the block when attaching
+                from multiprocessing import resource_tracker  # noqa: PLC0415
+
+                resource_tracker.register(block._name, "shared_memory")  # noqa: SLF001
+            with contextlib.suppress(FileNotFoundError):
+                block.unlink()
+    blocks.clear()
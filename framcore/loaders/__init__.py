@@ -1,10 +1,12 @@
 # framcore/loaders/__init__.py
 
+from framcore.loaders.SharedArrayCache import SharedArrayCache
 from framcore.loaders.loaders import CurveLoader, FileLoader, Loader, TimeVectorLoader
 
 __all__ = [
     "CurveLoader",
     "FileLoader",
     "Loader",
+    "SharedArrayCache",
     "TimeVectorLoader",
 ]
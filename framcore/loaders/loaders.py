@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from numpy.typing import NDArray
 
 from framcore import Base
 from framcore.fingerprints import Fingerprint
+from framcore.loaders.SharedArrayCache import SharedArrayCache
 from framcore.timeindexes import TimeIndex
 from framcore.timevectors import ReferencePeriod
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class Loader(Base, ABC):
     """Base Loader class defining common API and functionality for all Loaders."""
 
+    _shared_arrays: SharedArrayCache | None = None
+
     def __init__(self) -> None:
         """Set up cache of ids contained in the source of the Loader."""
         self._content_ids: list[str] = None
@@ -47,6 +54,35 @@ class Loader(Base, ABC):
         """Clear cached data from the loader."""
         pass
 
+    def enable_shared_memory(self) -> None:
+        """
+        Opt in to keep loaded arrays in shared memory.
+
+        Pickling the loader to other processes (e.g. process pool workers) then re-attaches arrays loaded
+        by this process instead of reloading them, so all processes share one physical copy.
+        Load the arrays before pickling (e.g. TimeVectorLoader.share_values) to share them. Shared arrays are read-only.
+        """
+        if self._shared_arrays is None:
+            self._shared_arrays = SharedArrayCache()
+
+    def disable_shared_memory(self) -> None:
+        """Release shared memory arrays of this loader."""
+        if self._shared_arrays is not None:
+            self._shared_arrays.close()
+            self._shared_arrays = None
+
+    def is_shared_memory(self) -> bool:
+        """Return True if loaded arrays are kept in shared memory."""
+        return self._shared_arrays is not None
+
+    @classmethod
+    def _wrap_shared_arrays(cls, method_names: tuple[str, ...]) -> None:
+        """Let array methods (id) -> NDArray defined by cls use the shared memory cache when it is enabled."""
+        for name in method_names:
+            method = cls.__dict__.get(name)
+            if method is not None and method not in _SHARED_ARRAY_METHODS:
+                setattr(cls, name, _shared_array_method(name, method))
+
     # TODO: Is this correct? Also figure out how sharing Loaders should be when copying model given filepaths and copied
     # database
     def __deepcopy__(self, memo: dict) -> Loader:
@@ -157,8 +193,31 @@ class Loader(Base, ABC):
             raise KeyError(msg)
 
 
+_SHARED_ARRAY_METHODS: set[Callable] = set()  # wrappers made by _shared_array_method
+
+
+def _shared_array_method(name: str, method: Callable[[Loader, str], NDArray]) -> Callable[[Loader, str], NDArray]:
+    @functools.wraps(method)
+    def wrapper(self: Loader, content_id: str) -> NDArray:
+        if self._shared_arrays is None:
+            return method(self, content_id)
+        return self._shared_arrays.get((name, content_id), lambda: method(self, content_id))
+
+    _SHARED_ARRAY_METHODS.add(wrapper)
+    return wrapper
+
+
 class TimeVectorLoader(Loader, ABC):
-    """Loader API for retrieving time vector data from some source."""
+    """
+    Loader API for retrieving time vector data from some source.
+
+    Values returned by get_values are kept in shared memory if enabled (see Loader.enable_shared_memory).
+    """
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Make get_values of subclasses use shared memory when enabled."""
+        super().__init_subclass__(**kwargs)
+        cls._wrap_shared_arrays(("get_values",))
 
     @abstractmethod
     def get_values(self, vector_id: str) -> NDArray:
@@ -249,6 +308,12 @@ class TimeVectorLoader(Loader, ABC):
         """
         pass
 
+    def share_values(self, vector_ids: list[str] | None = None) -> None:
+        """Enable shared memory and load values of vector_ids (default all) into it, before pickling to other processes."""
+        self.enable_shared_memory()
+        for vector_id in self.get_ids() if vector_ids is None else vector_ids:
+            self.get_values(vector_id)
+
     def get_fingerprint(self, vector_id: str) -> Fingerprint:
         """Return Loader Fingerprint for given vector id."""
         f = Fingerprint(self)
@@ -259,7 +324,16 @@ class TimeVectorLoader(Loader, ABC):
 
 
 class CurveLoader(Loader, ABC):
-    """Loader API for retrieving curve data from some source."""
+    """
+    Loader API for retrieving curve data from some source.
+
+    Axes returned by get_x_axis and get_y_axis are kept in shared memory if enabled (see Loader.enable_shared_memory).
+    """
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Make get_x_axis and get_y_axis of subclasses use shared memory when enabled."""
+        super().__init_subclass__(**kwargs)
+        cls._wrap_shared_arrays(("get_x_axis", "get_y_axis"))
 
     @abstractmethod
     def get_y_axis(self, curve_id: str) -> NDArray:
@@ -317,6 +391,15 @@ class CurveLoader(Loader, ABC):
         """
         pass
 
+    def get_fingerprint(self, curve_id: str) -> Fingerprint:
+        """Return Loader Fingerprint for given curve id."""
+        f = Fingerprint(self)
+        f.add("x_unit", self.get_x_unit(curve_id))
+        f.add("y_unit", self.get_y_unit(curve_id))
+        f.add("x_axis", self.get_x_axis(curve_id))
+        f.add("y_axis", self.get_y_axis(curve_id))
+        return f
+
 
 class FileLoader(Loader, ABC):
     """Define common functionality and API for Loaders connected to a file as source."""
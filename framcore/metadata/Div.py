@@ -13,6 +13,8 @@ class Div(Meta):
     so that nothing is thrown away in connection with aggregation.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: Meta | set[Meta] | None = None) -> None:
         """Create Div metadata."""
         self._check_type_meta(value, with_none=True)
@@ -13,6 +13,8 @@ class ExprMeta(Meta):
     When used, all components must have a ExprMeta.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: Expr) -> None:
         """Create new ExprMeta with float value."""
         self._value = value
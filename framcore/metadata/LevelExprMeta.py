@@ -12,6 +12,8 @@ class LevelExprMeta(ExprMeta):
     When used, all components must have a ExprMeta.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: Expr | TimeVector) -> None:
         """Create new LevelExprMeta with float value."""
         self._value = ensure_expr(value, is_level=True)
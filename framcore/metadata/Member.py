@@ -14,6 +14,8 @@ class Member(Meta):
     When used, all components must have a membership.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: str | float | int) -> None:  # TODO: only str
         """Create new member with str value."""
         self._value = value  # set before checking, otherwise __repr__ can fail because self._value is not set.
@@ -30,8 +32,8 @@ class Member(Meta):
         return self._value == other._value
 
     def __hash__(self) -> int:
-        """Overwrite __hash__ since its added to sets."""
-        return hash(self.__repr__())
+        """Overwrite __hash__ since its added to sets. Consistent with __eq__, which only compares value."""
+        return hash(self._value)
 
     def get_value(self) -> str | float | int:
         """Return str value."""
@@ -16,6 +16,8 @@ class Meta(Base, ABC):
     - Different types of metadata should be aggregated differently (e.g. ignore, sum, mean, keep all in list, etc.)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_value(self) -> Any:  # noqa: ANN401
         """Return metadata value."""
@@ -0,0 +1,231 @@
+"""Populator of synthetic power systems of configurable size, for scale and performance testing."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import numpy as np
+
+from framcore.attributes import (
+    AvgFlowVolume,
+    Conversion,
+    HydroGenerator,
+    HydroPump,
+    HydroReservoir,
+    MaxFlowVolume,
+    Price,
+    StockVolume,
+)
+from framcore.components import Component, Demand, HydroModule, Node, Solar, Transmission, Wind
+from framcore.curves import Curve
+from framcore.expressions import Expr
+from framcore.metadata import Member
+from framcore.populators.Populator import Populator
+from framcore.populators.SyntheticProfileLoader import SyntheticProfileLoader
+from framcore.timevectors import ConstantTimeVector, LoadedTimeVector, ReferencePeriod, TimeVector
+
+
+class SyntheticPopulator(Populator):
+    """
+    Populate a model with a random but reproducible power system.
+
+    The system has price areas of power nodes (Member metadata under "area") connected by transmissions,
+    demands, hydro cascades with reservoirs and pumps, and wind and solar plants. Inflow, wind and solar
+    profiles come from a SyntheticProfileLoader, so they are loaded lazily like profiles of real datasets.
+
+    Data keys:
+        node_[area]_[i], demand_[area]_[i], line_[from]_[to]: Power system.
+        hydro_[cascade]_[i]: HydroModule releasing to hydro_[cascade]_[i + 1]. The top module always has a reservoir.
+        hydro_[cascade]_[i]_inflow: Average inflow level of the module.
+        wind_[i], solar_[i]: Wind and Solar plants.
+
+    Equal arguments (including seed) give equal systems.
+    """
+
+    METAKEY_AREA = "area"
+
+    def __init__(
+        self,
+        seed: int = 0,
+        num_areas: int = 4,
+        nodes_per_area: int = 3,
+        num_cascades: int = 10,
+        cascade_length: int = 5,
+        reservoir_share: float = 0.3,
+        pump_share: float = 0.1,
+        num_wind: int = 10,
+        num_solar: int = 10,
+        num_profiles: int = 5,
+        first_weather_year: int = 1991,
+        num_weather_years: int = 1,
+        profile_period_duration: timedelta = timedelta(hours=1),
+    ) -> None:
+        """
+        Configure size of the synthetic system.
+
+        Args:
+            seed (int): Seed of all random choices and generated profiles.
+            num_areas (int): Number of price areas.
+            nodes_per_area (int): Number of power nodes per price area. Nodes within an area are connected in a chain.
+            num_cascades (int): Number of hydro cascades.
+            cascade_length (int): Number of HydroModules per cascade.
+            reservoir_share (float): Probability that a module below the top module has a reservoir.
+            pump_share (float): Probability that a cascade with a reservoir below the top module pumps from it up to the top module.
+            num_wind (int): Number of wind plants.
+            num_solar (int): Number of solar plants.
+            num_profiles (int): Number of distinct inflow, wind and solar profiles each, shared between modules and plants.
+            first_weather_year (int): First weather year of generated profiles.
+            num_weather_years (int): Number of weather years of generated profiles.
+            profile_period_duration (timedelta): Resolution of generated profiles.
+
+        """
+        super().__init__()
+        for value, lower_bound in [
+            (seed, None),
+            (num_areas, 1),
+            (nodes_per_area, 1),
+            (num_cascades, 0),
+            (cascade_length, 1),
+            (num_wind, 0),
+            (num_solar, 0),
+            (num_profiles, 1),
+            (first_weather_year, None),
+            (num_weather_years, 1),
+        ]:
+            self._check_type(value, int)
+            self._check_int(value, lower_bound=lower_bound, upper_bound=None)
+        for value in (reservoir_share, pump_share):
+            self._check_type(value, (float, int))
+            self._check_float(float(value), lower_bound=0.0, upper_bound=1.0)
+
+        self._seed = seed
+        self._num_areas = num_areas
+        self._nodes_per_area = nodes_per_area
+        self._num_cascades = num_cascades
+        self._cascade_length = cascade_length
+        self._reservoir_share = float(reservoir_share)
+        self._pump_share = float(pump_share)
+        self._num_wind = num_wind
+        self._num_solar = num_solar
+        self._num_profiles = num_profiles
+        self._reference_period = ReferencePeriod(first_weather_year, num_weather_years)
+        self._loader = SyntheticProfileLoader(seed, first_weather_year, num_weather_years, profile_period_duration)
+
+    def get_loader(self) -> SyntheticProfileLoader:
+        """Return loader of the generated profiles."""
+        return self._loader
+
+    def _populate(self) -> dict[str, Component | TimeVector | Curve | Expr]:
+        rng = np.random.default_rng(self._seed)
+        data: dict[str, Component | TimeVector | Curve | Expr] = dict()
+        node_ids = self._add_power_system(data, rng)
+        self._add_hydro(data, rng, node_ids)
+        self._add_wind_solar(data, rng, node_ids)
+        for key in data:
+            self._register_id(key, self)
+        return data
+
+    def _add_power_system(self, data: dict, rng: np.random.Generator) -> list[str]:
+        node_ids = []
+        for area in range(self._num_areas):
+            for i in range(self._nodes_per_area):
+                node_id = f"node_{area}_{i}"
+                level = ConstantTimeVector(float(rng.uniform(20.0, 80.0)), unit="EUR/MWh", is_max_level=False, reference_period=self._reference_period)
+                node = Node("Power", price=Price(level=level, profile=ConstantTimeVector(1.0, is_zero_one_profile=False)))
+                node.add_meta(self.METAKEY_AREA, Member(f"area_{area}"))
+                data[node_id] = node
+                node_ids.append(node_id)
+
+                demand = Demand(node=node_id, capacity=MaxFlowVolume(level=ConstantTimeVector(float(rng.uniform(100.0, 2000.0)), unit="MW", is_max_level=True)))
+                data[f"demand_{area}_{i}"] = demand
+                self._register_references(f"demand_{area}_{i}", {node_id})
+
+        lines = {(f"node_{area}_{i}", f"node_{area}_{i + 1}") for area in range(self._num_areas) for i in range(self._nodes_per_area - 1)}
+        lines.update((f"node_{area}_0", f"node_{area + 1}_0") for area in range(self._num_areas - 1))
+        for __ in range(self._num_areas // 2):  # meshed grid between areas
+            from_area, to_area = sorted(rng.choice(self._num_areas, size=2, replace=False)) if self._num_areas > 1 else (0, 0)
+            if from_area != to_area:
+                lines.add((f"node_{from_area}_{self._nodes_per_area - 1}", f"node_{to_area}_{self._nodes_per_area - 1}"))
+        for from_node, to_node in sorted(lines):
+            line_id = f"line_{from_node.removeprefix('node_')}_{to_node.removeprefix('node_')}"
+            data[line_id] = Transmission(
+                from_node=from_node,
+                to_node=to_node,
+                max_capacity=MaxFlowVolume(level=ConstantTimeVector(float(rng.uniform(200.0, 3000.0)), unit="MW", is_max_level=True)),
+            )
+            self._register_references(line_id, {from_node, to_node})
+        return node_ids
+
+    def _add_hydro(self, data: dict, rng: np.random.Generator, node_ids: list[str]) -> None:
+        for k in range(min(self._num_profiles, self._num_cascades)):
+            self._loader.add_profile(f"inflow_profile_{k}", SyntheticProfileLoader.KIND_INFLOW)
+
+        for cascade in range(self._num_cascades):
+            power_node = node_ids[int(rng.integers(len(node_ids)))]
+            inflow_profile = LoadedTimeVector(f"inflow_profile_{cascade % self._num_profiles}", self._loader)
+            module_ids = [f"hydro_{cascade}_{i}" for i in range(self._cascade_length)]
+            energy_eqs = rng.uniform(0.1, 1.2, self._cascade_length)
+            has_reservoir = [True] + [bool(rng.random() < self._reservoir_share) for __ in module_ids[1:]]
+
+            # pumped storage from a lower reservoir up to the top reservoir
+            lower_reservoirs = [module_id for module_id, is_reservoir in zip(module_ids[1:], has_reservoir[1:], strict=True) if is_reservoir]
+            pump = None
+            if lower_reservoirs and rng.random() < self._pump_share:
+                from_module = lower_reservoirs[int(rng.integers(len(lower_reservoirs)))]
+                water_capacity = float(rng.uniform(10.0, 100.0))
+                pump_energy_eq = 1.2 * float(energy_eqs[0])
+                pump = HydroPump(
+                    power_node,
+                    from_module=from_module,
+                    to_module=module_ids[0],
+                    water_capacity=MaxFlowVolume(level=ConstantTimeVector(water_capacity, unit="m3/s", is_max_level=True)),
+                    energy_eq=Conversion(level=ConstantTimeVector(pump_energy_eq, unit="kWh/m3", is_max_level=True)),
+                    power_capacity=MaxFlowVolume(level=ConstantTimeVector(3.6 * pump_energy_eq * water_capacity, unit="MW", is_max_level=True)),
+                )
+
+            for i, module_id in enumerate(module_ids):
+                release_to = module_ids[i + 1] if i + 1 < self._cascade_length else None
+                inflow_id = f"{module_id}_inflow"
+                data[inflow_id] = ConstantTimeVector(
+                    float(rng.lognormal(1.5, 1.0)),
+                    unit="m3/s",
+                    is_max_level=False,
+                    reference_period=self._reference_period,
+                )
+
+                reservoir = None
+                if has_reservoir[i]:
+                    capacity = ConstantTimeVector(float(rng.uniform(50.0, 3000.0)), unit="Mm3", is_max_level=True)
+                    reservoir = HydroReservoir(capacity=StockVolume(level=capacity))
+                module_pump = pump if i == 0 else None
+
+                data[module_id] = HydroModule(
+                    release_to=release_to,
+                    release_capacity=MaxFlowVolume(level=ConstantTimeVector(float(rng.uniform(20.0, 400.0)), unit="m3/s", is_max_level=True)),
+                    generator=HydroGenerator(
+                        power_node,
+                        Conversion(level=ConstantTimeVector(float(energy_eqs[i]), unit="kWh/m3", is_max_level=True)),
+                        production=AvgFlowVolume(),
+                    ),
+                    pump=module_pump,
+                    inflow=AvgFlowVolume(level=inflow_id, profile=inflow_profile),
+                    reservoir=reservoir,
+                )
+                references = {power_node, inflow_id}
+                if release_to is not None:
+                    references.add(release_to)
+                if module_pump is not None:
+                    references.add(module_pump.get_from_module())
+                self._register_references(module_id, references)
+
+    def _add_wind_solar(self, data: dict, rng: np.random.Generator, node_ids: list[str]) -> None:
+        for cls, kind, num_plants in [(Wind, SyntheticProfileLoader.KIND_WIND, self._num_wind), (Solar, SyntheticProfileLoader.KIND_SOLAR, self._num_solar)]:
+            for k in range(min(self._num_profiles, num_plants)):
+                self._loader.add_profile(f"{kind}_profile_{k}", kind)
+            for i in range(num_plants):
+                plant_id = f"{kind}_{i}"
+                power_node = node_ids[int(rng.integers(len(node_ids)))]
+                capacity = ConstantTimeVector(float(rng.uniform(10.0, 800.0)), unit="MW", is_max_level=True)
+                profile = LoadedTimeVector(f"{kind}_profile_{i % self._num_profiles}", self._loader)
+                data[plant_id] = cls(power_node=power_node, max_capacity=MaxFlowVolume(level=capacity, profile=profile))
+                self._register_references(plant_id, {power_node})
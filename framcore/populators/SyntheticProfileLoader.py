@@ -0,0 +1,195 @@
+"""TimeVectorLoader of profiles generated from a seed, used by SyntheticPopulator."""
+
+from __future__ import annotations
+
+import zlib
+from datetime import datetime, timedelta
+
+import numpy as np
+from numpy.typing import NDArray
+
+from framcore.loaders import TimeVectorLoader
+from framcore.timeindexes import FixedFrequencyTimeIndex
+from framcore.timevectors import ReferencePeriod
+
+_HOURS_PER_YEAR = 52 * 168
+
+
+class SyntheticProfileLoader(TimeVectorLoader):
+    """
+    Generate wind, solar and inflow profiles over 52-week weather years.
+
+    Profiles are generated when first loaded, from the seed and the vector id, so the same loader
+    setup always gives the same values. Generated values are dropped when pickled and regenerated on
+    demand, so the loader is cheap to send to other processes.
+
+    Wind and solar profiles are zero one profiles. Inflow profiles are mean one profiles over the weather years.
+    """
+
+    KIND_WIND = "wind"
+    KIND_SOLAR = "solar"
+    KIND_INFLOW = "inflow"
+
+    _KINDS = (KIND_WIND, KIND_SOLAR, KIND_INFLOW)
+
+    def __init__(self, seed: int, first_year: int, num_years: int, period_duration: timedelta = timedelta(hours=1)) -> None:
+        """
+        Create loader without profiles. Add profiles with add_profile.
+
+        Args:
+            seed (int): Seed of the random parts of all profiles.
+            first_year (int): First weather year.
+            num_years (int): Number of weather years.
+            period_duration (timedelta): Resolution of profiles. Must divide one week.
+
+        """
+        super().__init__()
+        self._check_type(seed, int)
+        self._check_type(first_year, int)
+        self._check_type(num_years, int)
+        self._check_type(period_duration, timedelta)
+        self._check_int(num_years, lower_bound=1, upper_bound=None)
+        if period_duration <= timedelta(0) or timedelta(weeks=1) % period_duration:
+            message = f"Expected period_duration that divides one week, got {period_duration}."
+            raise ValueError(message)
+        self._seed = seed
+        self._first_year = first_year
+        self._num_years = num_years
+        self._period_duration = period_duration
+        self._kinds: dict[str, str] = dict()
+        self._values: dict[str, NDArray] = dict()
+        self._index: FixedFrequencyTimeIndex | None = None
+
+    def __repr__(self) -> str:
+        """Avoid printing generated values."""
+        return (
+            f"{type(self).__name__}(seed={self._seed}, first_year={self._first_year}, num_years={self._num_years}, "
+            f"period_duration={self._period_duration}, num_profiles={len(self._kinds)})"
+        )
+
+    def add_profile(self, vector_id: str, kind: str) -> None:
+        """Add profile vector_id of kind wind, solar or inflow."""
+        self._check_type(vector_id, str)
+        if kind not in self._KINDS:
+            message = f"Expected kind in {self._KINDS}, got {kind}."
+            raise ValueError(message)
+        if vector_id in self._kinds:
+            message = f"Profile {vector_id} already added to {self}."
+            raise KeyError(message)
+        self._kinds[vector_id] = kind
+        self._content_ids = None
+
+    def clear_cache(self) -> None:
+        """Drop generated values. They are regenerated on demand."""
+        self._values.clear()
+
+    def get_source(self) -> tuple[int, int, int]:
+        """Return seed, first year and number of weather years."""
+        return self._seed, self._first_year, self._num_years
+
+    def set_source(self, new_source: tuple[int, int, int]) -> None:
+        """Set seed, first year and number of weather years. Generated values are dropped."""
+        self._check_type(new_source, tuple)
+        seed, first_year, num_years = new_source
+        self._check_type(seed, int)
+        self._check_type(first_year, int)
+        self._check_type(num_years, int)
+        self._check_int(num_years, lower_bound=1, upper_bound=None)
+        self._seed, self._first_year, self._num_years = seed, first_year, num_years
+        self._index = None
+        self.clear_cache()
+
+    def get_metadata(self, content_id: str) -> str:
+        """Return kind of profile."""
+        self._id_exsists(content_id)
+        return self._kinds[content_id]
+
+    def _get_ids(self) -> list[str]:
+        return list(self._kinds)
+
+    def get_values(self, vector_id: str) -> NDArray:
+        """Return generated profile values."""
+        values = self._values.get(vector_id)
+        if values is None:
+            self._id_exsists(vector_id)
+            values = self._generate(vector_id)
+            self._values[vector_id] = values
+        return values
+
+    def get_index(self, vector_id: str) -> FixedFrequencyTimeIndex:
+        """Return index covering the weather years. Same for all profiles."""
+        self._id_exsists(vector_id)
+        if self._index is None:
+            self._index = FixedFrequencyTimeIndex(
+                start_time=datetime.fromisocalendar(self._first_year, 1, 1),
+                period_duration=self._period_duration,
+                num_periods=self._get_num_periods(),
+                is_52_week_years=True,
+                extrapolate_first_point=False,
+                extrapolate_last_point=False,
+            )
+        return self._index
+
+    def get_unit(self, vector_id: str) -> None:
+        """Profiles are unitless."""
+        self._id_exsists(vector_id)
+
+    def is_max_level(self, vector_id: str) -> None:
+        """Profiles are not levels."""
+        self._id_exsists(vector_id)
+
+    def is_zero_one_profile(self, vector_id: str) -> bool:
+        """Return True for wind and solar profiles, and False for inflow profiles."""
+        self._id_exsists(vector_id)
+        return self._kinds[vector_id] != self.KIND_INFLOW
+
+    def get_reference_period(self, vector_id: str) -> ReferencePeriod | None:
+        """Return the weather years for mean one (inflow) profiles, else None."""
+        if self.is_zero_one_profile(vector_id):
+            return None
+        return ReferencePeriod(self._first_year, self._num_years)
+
+    def _get_num_periods(self) -> int:
+        return self._num_years * (timedelta(weeks=52) // self._period_duration)
+
+    def _generate(self, vector_id: str) -> NDArray:
+        rng = np.random.default_rng([self._seed, zlib.crc32(vector_id.encode())])
+        hours_per_period = self._period_duration / timedelta(hours=1)
+        hours = np.arange(self._get_num_periods()) * hours_per_period
+        year_phase = 2 * np.pi * (hours % _HOURS_PER_YEAR) / _HOURS_PER_YEAR
+
+        kind = self._kinds[vector_id]
+        if kind == self.KIND_WIND:
+            values = self._generate_wind(rng, hours_per_period, year_phase)
+        elif kind == self.KIND_SOLAR:
+            values = self._generate_solar(rng, hours, year_phase)
+        else:
+            values = self._generate_inflow(rng, hours, year_phase)
+        values.setflags(write=False)
+        return values
+
+    @staticmethod
+    def _generate_wind(rng: np.random.Generator, hours_per_period: float, year_phase: NDArray) -> NDArray:
+        """Windier winters, and weather systems lasting about a day (exponentially smoothed noise)."""
+        noise = rng.standard_normal(year_phase.size)
+        kernel = np.exp(-np.arange(0.0, 96.0, hours_per_period) / 24.0)
+        weather = np.convolve(noise, kernel / np.sqrt(np.sum(kernel**2)), mode="same")
+        return np.clip(0.35 + 0.15 * np.cos(year_phase) + 0.2 * weather, 0.0, 1.0)
+
+    @staticmethod
+    def _generate_solar(rng: np.random.Generator, hours: NDArray, year_phase: NDArray) -> NDArray:
+        """Daylight from 6 to 18, brighter summers, and one cloud cover factor per day."""
+        daylight = np.maximum(0.0, np.sin(2 * np.pi * ((hours % 24) - 6) / 24))
+        season = 0.55 - 0.4 * np.cos(year_phase)
+        clouds = 1.0 - 0.6 * rng.random(int(hours[-1] // 24) + 1)
+        return np.clip(daylight * season * clouds[(hours // 24).astype(np.int64)], 0.0, 1.0)
+
+    @staticmethod
+    def _generate_inflow(rng: np.random.Generator, hours: NDArray, year_phase: NDArray) -> NDArray:
+        """Low winter flow, snow melt peak in late spring and wetness varying by year. Mean one."""
+        week = year_phase / (2 * np.pi) * 52
+        year = (hours // _HOURS_PER_YEAR).astype(np.int64)
+        wetness = rng.lognormal(0.0, 0.25, int(year[-1]) + 1)
+        melt_week = 20 + rng.normal(0.0, 2.0, int(year[-1]) + 1)
+        values = (0.3 + 2.5 * np.exp(-(((week - melt_week[year]) / 4) ** 2)) + 0.4 * np.exp(-(((week - 40) / 6) ** 2))) * wetness[year]
+        return values / values.mean()
@@ -1,7 +1,11 @@
 # framcore/populators/__init__.py
 
 from framcore.populators.Populator import Populator
+from framcore.populators.SyntheticProfileLoader import SyntheticProfileLoader
+from framcore.populators.SyntheticPopulator import SyntheticPopulator
 
 __all__ = [
     "Populator",
+    "SyntheticPopulator",
+    "SyntheticProfileLoader",
 ]
@@ -21,7 +21,7 @@ class CacheDB(QueryDB):
     def set_min_elapsed_seconds(self, value: float) -> None:
         """Values that takes below this threshold to compute, does not get cached."""
         self._check_type(value, float)
-        self._check_float(lower_bound=0.0)
+        self._check_float(value, lower_bound=0.0, upper_bound=None)
         self._min_elapsed_seconds = value
 
     def get_min_elapsed_seconds(self) -> float:
@@ -43,8 +43,21 @@ class CacheDB(QueryDB):
 
     def _put(self, key: object, value: object, elapsed_seconds: float) -> None:
         if elapsed_seconds < self._min_elapsed_seconds:
+            if self._metrics is not None:
+                self._metrics.record_put(key, is_stored=False)
             return
+        if self._metrics is not None:
+            self._record_put(key, value)
         self._cache[key] = value
 
+    def _record_put(self, key: object, value: object) -> None:
+        """Record a stored put; replacing a value counts as an eviction."""
+        self._metrics.record_put(key, is_stored=True)
+        num_bytes = self._metrics.get_num_bytes(value)
+        if key in self._cache:
+            self._metrics.record_cached(0, num_bytes - self._metrics.get_num_bytes(self._cache[key]), num_evictions=1)
+        else:
+            self._metrics.record_cached(1, num_bytes)
+
     def _get_data(self) -> dict:
         return self._models[0].get_data()
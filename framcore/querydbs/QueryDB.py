@@ -1,6 +1,9 @@
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
 from framcore import Base
+from framcore.querydbs.QueryMetrics import QueryMetrics
 
 
 class QueryDB(Base, ABC):
@@ -10,8 +13,28 @@ class QueryDB(Base, ABC):
     Provides an interface for getting, putting, and checking keys in a database.
     Subclasses must implement the _get, _put, and _has_key methods.
 
+    Use get_or_compute to get a value from db, or compute and put it if missing.
+
+    Metrics of hits, misses, puts and evaluation times can be collected per db with enable_metrics.
+
     """
 
+    _metrics: QueryMetrics | None = None
+
+    def enable_metrics(self) -> QueryMetrics:
+        """Collect metrics of queries against this db from now on. Return the (possibly existing) metrics object."""
+        if self._metrics is None:
+            self._metrics = QueryMetrics()
+        return self._metrics
+
+    def disable_metrics(self) -> None:
+        """Stop collecting metrics."""
+        self._metrics = None
+
+    def get_metrics(self) -> QueryMetrics | None:
+        """Return metrics if enabled, else None."""
+        return self._metrics
+
     def get(self, key: object) -> object:
         """Get value behind key from db."""
         return self._get(key)
@@ -20,9 +43,29 @@ class QueryDB(Base, ABC):
         """Put value in db behind key (maybe, depending on implementation)."""
         self._put(key, value, elapsed_seconds)
 
+    def get_or_compute(self, key: object, compute: Callable[[], object]) -> object:
+        """
+        Return value behind key. If missing, call compute, put its value in db (maybe) and return it.
+
+        The value may be shared with db and other callers, so copy mutable values before modifying them.
+        """
+        if self.has_key(key):
+            return self._get(key)
+        t0 = time.perf_counter()
+        value = compute()
+        self._put(key, value, time.perf_counter() - t0)
+        return value
+
     def has_key(self, key: str) -> bool:
         """Return True if db has value behind key."""
-        return self._has_key(key)
+        if self._metrics is None:
+            return self._has_key(key)
+        has_key = self._has_key(key)
+        if has_key:
+            self._metrics.record_hit(key)
+        else:
+            self._metrics.record_miss(key)
+        return has_key
 
     def get_data(self) -> dict:
         """Return output of get_data called on first underlying model."""
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+
+from framcore import Base
+
+
+class QueryMetrics(Base):
+    """
+    Counters and timers for queries against one QueryDB.
+
+    Collected per db instance (see QueryDB.enable_metrics), so each worker or run gets its own metrics.
+
+    Query type is the name in tuple cache keys (e.g. "_get_constant_from_expr"), or "data" for other keys.
+    Evaluation cases are the fastpaths and the sympy fallback of level value queries.
+    """
+
+    def __init__(self) -> None:
+        """Create empty metrics."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Set all counters and timers to zero."""
+        self._queries: dict[str, dict[str, int]] = dict()
+        self._evaluations: dict[str, list[float]] = dict()
+        self._fallback_exprs: dict[str, list[float]] = dict()
+        self._num_entries = 0
+        self._num_bytes = 0
+        self._num_evictions = 0
+
+    def record_hit(self, key: object) -> None:
+        """Value behind key was found in db."""
+        self._get_query_counts(key)["hits"] += 1
+
+    def record_miss(self, key: object) -> None:
+        """Value behind key was not found in db."""
+        self._get_query_counts(key)["misses"] += 1
+
+    def record_put(self, key: object, is_stored: bool) -> None:
+        """Value was offered to db behind key, and stored if is_stored."""
+        self._get_query_counts(key)["puts" if is_stored else "skipped_puts"] += 1
+
+    def record_cached(self, num_entries: int, num_bytes: int, num_evictions: int = 0) -> None:
+        """Add change in number of cached entries and bytes, and number of evicted entries."""
+        self._num_entries += num_entries
+        self._num_bytes += num_bytes
+        self._num_evictions += num_evictions
+
+    def record_evaluation(self, case: str, seconds: float) -> None:
+        """Add call of evaluation case (fastpath name or fallback) that took seconds."""
+        self._add_timing(self._evaluations, case, seconds)
+
+    def record_fallback_expr(self, expr_str: str, seconds: float) -> None:
+        """Add call of sympy fallback for (symbolic) expr_str that took seconds."""
+        self._add_timing(self._fallback_exprs, expr_str, seconds)
+
+    def get_report(self) -> dict[str, dict]:
+        """
+        Return copy of all metrics.
+
+        queries: query type -> hits, misses, puts and skipped_puts (below min elapsed seconds).
+        cache: entries, bytes and evictions.
+        evaluations: case -> count and seconds.
+        fallback_exprs: symbolic expr -> count and seconds, slowest first. Candidates for new fastpaths.
+        """
+        return {
+            "queries": {name: dict(counts) for name, counts in self._queries.items()},
+            "cache": {"entries": self._num_entries, "bytes": self._num_bytes, "evictions": self._num_evictions},
+            "evaluations": {case: {"count": int(c), "seconds": s} for case, (c, s) in self._evaluations.items()},
+            "fallback_exprs": {expr: {"count": int(c), "seconds": s} for expr, (c, s) in sorted(self._fallback_exprs.items(), key=lambda item: -item[1][1])},
+        }
+
+    def _get_query_counts(self, key: object) -> dict[str, int]:
+        name = key[0] if isinstance(key, tuple) and key and isinstance(key[0], str) else "data"
+        counts = self._queries.get(name)
+        if counts is None:
+            counts = {"hits": 0, "misses": 0, "puts": 0, "skipped_puts": 0}
+            self._queries[name] = counts
+        return counts
+
+    @staticmethod
+    def get_num_bytes(value: object) -> int:
+        """Return approximate memory size of cached value. Exact for numpy arrays."""
+        if isinstance(value, np.ndarray):
+            return int(value.nbytes)
+        return sys.getsizeof(value)
+
+    @staticmethod
+    def _add_timing(timings: dict[str, list[float]], name: str, seconds: float) -> None:
+        timing = timings.get(name)
+        if timing is None:
+            timings[name] = [1, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += seconds
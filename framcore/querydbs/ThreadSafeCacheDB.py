@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from framcore import Model
+from framcore.querydbs import CacheDB
+
+
+class _InFlight:
+    """Value of a key being computed by one thread, for other threads to wait for."""
+
+    __slots__ = ("done", "is_ok", "value")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.is_ok = False
+        self.value = None
+
+
+class ThreadSafeCacheDB(CacheDB):
+    """
+    CacheDB which can be shared by threads, e.g. queries run in a ThreadPoolExecutor.
+
+    Reads and writes of the cache (and metrics) are done under a lock. get_or_compute is single-flight per key:
+    if threads ask for the same missing key at once, one thread computes the value and the others wait for it,
+    so each value is computed once. The lock is not held while computing, so different keys are computed in parallel.
+
+    If the computation fails, the exception is raised in the computing thread, and waiting threads try again.
+    """
+
+    def __init__(self, model: Model, *models: tuple[Model]) -> None:
+        """
+        Initialize ThreadSafeCacheDB with one or more Model instances.
+
+        Args:
+            model (Model): The primary Model instance.
+            *models (tuple[Model]): Additional Model instances.
+
+        """
+        super().__init__(model, *models)
+        self._lock = threading.RLock()
+        self._in_flight: dict[object, _InFlight] = dict()
+
+    def __getstate__(self) -> dict:
+        """Drop lock and in-flight computations when pickled or deepcopied."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_in_flight"] = dict()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore state with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def get_or_compute(self, key: object, compute: Callable[[], object]) -> object:
+        """Return value behind key. If missing, compute it once even if several threads ask at the same time."""
+        while True:
+            with self._lock:
+                if self.has_key(key):
+                    return self._get(key)
+                in_flight = self._in_flight.get(key)
+                is_producer = in_flight is None
+                if is_producer:
+                    in_flight = _InFlight()
+                    self._in_flight[key] = in_flight
+
+            if is_producer:
+                return self._compute(key, compute, in_flight)
+
+            in_flight.done.wait()
+            if in_flight.is_ok:
+                return in_flight.value
+            # producer failed, try again (maybe as producer)
+
+    def _compute(self, key: object, compute: Callable[[], object], in_flight: _InFlight) -> object:
+        try:
+            t0 = time.perf_counter()
+            value = compute()
+            elapsed_seconds = time.perf_counter() - t0
+            with self._lock:
+                self._put(key, value, elapsed_seconds)
+            in_flight.value = value
+            in_flight.is_ok = True
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.done.set()
+
+    def has_key(self, key: str) -> bool:
+        """Return True if db has value behind key."""
+        with self._lock:
+            return super().has_key(key)
+
+    def _get(self, key: object) -> object:
+        with self._lock:
+            return super()._get(key)
+
+    def _put(self, key: object, value: object, elapsed_seconds: float) -> None:
+        with self._lock:
+            super()._put(key, value, elapsed_seconds)
@@ -1,11 +1,15 @@
 # framcore/querydbs/__init__.py
 
+from framcore.querydbs.QueryMetrics import QueryMetrics
 from framcore.querydbs.QueryDB import QueryDB
 from framcore.querydbs.ModelDB import ModelDB
 from framcore.querydbs.CacheDB import CacheDB
+from framcore.querydbs.ThreadSafeCacheDB import ThreadSafeCacheDB
 
 __all__ = [
     "CacheDB",
     "ModelDB",
     "QueryDB",
+    "QueryMetrics",
+    "ThreadSafeCacheDB",
 ]
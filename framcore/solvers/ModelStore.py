@@ -0,0 +1,357 @@
+"""Chunked, compressed storage of a Model in a folder."""
+
+from __future__ import annotations
+
+import copy
+import copyreg
+import hashlib
+import io
+import json
+import pickle
+import threading
+import types
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from framcore import Base, Model
+from framcore.components import Component
+from framcore.curves import Curve
+from framcore.expressions import Expr
+from framcore.loaders import Loader
+from framcore.timevectors import TimeVector
+
+
+class _LoaderTable:
+    """
+    Loaders found while pickling chunks, by id.
+
+    The id of a loader is the digest of its canonical pickle, so it is the same in every process,
+    and chunks refer to loaders by id instead of holding a copy each.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ids: dict[int, tuple[Loader, str]] = dict()
+        self._loaders: dict[str, Loader] = dict()
+
+    def get_id(self, loader: Loader) -> str:
+        with self._lock:
+            found = self._ids.get(id(loader))
+        if found is not None:
+            return found[1]
+        loader_id = hashlib.sha256(_dumps(loader)).hexdigest()
+        with self._lock:
+            self._ids[id(loader)] = (loader, loader_id)
+            self._loaders.setdefault(loader_id, loader)
+        return loader_id
+
+    def get_loaders(self) -> dict[str, Loader]:
+        return self._loaders
+
+
+_CONTAINER_TYPES = frozenset((set, frozenset, dict, list, tuple))
+_GLOBAL_TYPES = (type, types.FunctionType, types.BuiltinFunctionType)
+
+
+def _get_stored_loader(loader_id: str) -> Loader:
+    """Stands for the loader with loader_id in pickled chunks. Replaced by ModelStore when chunks are loaded."""
+    message = f"Loader {loader_id} is stored separately. Load chunks with ModelStore."
+    raise RuntimeError(message)
+
+
+class _SortedSet:
+    """Stand-in for a set while pickling. Written as the set, with items sorted by their pickled bytes."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: set | frozenset) -> None:
+        self.value = value
+
+
+class _CanonicalPickler(pickle.Pickler):
+    """
+    Pickler giving equal bytes for equal objects, also after deepcopy or in another process.
+
+    Set order depends on object ids and the hash seed. The pickler does not let us change how builtin sets
+    are written, so sets in the reduced state of objects (e.g. Flow._arrows) are replaced by _SortedSet.
+    If loader_table is given, loaders are written as references to the table.
+    """
+
+    def __init__(self, file: io.BytesIO, loader_table: _LoaderTable | None, sorting: set[int]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._loader_table = loader_table
+        self._sorting = sorting  # ids of sets whose items are being pickled for sorting, to stop at cycles
+        self._replaced: dict[int, tuple[object, object]] = dict()  # id -> (container, container with sets replaced)
+
+    def dump(self, obj: object) -> None:
+        super().dump(self._replace_sets(obj))
+
+    def reducer_override(self, obj: object) -> object:
+        obj_type = type(obj)
+        if obj_type is _SortedSet:
+            return self._reduce_set(obj.value)
+        if isinstance(obj, _GLOBAL_TYPES) or obj_type in copyreg.dispatch_table:
+            return NotImplemented  # saved by name or by registered reducer
+        if self._loader_table is not None and isinstance(obj, Loader):
+            return _get_stored_loader, (self._loader_table.get_id(obj),)
+        rv = obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        if not isinstance(rv, tuple):
+            return NotImplemented  # saved as global
+        func, args, *rest = rv
+        state = rest[0] if rest else None
+        new_args = self._replace_sets(args)
+        new_state = self._replace_sets(state)
+        if new_args is args and new_state is state:
+            return NotImplemented
+        return (func, new_args, new_state, *rest[1:])
+
+    def _reduce_set(self, value: set | frozenset) -> tuple:
+        if id(value) in self._sorting:
+            return type(value), (list(value),)
+        self._sorting.add(id(value))
+        try:
+            items = sorted(value, key=lambda item: _dumps(item, self._loader_table, self._sorting))
+        finally:
+            self._sorting.discard(id(value))
+        return type(value), (items,)
+
+    def _replace_sets(self, value: object) -> object:
+        """Return value with sets in it (and in its builtin containers) replaced by _SortedSet. Containers without sets are kept."""
+        value_type = type(value)
+        if value_type not in _CONTAINER_TYPES:
+            return value
+        found = self._replaced.get(id(value))
+        if found is not None:
+            return found[1]
+        if value_type is set or value_type is frozenset:
+            new = _SortedSet(value)
+        elif value_type is dict:
+            if _CONTAINER_TYPES.isdisjoint(map(type, value)) and _CONTAINER_TYPES.isdisjoint(map(type, value.values())):
+                return value
+            new = {self._replace_sets(k): self._replace_sets(v) for k, v in value.items()}
+        else:
+            if _CONTAINER_TYPES.isdisjoint(map(type, value)):
+                return value
+            new = value_type([self._replace_sets(v) for v in value])
+        self._replaced[id(value)] = (value, new)
+        return new
+
+
+def _dumps(value: object, loader_table: _LoaderTable | None = None, sorting: set[int] | None = None) -> bytes:
+    f = io.BytesIO()
+    _CanonicalPickler(f, loader_table, set() if sorting is None else sorting).dump(value)
+    return f.getvalue()
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler resolving loader references with get_loader."""
+
+    def __init__(self, file: io.BytesIO, get_loader: Callable[[str], Loader]) -> None:
+        super().__init__(file)
+        self._get_loader = get_loader
+
+    def find_class(self, module: str, name: str) -> object:
+        if module == __name__ and name == _get_stored_loader.__name__:
+            return self._get_loader
+        return super().find_class(module, name)
+
+
+class ModelStore(Base):
+    """
+    Store a Model as one compressed chunk per data key plus a manifest.
+
+    Each chunk is fingerprinted by the digest of its canonical pickle (sets are sorted, see get_value_fingerprint),
+    so equal objects get equal fingerprints also after deepcopy or in another process. On write, chunks whose
+    fingerprint is unchanged since the previous write are not compressed or rewritten, and chunks of deleted keys
+    are removed. Single objects can be loaded without loading the whole model.
+
+    Loaders are stored once each in their own chunk, named by the digest of the loader, and the other chunks refer
+    to them. So objects sharing a loader in the model also share it when loaded.
+    """
+
+    _FILENAME_MANIFEST = "manifest.json"
+    _FILENAME_SHELL = "model.zlib"
+    _LOADER_PREFIX = "loader_"
+    _CHUNK_SUFFIX = ".zlib"
+    _FORMAT_VERSION = 2
+
+    def __init__(self, folder: Path | str, compress_level: int = 1) -> None:
+        """
+        Create store in folder.
+
+        Args:
+            folder (Path | str): Folder holding the manifest and chunks. Created on write.
+            compress_level (int): zlib compression level from 0 (none) to 9 (smallest). Default 1 (fastest).
+
+        """
+        self._check_type(folder, (Path, str))
+        self._check_type(compress_level, int)
+        self._check_int(compress_level, lower_bound=0, upper_bound=9)
+        self._folder = Path(folder)
+        self._compress_level = compress_level
+
+    @staticmethod
+    def get_value_fingerprint(value: object) -> str:
+        """Return digest of the canonical pickle of value. Equal for equal values, also across processes."""
+        return hashlib.sha256(_dumps(value, _LoaderTable())).hexdigest()
+
+    def get_folder(self) -> Path:
+        """Return folder of the store."""
+        return self._folder
+
+    def write(self, model: Model, max_workers: int = 1) -> list[str]:
+        """
+        Write model to the store. Only rewrite chunks that changed since the previous write.
+
+        Chunks are pickled, compressed and written using max_workers threads.
+        Return keys of the chunks that were (re)written.
+        """
+        self._check_type(model, Model)
+        self._check_type(max_workers, int)
+        self._check_int(max_workers, lower_bound=1, upper_bound=None)
+
+        self._folder.mkdir(parents=True, exist_ok=True)
+
+        old_manifest = self._read_old_manifest()
+        old_chunks: dict[str, dict] = old_manifest.get("chunks", dict())
+        old_loaders: dict[str, str] = old_manifest.get("loaders", dict())
+
+        loader_table = _LoaderTable()
+        data = model.get_data()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            entries = list(executor.map(lambda key: self._write_chunk(key, data[key], old_chunks.get(key), loader_table), data))
+
+        chunks = dict(zip(data, (entry for entry, __ in entries), strict=True))
+        written = [key for key, (__, is_written) in zip(data, entries, strict=True) if is_written]
+
+        shell = copy.copy(model)  # aggregators and other model state, without data
+        shell._data = dict()  # noqa: SLF001
+        self._write_atomic(self._FILENAME_SHELL, self._compress(_dumps(shell, loader_table)))
+
+        loaders = {loader_id: self._LOADER_PREFIX + loader_id + self._CHUNK_SUFFIX for loader_id in loader_table.get_loaders()}
+        for loader_id, loader in loader_table.get_loaders().items():
+            if not (self._folder / loaders[loader_id]).is_file():  # named by content, so an existing file is up to date
+                self._write_atomic(loaders[loader_id], self._compress(_dumps(loader)))
+
+        manifest = {"format_version": self._FORMAT_VERSION, "chunks": chunks, "loaders": loaders}
+        self._write_atomic(self._FILENAME_MANIFEST, json.dumps(manifest, indent=1).encode())
+
+        for key, entry in old_chunks.items():
+            if key not in chunks:
+                (self._folder / entry["file"]).unlink(missing_ok=True)
+        for loader_id, filename in old_loaders.items():
+            if loader_id not in loaders:
+                (self._folder / filename).unlink(missing_ok=True)
+
+        return written
+
+    def get_keys(self) -> list[str]:
+        """Return data keys in the store."""
+        return list(self._read_manifest()["chunks"])
+
+    def get_fingerprints(self) -> dict[str, str]:
+        """Return the fingerprint of each data key in the store."""
+        return {key: entry["fingerprint"] for key, entry in self._read_manifest()["chunks"].items()}
+
+    def get_model_fingerprints(self, model: Model, max_workers: int = 1) -> dict[str, str]:
+        """Return the fingerprint each data key of model would get in the store, without writing."""
+        self._check_type(model, Model)
+        self._check_type(max_workers, int)
+        self._check_int(max_workers, lower_bound=1, upper_bound=None)
+        loader_table = _LoaderTable()
+        data = model.get_data()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fingerprints = list(executor.map(lambda key: self._get_fingerprint(_dumps(data[key], loader_table)), data))
+        return dict(zip(data, fingerprints, strict=True))
+
+    def load(self, key: str) -> Component | TimeVector | Curve | Expr:
+        """Load the object stored behind key without loading the rest of the model. KeyError if missing."""
+        self._check_type(key, str)
+        manifest = self._read_manifest()
+        chunks = manifest["chunks"]
+        if key not in chunks:
+            message = f"Key '{key}' not found in {self._folder}."
+            raise KeyError(message)
+        return self._load_file(chunks[key]["file"], self._get_loader_getter(manifest["loaders"]))
+
+    def load_model(self, max_workers: int = 1) -> Model:
+        """Load the whole model. Chunks are read and decompressed using max_workers threads."""
+        self._check_type(max_workers, int)
+        self._check_int(max_workers, lower_bound=1, upper_bound=None)
+        manifest = self._read_manifest()
+        chunks = manifest["chunks"]
+        get_loader = self._get_loader_getter(manifest["loaders"])
+        model: Model = self._load_file(self._FILENAME_SHELL, get_loader)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            values = list(executor.map(lambda entry: self._load_file(entry["file"], get_loader), chunks.values()))
+        model._data = dict(zip(chunks, values, strict=True))  # noqa: SLF001
+        model._bump_version()  # noqa: SLF001
+        return model
+
+    def _write_chunk(self, key: str, value: object, old_entry: dict | None, loader_table: _LoaderTable) -> tuple[dict, bool]:
+        """Write chunk unless its fingerprint equals old_entry. Return manifest entry and whether it was written."""
+        payload = _dumps(value, loader_table)
+        entry = {"file": self._get_chunk_filename(key), "fingerprint": self._get_fingerprint(payload)}
+        if old_entry == entry and (self._folder / entry["file"]).is_file():
+            return entry, False
+        self._write_atomic(entry["file"], self._compress(payload))
+        return entry, True
+
+    def _get_fingerprint(self, payload: bytes) -> str:
+        return hashlib.sha256(payload).hexdigest()
+
+    def _get_chunk_filename(self, key: str) -> str:
+        """Keys may contain any character, so chunk files are named by the digest of the key."""
+        return hashlib.sha1(key.encode()).hexdigest() + self._CHUNK_SUFFIX
+
+    def _compress(self, payload: bytes) -> bytes:
+        return zlib.compress(payload, self._compress_level)
+
+    def _write_atomic(self, filename: str, content: bytes) -> None:
+        path = self._folder / filename
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            f.write(content)
+        tmp_path.replace(path)
+
+    def _get_loader_getter(self, loader_files: dict[str, str]) -> Callable[[str], Loader]:
+        """Return function loading each loader once, so all chunks loaded with it share loaders."""
+        lock = threading.Lock()
+        loaders: dict[str, Loader] = dict()
+
+        def get_loader(loader_id: str) -> Loader:
+            with lock:
+                if loader_id not in loaders:
+                    loaders[loader_id] = self._load_file(loader_files[loader_id], get_loader)
+                return loaders[loader_id]
+
+        return get_loader
+
+    def _load_file(self, filename: str, get_loader: Callable[[str], Loader]) -> object:
+        with (self._folder / filename).open("rb") as f:
+            return _Unpickler(io.BytesIO(zlib.decompress(f.read())), get_loader).load()
+
+    def _read_old_manifest(self) -> dict:
+        """Return manifest of the previous write. Empty if none or written in another format, so all chunks are rewritten."""
+        if not self._has_manifest():
+            return dict()
+        try:
+            return self._read_manifest()
+        except ValueError:
+            return dict()
+
+    def _has_manifest(self) -> bool:
+        return (self._folder / self._FILENAME_MANIFEST).is_file()
+
+    def _read_manifest(self) -> dict:
+        if not self._has_manifest():
+            message = f"No model stored in {self._folder}."
+            raise FileNotFoundError(message)
+        with (self._folder / self._FILENAME_MANIFEST).open("rb") as f:
+            manifest = json.load(f)
+        if manifest.get("format_version") != self._FORMAT_VERSION:
+            message = f"Unsupported format version {manifest.get('format_version')} in {self._folder}."
+            raise ValueError(message)
+        return manifest
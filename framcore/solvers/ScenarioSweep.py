@@ -0,0 +1,160 @@
+"""Solve many scenarios of one model in parallel."""
+
+from __future__ import annotations
+
+import json
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from framcore import Base, Model
+from framcore.solvers import Solver, SolverConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class ScenarioSweep(Base):
+    """
+    Solve scenarios of a base model into one subfolder of folder per scenario.
+
+    A scenario is a name and a transform(model, config) that modifies a copy of the base model
+    and a copy of the solver's config in place before solving. Scenarios run in a pool of worker
+    processes. Each worker receives the base model and solver once, and reuses its loaders and
+    their caches for all scenarios it solves. Transforms must be picklable (e.g. module level functions).
+
+    To let all workers share one copy of loaded time series, call TimeVectorLoader.share_values
+    on the loaders of the base model before run.
+    """
+
+    _FILENAME_INDEX = "index.json"
+
+    def __init__(self, solver: Solver, model: Model, folder: Path | str) -> None:
+        """Create sweep of solver over scenarios of model. Scenario results go to folder/scenario_name."""
+        self._check_type(solver, Solver)
+        self._check_type(model, Model)
+        self._check_type(folder, (Path, str))
+        self._solver = solver
+        self._model = model
+        self._folder = Path(folder)
+        self._scenarios: dict[str, Callable[[Model, SolverConfig], None]] = dict()
+
+    def add_scenario(self, name: str, transform: Callable[[Model, SolverConfig], None]) -> None:
+        """Add scenario which is solved after transform(model, config) is applied to copies of the base model and config."""
+        self._check_type(name, str)
+        if name in ("", ".", "..") or "/" in name or "\\" in name:
+            message = f"Scenario name '{name}' can not be used as folder name."
+            raise ValueError(message)
+        if name in self._scenarios:
+            message = f"Scenario '{name}' already added."
+            raise KeyError(message)
+        if not callable(transform):
+            message = f"Expected callable transform for scenario '{name}', got {transform}."
+            raise TypeError(message)
+        self._scenarios[name] = transform
+
+    def add_weather_years_scenarios(self, first_year: int, num_years: int, window: int, prefix: str = "weather") -> None:
+        """Add one scenario per window of window weather years from first_year. Named prefix_[year]."""
+        self._check_type(first_year, int)
+        self._check_type(num_years, int)
+        self._check_type(window, int)
+        self._check_int(window, lower_bound=1, upper_bound=num_years)
+        for year in range(first_year, first_year + num_years - window + 1):
+            self.add_scenario(f"{prefix}_{year}", WeatherYearsTransform(year, window))
+
+    def get_scenario_names(self) -> list[str]:
+        """Return names of added scenarios."""
+        return list(self._scenarios)
+
+    def get_folder(self, name: str | None = None) -> Path:
+        """Return folder of the sweep, or of scenario name."""
+        return self._folder if name is None else self._folder / name
+
+    def run(self, max_workers: int = 1) -> dict[str, dict]:
+        """
+        Solve all scenarios using max_workers processes. Solve in this process if max_workers is 1.
+
+        Failing scenarios do not stop the sweep. Return results index, which is also written to folder/index.json:
+        scenario name -> {"folder", "status" ("ok" or "error"), "elapsed_seconds", "error"}.
+        """
+        self._check_type(max_workers, int)
+        self._check_int(max_workers, lower_bound=1, upper_bound=None)
+
+        self._folder.mkdir(parents=True, exist_ok=True)
+
+        tasks = [(name, transform, self.get_folder(name)) for name, transform in self._scenarios.items()]
+
+        if max_workers == 1:
+            records = [_solve_scenario(self._solver, self._model, *task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, max(1, len(tasks))),
+                initializer=_init_worker,
+                initargs=(self._solver, self._model),
+            ) as executor:
+                records = list(executor.map(_solve_scenario_in_worker, tasks))
+
+        index = {record.pop("name"): record for record in records}
+        with Path.open(self._folder / self._FILENAME_INDEX, "w") as f:
+            json.dump(index, f, indent=1)
+
+        num_failed = sum(record["status"] != "ok" for record in index.values())
+        if num_failed:
+            self.send_warning_event(f"{num_failed} of {len(index)} scenarios failed. See {self._folder / self._FILENAME_INDEX}.")
+
+        return index
+
+
+class WeatherYearsTransform:
+    """Scenario transform that sets weather years of the solver config."""
+
+    def __init__(self, first_year: int, num_years: int) -> None:
+        """Set weather years first_year to first_year + num_years - 1."""
+        self._first_year = first_year
+        self._num_years = num_years
+
+    def __call__(self, model: Model, config: SolverConfig) -> None:
+        """Set weather years of config."""
+        config.set_weather_years(self._first_year, self._num_years)
+
+
+_WORKER_SOLVER: Solver | None = None
+_WORKER_MODEL: Model | None = None
+
+
+def _init_worker(solver: Solver, model: Model) -> None:
+    """Receive base solver and model once per worker process."""
+    global _WORKER_SOLVER, _WORKER_MODEL  # noqa: PLW0603
+    _WORKER_SOLVER = solver
+    _WORKER_MODEL = model
+
+
+def _solve_scenario_in_worker(task: tuple[str, Callable[[Model, SolverConfig], None], Path]) -> dict:
+    return _solve_scenario(_WORKER_SOLVER, _WORKER_MODEL, *task)
+
+
+def _solve_scenario(
+    solver: Solver,
+    model: Model,
+    name: str,
+    transform: Callable[[Model, SolverConfig], None],
+    folder: Path,
+) -> dict:
+    """Solve copy of model with copy of solver into folder. Loaders are not copied, so their caches are shared."""
+    t0 = time.perf_counter()
+    record = {"name": name, "folder": str(folder), "status": "ok", "elapsed_seconds": 0.0, "error": None}
+    try:
+        scenario_solver = deepcopy(solver)
+        scenario_model = deepcopy(model)
+        config = scenario_solver.get_config()
+        transform(scenario_model, config)
+        config.set_solve_folder(folder)
+        scenario_solver.solve(scenario_model)
+    except Exception:
+        record["status"] = "error"
+        record["error"] = traceback.format_exc()
+    record["elapsed_seconds"] = time.perf_counter() - t0
+    return record
@@ -0,0 +1,74 @@
+"""Classification of changes between a model and the model previously solved in a folder."""
+
+from __future__ import annotations
+
+from framcore import Base
+from framcore.fingerprints import FingerprintDiffType
+
+
+class SolveDiff(Base):
+    """
+    Changes between a model and the inputs and results of the previous solve in the same folder.
+
+    none: Model equals the inputs of the previous solve.
+    results_only: Model only differs from the inputs of the previous solve by results written by that solve.
+    inputs_changed: Data keys were added, deleted or modified, or the solver config changed.
+    """
+
+    _KIND_NONE = "none"
+    _KIND_RESULTS_ONLY = "results_only"
+    _KIND_INPUTS_CHANGED = "inputs_changed"
+
+    def __init__(
+        self,
+        input_diffs: dict[str, FingerprintDiffType],
+        result_keys: set[str],
+        is_config_changed: bool,
+    ) -> None:
+        """
+        Classify changes.
+
+        Args:
+            input_diffs (dict[str, FingerprintDiffType]): Data keys that were added, deleted or modified compared to previous inputs.
+            result_keys (set[str]): Data keys that differ from previous inputs only by results of the previous solve.
+            is_config_changed (bool): True if the solver or its config changed since the previous solve.
+
+        """
+        self._check_type(input_diffs, dict)
+        self._check_type(result_keys, set)
+        self._check_type(is_config_changed, bool)
+        self._input_diffs = input_diffs
+        self._result_keys = result_keys
+        self._is_config_changed = is_config_changed
+
+    def get_kind(self) -> str:
+        """Return none, results_only or inputs_changed."""
+        if self._input_diffs or self._is_config_changed:
+            return self._KIND_INPUTS_CHANGED
+        if self._result_keys:
+            return self._KIND_RESULTS_ONLY
+        return self._KIND_NONE
+
+    def is_none(self) -> bool:
+        """Return True if model equals the inputs of the previous solve."""
+        return self.get_kind() == self._KIND_NONE
+
+    def is_results_only(self) -> bool:
+        """Return True if model only differs from the previous inputs by results of the previous solve."""
+        return self.get_kind() == self._KIND_RESULTS_ONLY
+
+    def is_inputs_changed(self) -> bool:
+        """Return True if data or solver config changed since the previous solve."""
+        return self.get_kind() == self._KIND_INPUTS_CHANGED
+
+    def is_config_changed(self) -> bool:
+        """Return True if the solver or its config changed since the previous solve."""
+        return self._is_config_changed
+
+    def get_input_diffs(self) -> dict[str, FingerprintDiffType]:
+        """Return data keys that were added, deleted or modified compared to previous inputs."""
+        return dict(self._input_diffs)
+
+    def get_result_keys(self) -> set[str]:
+        """Return data keys that differ from previous inputs only by results of the previous solve."""
+        return set(self._result_keys)
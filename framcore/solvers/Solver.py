@@ -1,19 +1,22 @@
 """Definition of Solver interface."""
 
+import json
 import pickle
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from pathlib import Path
 
 from framcore import Base, Model
-from framcore.solvers import SolverConfig
+from framcore.fingerprints import FingerprintDiffType
+from framcore.solvers import ModelStore, SolveDiff, SolverConfig
 
 
 class Solver(Base, ABC):
     """Solver inteface class."""
 
-    _FILENAME_MODEL = "model.pickle"
+    _FOLDER_MODEL = "model"
     _FILENAME_SOLVER = "solver.pickle"
+    _FILENAME_INPUT_FINGERPRINTS = "input_fingerprints.json"
 
     def solve(self, model: Model) -> None:
         """Solve the models. Use folder to write results."""
@@ -27,15 +30,32 @@ class Solver(Base, ABC):
 
         Path.mkdir(folder, parents=True, exist_ok=True)
 
-        self._solve(folder, model)
+        max_workers = max(1, config.get_num_cpu_cores())
+        store = self.get_model_store(folder)
 
-        with Path.open(folder / self._FILENAME_MODEL, "wb") as f:
-            pickle.dump(model, f)
+        if config.is_diff_policy_reuse():
+            self._solve_reuse(folder, model, store, max_workers)
+        else:
+            (folder / self._FILENAME_INPUT_FINGERPRINTS).unlink(missing_ok=True)  # results will not match stored inputs
+            self._solve(folder, model)
+
+        # only components changed since the previous solve in folder are rewritten
+        store.write(model, max_workers=max_workers)
 
-        c = deepcopy(self)
-        c.get_config().set_solve_folder(None)
         with Path.open(folder / self._FILENAME_SOLVER, "wb") as f:
-            pickle.dump(c, f)
+            f.write(self._get_solver_bytes())
+
+    def get_solve_diff(self, folder: Path, model: Model) -> SolveDiff:
+        """Compare model and this solver with the inputs and results of the previous solve in folder."""
+        self._check_type(model, Model)
+        store = self.get_model_store(folder)
+        fingerprints = store.get_model_fingerprints(model, max_workers=max(1, self.get_config().get_num_cpu_cores()))
+        return self._get_solve_diff(Path(folder), store, fingerprints, self._get_solver_fingerprint())
+
+    @classmethod
+    def get_model_store(cls, folder: Path) -> ModelStore:
+        """Return store of the model written by solve to folder. Use it to load single objects or the whole model."""
+        return ModelStore(Path(folder) / cls._FOLDER_MODEL)
 
     @abstractmethod
     def get_config(self) -> SolverConfig:
@@ -46,3 +66,76 @@ class Solver(Base, ABC):
     def _solve(self, folder: Path, model: Model) -> None:
         """Solve the model inplace. Write to folder."""
         pass
+
+    def _get_solver_bytes(self) -> bytes:
+        """Pickle copy of self without solve folder, so the same solver in another folder pickles equal."""
+        c = deepcopy(self)
+        c.get_config().set_solve_folder(None)
+        return pickle.dumps(c)
+
+    def _get_solver_fingerprint(self) -> str:
+        """Digest of solver type and config without solve folder. Results are reused only if this is unchanged."""
+        config = deepcopy(self.get_config())
+        config.set_solve_folder(None)
+        return ModelStore.get_value_fingerprint((type(self).__qualname__, config))
+
+    def _resolve(self, folder: Path, model: Model, diff: SolveDiff) -> None:
+        """
+        Solve the model inplace when inputs changed since the previous solve in folder.
+
+        Default solves from scratch. Override to redo only the preprocessing and data export affected by diff.
+        """
+        self._solve(folder, model)
+
+    def _solve_reuse(self, folder: Path, model: Model, store: ModelStore, max_workers: int) -> None:
+        """Reuse results of the previous solve in folder if inputs are unchanged, else resolve and store new input fingerprints."""
+        fingerprints = store.get_model_fingerprints(model, max_workers=max_workers)
+        solver_fingerprint = self._get_solver_fingerprint()
+        diff = self._get_solve_diff(folder, store, fingerprints, solver_fingerprint)
+
+        if diff.is_inputs_changed():
+            self.send_info_event(f"Inputs changed for {len(diff.get_input_diffs())} keys since previous solve in {folder}.")
+            self._resolve(folder, model, diff)
+            content = {"solver": solver_fingerprint, "data": fingerprints}
+            with Path.open(folder / self._FILENAME_INPUT_FINGERPRINTS, "w") as f:
+                json.dump(content, f, indent=1)
+            return
+
+        self.send_info_event(f"Inputs unchanged since previous solve in {folder}. Reusing results.")
+        result_fingerprints = store.get_fingerprints()
+        data = model.get_data()
+        for key, result_fingerprint in result_fingerprints.items():
+            if fingerprints.get(key) != result_fingerprint:
+                data[key] = store.load(key)
+        model._bump_version()  # noqa: SLF001
+
+    def _get_solve_diff(self, folder: Path, store: ModelStore, fingerprints: dict[str, str], solver_fingerprint: str) -> SolveDiff:
+        path = folder / self._FILENAME_INPUT_FINGERPRINTS
+        if not path.is_file():
+            return SolveDiff({key: FingerprintDiffType.NEW for key in fingerprints}, set(), is_config_changed=True)
+
+        with Path.open(path) as f:
+            previous = json.load(f)
+        input_fingerprints: dict[str, str] = previous["data"]
+        try:
+            result_fingerprints = store.get_fingerprints()
+        except (FileNotFoundError, ValueError):
+            result_fingerprints = dict()
+
+        input_diffs: dict[str, FingerprintDiffType] = dict()
+        result_keys: set[str] = set()
+        for key, fingerprint in fingerprints.items():
+            if fingerprint == input_fingerprints.get(key):
+                continue
+            if fingerprint == result_fingerprints.get(key):
+                result_keys.add(key)
+            elif key in input_fingerprints:
+                input_diffs[key] = FingerprintDiffType.MODIFIED
+            else:
+                input_diffs[key] = FingerprintDiffType.NEW
+
+        for key in input_fingerprints.keys() - fingerprints.keys():
+            input_diffs[key] = FingerprintDiffType.DELETED
+
+        is_config_changed = previous["solver"] != solver_fingerprint or not result_fingerprints
+        return SolveDiff(input_diffs, result_keys, is_config_changed)
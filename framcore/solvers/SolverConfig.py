@@ -19,6 +19,7 @@ class SolverConfig(Base, ABC):
     _DIFF_POLICY_ERROR = "error"
     _DIFF_POLICY_IGNORE = "ignore"
     _DIFF_POLICY_BACKUP = "backup"
+    _DIFF_POLICY_REUSE = "reuse"
 
     def __init__(self) -> None:
         """Create internal variables with default values."""
@@ -189,6 +190,10 @@ class SolverConfig(Base, ABC):
         """Copy existing folder to folder/backup_[timestamp] folder if non-empty diff during solve."""
         self._diff_policy = self._DIFF_POLICY_BACKUP
 
+    def set_diff_policy_reuse(self) -> None:
+        """Compare model with the model previously solved in folder. Reuse results if inputs are unchanged, else redo changed parts."""
+        self._diff_policy = self._DIFF_POLICY_REUSE
+
     def is_diff_policy_error(self) -> bool:
         """Return True if error diff policy."""
         return self._diff_policy == self._DIFF_POLICY_ERROR
@@ -201,6 +206,10 @@ class SolverConfig(Base, ABC):
         """Return True if backup diff policy."""
         return self._diff_policy == self._DIFF_POLICY_BACKUP
 
+    def is_diff_policy_reuse(self) -> bool:
+        """Return True if reuse diff policy."""
+        return self._diff_policy == self._DIFF_POLICY_REUSE
+
     def set_simulation_mode_serial(self) -> None:
         """Activate serial simulation mode."""
         self._simulation_mode = self._SIMULATION_MODE_SERIAL
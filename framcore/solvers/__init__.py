@@ -1,9 +1,16 @@
 # framcore/solvers/__init__.py
 
+from framcore.solvers.ModelStore import ModelStore
+from framcore.solvers.SolveDiff import SolveDiff
 from framcore.solvers.Solver import Solver
 from framcore.solvers.SolverConfig import SolverConfig
+from framcore.solvers.ScenarioSweep import ScenarioSweep, WeatherYearsTransform
 
 __all__ = [
+    "ModelStore",
+    "ScenarioSweep",
+    "SolveDiff",
     "Solver",
     "SolverConfig",
+    "WeatherYearsTransform",
 ]
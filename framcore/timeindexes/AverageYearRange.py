@@ -6,6 +6,8 @@ from framcore.timeindexes.SinglePeriodTimeIndex import SinglePeriodTimeIndex  #
 class AverageYearRange(SinglePeriodTimeIndex):
     """AverageYearRange represents an average over a range of years."""
 
+    __slots__ = ()
+
     def __init__(self, start_year: int, num_years: int) -> None:
         """Initialize AverageYearRange with a year range."""
         start_time = datetime.fromisocalendar(start_year, 1, 1)
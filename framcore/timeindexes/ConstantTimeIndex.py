@@ -6,6 +6,8 @@ from framcore.timeindexes.SinglePeriodTimeIndex import SinglePeriodTimeIndex  #
 class ConstantTimeIndex(SinglePeriodTimeIndex):
     """Used in ConstantTimeVector."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Represent a specified year."""
         super().__init__(
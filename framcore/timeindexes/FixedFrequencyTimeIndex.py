@@ -8,12 +8,31 @@ from numpy.typing import NDArray
 
 import framcore.expressions._time_vector_operations as v_ops
 from framcore.fingerprints import Fingerprint
+from framcore.timeindexes._interning import InternedTimeIndexMeta, intern
 from framcore.timeindexes.TimeIndex import TimeIndex  # NB! full import path needed for inheritance to work
 from framcore.timevectors import ReferencePeriod
 
 
-class FixedFrequencyTimeIndex(TimeIndex):
-    """TimeIndex with fixed frequency."""
+class FixedFrequencyTimeIndex(TimeIndex, metaclass=InternedTimeIndexMeta):
+    """
+    TimeIndex with fixed frequency.
+
+    Instances are immutable and interned: constructing an index equal to a live one of the same class returns the
+    live object. Hash and stop time are computed once, and equality checks of shared indices settle on identity.
+    Subclasses must declare __slots__ (usually empty) and not add fields.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_extrapolate_first_point",
+        "_extrapolate_last_point",
+        "_hash",
+        "_is_52_week_years",
+        "_num_periods",
+        "_period_duration",
+        "_start_time",
+        "_stop_time",
+    )
 
     def __init__(
         self,
@@ -55,19 +74,67 @@ class FixedFrequencyTimeIndex(TimeIndex):
         if is_52_week_years and start_time.isocalendar().week == 53:  #  original: assert start_time.isocalendar().week != 53  # noqa: PLR2004
             raise ValueError("Week of start_time must not be 53 when is_52_week_years is True.")
         self._check_type(num_periods, int)
-        self._start_time = start_time
-        self._period_duration = period_duration
-        self._num_periods = num_periods
-        self._is_52_week_years = is_52_week_years
-        self._extrapolate_first_point = extrapolate_first_point
-        self._extrapolate_last_point = extrapolate_last_point
+        self._set_fields((start_time, period_duration, num_periods, is_52_week_years, extrapolate_first_point, extrapolate_last_point))
+
+    def _set_fields(self, fields: tuple[datetime, timedelta, int, bool, bool, bool]) -> None:
+        """Set fields in the order of _get_fields."""
+        start_time, period_duration, num_periods, is_52_week_years, extrapolate_first_point, extrapolate_last_point = fields
+        set_field = object.__setattr__
+        set_field(self, "_start_time", start_time)
+        set_field(self, "_period_duration", period_duration)
+        set_field(self, "_num_periods", num_periods)
+        set_field(self, "_is_52_week_years", is_52_week_years)
+        set_field(self, "_extrapolate_first_point", extrapolate_first_point)
+        set_field(self, "_extrapolate_last_point", extrapolate_last_point)
+        set_field(self, "_hash", hash(fields))
+        set_field(self, "_stop_time", start_time + period_duration * num_periods)
+
+    def _get_fields(self) -> tuple[datetime, timedelta, int, bool, bool, bool]:
+        return (
+            self._start_time,
+            self._period_duration,
+            self._num_periods,
+            self._is_52_week_years,
+            self._extrapolate_first_point,
+            self._extrapolate_last_point,
+        )
+
+    def _get_intern_key(self) -> tuple:
+        """Return key of all fields. Timezone is included since datetimes in different timezones can be equal."""
+        start_time = self._start_time
+        return (type(start_time), getattr(start_time, "tzinfo", None), getattr(start_time, "fold", 0), *self._get_fields())
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Refuse to change fields. Instances are shared."""
+        message = f"{type(self).__name__} is immutable. Use copy_with to get an index with other fields."
+        raise AttributeError(message)
+
+    def __delattr__(self, name: str) -> None:
+        """Refuse to delete fields. Instances are shared."""
+        message = f"{type(self).__name__} is immutable."
+        raise AttributeError(message)
+
+    def __copy__(self) -> FixedFrequencyTimeIndex:
+        """Return self, since instances are immutable."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> FixedFrequencyTimeIndex:
+        """Return self, since instances are immutable."""
+        return self
+
+    def __reduce__(self) -> tuple:
+        """Pickle fields only, and intern the index again when unpickled."""
+        return (_restore, (type(self), self._get_fields()))
 
     def __eq__(self, other) -> bool:  # noqa: ANN001
         """Check if equal to other."""
+        if self is other:
+            return True
         if not isinstance(other, FixedFrequencyTimeIndex):
             return False
         return (
-            self._start_time == other._start_time
+            self._hash == other._hash
+            and self._start_time == other._start_time
             and self._period_duration == other._period_duration
             and self._num_periods == other._num_periods
             and self._is_52_week_years == other._is_52_week_years
@@ -77,16 +144,7 @@ class FixedFrequencyTimeIndex(TimeIndex):
 
     def __hash__(self) -> int:
         """Return the hash value for the FixedFrequencyTimeIndex."""
-        return hash(
-            (
-                self._start_time,
-                self._period_duration,
-                self._num_periods,
-                self._is_52_week_years,
-                self._extrapolate_first_point,
-                self._extrapolate_last_point,
-            ),
-        )
+        return self._hash
 
     def __repr__(self) -> str:
         """Return a string representation of the FixedFrequencyTimeIndex."""
@@ -102,7 +160,14 @@ class FixedFrequencyTimeIndex(TimeIndex):
 
     def get_fingerprint(self) -> Fingerprint:
         """Get the fingerprint."""
-        return self.get_fingerprint_default()
+        fingerprint = Fingerprint(source=self)
+        fingerprint.add("_start_time", self._start_time)
+        fingerprint.add("_period_duration", self._period_duration)
+        fingerprint.add("_num_periods", self._num_periods)
+        fingerprint.add("_is_52_week_years", self._is_52_week_years)
+        fingerprint.add("_extrapolate_first_point", self._extrapolate_first_point)
+        fingerprint.add("_extrapolate_last_point", self._extrapolate_last_point)
+        return fingerprint
 
     def get_timezone(self) -> tzinfo | None:
         """Get the timezone."""
@@ -203,13 +268,14 @@ class FixedFrequencyTimeIndex(TimeIndex):
     def get_period_average(self, vector: NDArray, start_time: datetime, duration: timedelta, is_52_week_years: bool) -> float:
         """Get the average over the period from the vector."""
         assert vector.shape == (self.get_num_periods(),)
+        # positional arguments are the fast path of the interning argument cache
         target_timeindex = FixedFrequencyTimeIndex(
-            start_time=start_time,
-            period_duration=duration,
-            num_periods=1,
-            is_52_week_years=is_52_week_years,
-            extrapolate_first_point=self.extrapolate_first_point(),
-            extrapolate_last_point=self.extrapolate_last_point(),
+            start_time,
+            duration,
+            1,
+            is_52_week_years,
+            self._extrapolate_first_point,
+            self._extrapolate_last_point,
         )
         target_vector = np.zeros(1, dtype=vector.dtype)
         self.write_into_fixed_frequency(
@@ -443,7 +509,7 @@ class FixedFrequencyTimeIndex(TimeIndex):
 
     def get_stop_time(self) -> datetime:
         """Get the stop time of the TimeIndex."""
-        return self._start_time + self._period_duration * self._num_periods
+        return self._stop_time
 
     def slice(
         self,
@@ -708,13 +774,14 @@ class FixedFrequencyTimeIndex(TimeIndex):
             A new instance with the updated attributes.
 
         """
+        # positional arguments are the fast path of the interning argument cache
         return FixedFrequencyTimeIndex(
-            start_time=start_time if start_time is not None else self._start_time,
-            period_duration=period_duration if period_duration is not None else self._period_duration,
-            num_periods=num_periods if num_periods is not None else self._num_periods,
-            is_52_week_years=is_52_week_years if is_52_week_years is not None else self._is_52_week_years,
-            extrapolate_first_point=extrapolate_first_point if extrapolate_first_point is not None else self._extrapolate_first_point,
-            extrapolate_last_point=extrapolate_last_point if extrapolate_last_point is not None else self._extrapolate_last_point,
+            start_time if start_time is not None else self._start_time,
+            period_duration if period_duration is not None else self._period_duration,
+            num_periods if num_periods is not None else self._num_periods,
+            is_52_week_years if is_52_week_years is not None else self._is_52_week_years,
+            extrapolate_first_point if extrapolate_first_point is not None else self._extrapolate_first_point,
+            extrapolate_last_point if extrapolate_last_point is not None else self._extrapolate_last_point,
         )
 
     def copy_as_reference_period(self, reference_period: ReferencePeriod) -> FixedFrequencyTimeIndex:
@@ -752,3 +819,10 @@ class FixedFrequencyTimeIndex(TimeIndex):
         n = self.get_num_periods()
         d = self.get_period_duration()
         return [t + i * d for i in range(n + 1)]
+
+
+def _restore(cls: type[FixedFrequencyTimeIndex], fields: tuple) -> FixedFrequencyTimeIndex:
+    """Unpickle without calling __init__, since subclasses have other constructor arguments."""
+    instance = object.__new__(cls)
+    instance._set_fields(fields)
+    return intern(instance)
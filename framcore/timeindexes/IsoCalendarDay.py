@@ -12,6 +12,8 @@ class IsoCalendarDay(SinglePeriodTimeIndex):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, year: int, week: int, day: int) -> None:
         """
         IsoCalendarDay represent a day from datetime.fromisocalendar(year, week, day).
@@ -37,30 +37,28 @@ class ListTimeIndex(TimeIndex):
             message = f"All elements of datetime_list must be smaller/lower than the succeeding element. Dates must be ordered. Got {datetime_list}."
             raise ValueError(message)
         assert len(set(dt.tzinfo for dt in dts if dt is not None)) <= 1
-        self._datetime_list = datetime_list
+        self._datetime_list = list(datetime_list)  # own copy, so the cached hash stays valid
         self._is_52_week_years = is_52_week_years
         self._extrapolate_first_point = extrapolate_first_point
         self._extrapolate_last_point = extrapolate_last_point
+        self._hash = hash((tuple(self._datetime_list), extrapolate_first_point, extrapolate_last_point))
 
     def __eq__(self, other) -> bool:  # noqa: ANN001
         """Check if two ListTimeIndexes are equal."""
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
         return (
-            self._datetime_list == other._datetime_list
+            self._hash == other._hash
+            and self._datetime_list == other._datetime_list
             and self._extrapolate_first_point == other._extrapolate_first_point
             and self._extrapolate_last_point == other._extrapolate_last_point
         )
 
     def __hash__(self) -> int:
         """Return the hash of the ListTimeIndex."""
-        return hash(
-            (
-                tuple(self._datetime_list),
-                self._extrapolate_first_point,
-                self._extrapolate_last_point,
-            ),
-        )
+        return self._hash
 
     def __repr__(self) -> str:
         """Return the string representation of the ListTimeIndex."""
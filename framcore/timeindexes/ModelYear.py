@@ -6,6 +6,8 @@ from framcore.timeindexes.SinglePeriodTimeIndex import SinglePeriodTimeIndex  #
 class ModelYear(SinglePeriodTimeIndex):
     """ModelYear represent one 52-week-year. No extrapolation."""
 
+    __slots__ = ()
+
     def __init__(self, year: int) -> None:
         """Represent a specified year. Use 52-week-year starting on monday in week 1. No extrapolation."""
         super().__init__(
@@ -6,6 +6,8 @@ from framcore.timeindexes.ProfileTimeIndex import ProfileTimeIndex  # NB! full i
 class OneYearProfileTimeIndex(ProfileTimeIndex):
     """Fixed frequency over one year."""
 
+    __slots__ = ()
+
     def __init__(self, period_duration: timedelta, is_52_week_years: bool) -> None:
         """
         Initialize a OneYearProfileTimeIndex with a fixed frequency over one year.
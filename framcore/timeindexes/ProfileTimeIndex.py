@@ -6,6 +6,8 @@ from framcore.timeindexes.FixedFrequencyTimeIndex import FixedFrequencyTimeIndex
 class ProfileTimeIndex(FixedFrequencyTimeIndex):
     """ProfileTimeIndex represent one or more whole years with fixed time resolution standard."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         start_year: int,
@@ -8,6 +8,8 @@ from framcore.timeindexes.FixedFrequencyTimeIndex import FixedFrequencyTimeIndex
 class SinglePeriodTimeIndex(FixedFrequencyTimeIndex):
     """FrequencyTimeIndex with just one single step."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         start_time: datetime,
@@ -13,6 +13,8 @@ from framcore.timeindexes import FixedFrequencyTimeIndex
 class TimeIndex(Base, ABC):
     """TimeIndex interface for TimeVectors."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __eq__(self, other) -> bool:  # noqa: ANN001
         """Check if two TimeIndexes are equal."""
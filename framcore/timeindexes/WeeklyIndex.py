@@ -6,6 +6,8 @@ from framcore.timeindexes.ProfileTimeIndex import ProfileTimeIndex  # NB! full i
 class WeeklyIndex(ProfileTimeIndex):
     """One or more whole years with weekly resolution."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         start_year: int,
@@ -0,0 +1,63 @@
+"""Interning of immutable TimeIndex objects."""
+
+from __future__ import annotations
+
+from abc import ABCMeta
+from datetime import date, datetime, timedelta
+from weakref import WeakValueDictionary
+
+# (cls, typed fields) -> canonical instance. All live equal instances of a class are the same object.
+_BY_FIELDS: WeakValueDictionary[tuple, object] = WeakValueDictionary()
+
+# (cls, call arguments, their types) -> instance. Strong, so short-lived indices that are created over and over
+# (e.g. in loops over time vectors) are built once. Cleared when full to bound memory.
+_BY_ARGS: dict[tuple, object] = dict()
+_MAX_BY_ARGS = 1024
+
+# Argument types where equal values of the same type are interchangeable. The timezone of a datetime is added to
+# the key, since equal datetimes can be in different timezones. Calls with other arguments, or more than one
+# datetime, skip the argument cache.
+_CACHEABLE_TYPES = frozenset((bool, int, float, str, timedelta, date, datetime, type(None)))
+
+
+class InternedTimeIndexMeta(ABCMeta):
+    """
+    Metaclass returning one shared instance per class and value.
+
+    Classes using it must be immutable and implement _get_intern_key, returning a hashable key of all fields.
+    """
+
+    def __call__(cls, *args: object, **kwargs: object) -> object:
+        """Return the interned instance for the call arguments, creating it if needed."""
+        values = (*args, *kwargs.values()) if kwargs else args
+        types = tuple(map(type, values))
+        key = None
+        if _CACHEABLE_TYPES.issuperset(types) and types.count(datetime) <= 1:
+            key = (cls, values, tuple(kwargs), types)
+            if datetime in types:
+                key = (key, values[types.index(datetime)].tzinfo)
+            instance = _BY_ARGS.get(key)
+            if instance is not None:
+                return instance
+
+        instance = intern(super().__call__(*args, **kwargs))
+        if key is not None:
+            if len(_BY_ARGS) >= _MAX_BY_ARGS:
+                _BY_ARGS.clear()
+            _BY_ARGS[key] = instance
+        return instance
+
+
+def intern(instance: object) -> object:
+    """Return the canonical instance equal to instance (of the same class), registering instance if none exists."""
+    return _BY_FIELDS.setdefault((type(instance), instance._get_intern_key()), instance)  # noqa: SLF001
+
+
+def clear_interned() -> None:
+    """Drop the argument cache, so indices not referenced elsewhere are released. Live indices stay shared."""
+    _BY_ARGS.clear()
+
+
+def get_num_interned() -> int:
+    """Return number of live interned instances."""
+    return len(_BY_FIELDS)
@@ -87,6 +87,10 @@ class LoadedTimeVector(TimeVector):
         """Get the Loader this TimeVector retrieves its data from."""
         return self._loader
 
+    def get_vector_id(self) -> str:
+        """Get the id of this TimeVector in its Loader."""
+        return self._vector_id
+
     def get_reference_period(self) -> ReferencePeriod | None:
         """Get the reference period which the data of this TimeVector is from."""
         return self._reference_period
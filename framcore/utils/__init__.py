@@ -4,33 +4,49 @@
 from framcore.utils.get_supported_components import get_supported_components
 from framcore.utils.node_flow_utils import (
     FlowInfo,
+    FlowInfoTable,
     get_component_to_nodes,
     get_flow_infos,
     get_node_to_commodity,
     get_transports_by_commodity,
     is_transport_by_commodity,
 )
-from framcore.utils.global_energy_equivalent import get_hydro_downstream_energy_equivalent, set_global_energy_equivalent
-from framcore.utils.storage_subsystems import get_one_commodity_storage_subsystems
+from framcore.utils.node_flow_graph import NodeFlowGraph, get_node_flow_graph
+from framcore.utils.global_energy_equivalent import (
+    get_hydro_downstream_energy_equivalent,
+    get_hydro_downstream_energy_equivalents,
+    set_global_energy_equivalent,
+)
+from framcore.utils.storage_subsystems import get_one_commodity_storage_subsystems, get_storage_subsystems
 from framcore.utils.isolate_subnodes import isolate_subnodes
 from framcore.utils.get_regional_volumes import get_regional_volumes, RegionalVolumes
-from framcore.utils.loaders import add_loaders_if, add_loaders, replace_loader_path
+from framcore.utils.tabulate import ComponentTable, TableColumn, tabulate
+from framcore.utils.loaders import add_loaders_if, add_loaders, prefetch_loaded_ids, replace_loader_path
 
 __all__ = [
+    "ComponentTable",
     "FlowInfo",
+    "FlowInfoTable",
+    "NodeFlowGraph",
     "RegionalVolumes",
+    "TableColumn",
     "add_loaders",
     "add_loaders_if",
     "get_component_to_nodes",
     "get_flow_infos",
     "get_hydro_downstream_energy_equivalent",
+    "get_hydro_downstream_energy_equivalents",
+    "get_node_flow_graph",
     "get_node_to_commodity",
     "get_one_commodity_storage_subsystems",
     "get_regional_volumes",
+    "get_storage_subsystems",
     "get_supported_components",
     "get_transports_by_commodity",
     "is_transport_by_commodity",
     "isolate_subnodes",
+    "prefetch_loaded_ids",
     "replace_loader_path",
     "set_global_energy_equivalent",
+    "tabulate",
 ]
@@ -8,14 +8,14 @@ import numpy as np
 from numpy.typing import NDArray
 
 from framcore.attributes import FlowVolume
-from framcore.components import Component, Flow, Node
+from framcore.components import Flow, Node
 from framcore.events import send_warning_event
 from framcore.expressions import get_unit_conversion_factor
 from framcore.expressions._utils import _load_model_and_create_model_db
 from framcore.metadata import Member
 from framcore.querydbs import QueryDB
 from framcore.timeindexes import FixedFrequencyTimeIndex, SinglePeriodTimeIndex
-from framcore.utils import FlowInfo, get_flow_infos, get_node_to_commodity, get_supported_components
+from framcore.utils import FlowInfo, get_node_flow_graph
 
 if TYPE_CHECKING:
     from framcore import Model
@@ -173,6 +173,8 @@ def _get_vector(
     return vector
 
 
+_BATCH_BYTES = 256 * 1024**2
+
 # TODO: More options: node_category, consumption_category, production_category, with_trade_partners
 
 
@@ -191,25 +193,27 @@ def get_regional_volumes(
     unit: str,
     is_float32: bool = True,
 ) -> RegionalVolumes:
-    """Calculate aggregated production, consumption, import and export."""
+    """
+    Calculate aggregated production, consumption, import and export.
+
+    Each flow volume is queried once, and all volumes are summed into
+    one (n_categories, n_periods) matrix in batches, see _sum_flow_vectors_into_targets.
+    """
+    from framcore import Model  # noqa: PLC0415
+
+    model = db if isinstance(db, Model) else None
     db = _load_model_and_create_model_db(db)
 
     if not isinstance(is_float32, bool):
         message = f"Expected bool for is_float32, got {is_float32}"
         raise ValueError(message)
 
-    domain_components = {k: v for k, v in db.get_data().items() if isinstance(v, Component)}
-
-    graph: dict[str, Node | Flow] = get_supported_components(
-        components=domain_components,
-        supported_types=(Node, Flow),
-        forbidden_types=tuple(),
-    )
+    graph = get_node_flow_graph(model if model is not None else db.get_data())
 
-    flows: dict[str, Flow] = {k: v for k, v in graph.items() if isinstance(v, Flow)}
-    nodes: dict[str, Node] = {k: v for k, v in graph.items() if isinstance(v, Node)}
+    flows: dict[str, Flow] = graph.get_flows()
+    nodes: dict[str, Node] = graph.get_nodes()
 
-    node_to_commodity = get_node_to_commodity(graph)
+    node_to_commodity = graph.get_node_to_commodity()
 
     # only nodes of prefered commodity
     nodes_of_commodity: dict[str, Node] = {k: v for k, v in nodes.items() if v.get_commodity() == commodity}
@@ -231,139 +235,226 @@ def get_regional_volumes(
     import_: dict[str, dict[str, list[Flow]]] = dict()
     export: dict[str, dict[str, list[Flow]]] = dict()
 
-    for flow_id, flow in flows.items():
-        flow_infos = get_flow_infos(flow, node_to_commodity)
-
-        prod_category = None
-        cons_category = None
-        with contextlib.suppress(Exception):
-            prod_category = _get_meta_value(flow_id, flow, production_category)
-        with contextlib.suppress(Exception):
-            cons_category = _get_meta_value(flow_id, flow, consumption_category)
-
-        for flow_info in flow_infos:
-            flow_info: FlowInfo
-            if flow_info.category == "direct_in" and flow_info.commodity_in == commodity:
-                _check_category(prod_category, flow_id, flow_info)
-                node_category = node_to_category[flow_info.node_in]
-                if node_category not in direct_production:
-                    direct_production[node_category] = defaultdict(list)
-                direct_production[node_category][prod_category].append(flow)
-
-            elif flow_info.category == "conversion" and flow_info.commodity_in == commodity:
-                _check_category(prod_category, flow_id, flow_info)
-                node_category = node_to_category[flow_info.node_in]
-                if node_category not in converted_production:
-                    converted_production[node_category] = defaultdict(list)
-                converted_production[node_category][prod_category].append(flow)
-
-            elif flow_info.category == "direct_out" and flow_info.commodity_out == commodity:
-                _check_category(cons_category, flow_id, flow_info)
-                node_category = node_to_category[flow_info.node_out]
-                if node_category not in direct_consumption:
-                    direct_consumption[node_category] = defaultdict(list)
-                direct_consumption[node_category][cons_category].append(flow)
-
-            elif flow_info.category == "conversion" and flow_info.commodity_out == commodity:
-                _check_category(cons_category, flow_id, flow_info)
-                node_category = node_to_category[flow_info.node_out]
-                if node_category not in converted_consumption:
-                    converted_consumption[node_category] = defaultdict(list)
-                converted_consumption[node_category][cons_category].append(flow)
-
-            elif flow_info.category == "transport":
-                if node_to_commodity[flow_info.node_in] != commodity:
-                    continue
-                category_in = node_to_category[flow_info.node_in]
-                category_out = node_to_category[flow_info.node_out]
-                if category_in == category_out:
-                    continue
-
-                if category_in not in import_:
-                    import_[category_in] = defaultdict(list)
-                import_[category_in][category_out].append(flow)
-
-                if category_out not in export:
-                    export[category_out] = defaultdict(list)
-                export[category_out][category_in].append(flow)
+    # only infos with an arrow to a node of commodity, in flow order
+    table = graph.get_flow_info_table()
+    flow_ids = table.get_flow_ids()
+    flow_index = table.get_flow()
+
+    flow_id = None
+    for row in table.get_rows_of_commodity(commodity).tolist():
+        if flow_ids[flow_index[row]] != flow_id:
+            flow_id = flow_ids[flow_index[row]]
+            flow = flows[flow_id]
+
+            prod_category = None
+            cons_category = None
+            with contextlib.suppress(Exception):
+                prod_category = _get_meta_value(flow_id, flow, production_category)
+            with contextlib.suppress(Exception):
+                cons_category = _get_meta_value(flow_id, flow, consumption_category)
+
+        flow_info: FlowInfo = table.get_flow_info(row)
+        if flow_info.category == "direct_in" and flow_info.commodity_in == commodity:
+            _check_category(prod_category, flow_id, flow_info)
+            node_category = node_to_category[flow_info.node_in]
+            if node_category not in direct_production:
+                direct_production[node_category] = defaultdict(list)
+            direct_production[node_category][prod_category].append(flow)
+
+        elif flow_info.category == "conversion" and flow_info.commodity_in == commodity:
+            _check_category(prod_category, flow_id, flow_info)
+            node_category = node_to_category[flow_info.node_in]
+            if node_category not in converted_production:
+                converted_production[node_category] = defaultdict(list)
+            converted_production[node_category][prod_category].append(flow)
+
+        elif flow_info.category == "direct_out" and flow_info.commodity_out == commodity:
+            _check_category(cons_category, flow_id, flow_info)
+            node_category = node_to_category[flow_info.node_out]
+            if node_category not in direct_consumption:
+                direct_consumption[node_category] = defaultdict(list)
+            direct_consumption[node_category][cons_category].append(flow)
+
+        elif flow_info.category == "conversion" and flow_info.commodity_out == commodity:
+            _check_category(cons_category, flow_id, flow_info)
+            node_category = node_to_category[flow_info.node_out]
+            if node_category not in converted_consumption:
+                converted_consumption[node_category] = defaultdict(list)
+            converted_consumption[node_category][cons_category].append(flow)
+
+        elif flow_info.category == "transport":
+            if node_to_commodity[flow_info.node_in] != commodity:
+                continue
+            category_in = node_to_category[flow_info.node_in]
+            category_out = node_to_category[flow_info.node_out]
+            if category_in == category_out:
+                continue
+
+            if category_in not in import_:
+                import_[category_in] = defaultdict(list)
+            import_[category_in][category_out].append(flow)
+
+            if category_out not in export:
+                export[category_out] = defaultdict(list)
+            export[category_out][category_in].append(flow)
 
     num_periods = scenario_period.get_num_periods()
     dtype = np.float32 if is_float32 else np.float64
 
-    out = RegionalVolumes()
+    # One row per unique (flow, is_ingoing) in the batched flow matrix,
+    # and one row per (group, category, subcategory) in the output matrix.
+    tasks: dict[tuple[Flow, bool], int] = dict()
+    task_descriptions: list[str] = []
+    targets: dict[tuple[str, str, str], int] = dict()
+    pairs: list[tuple[int, int]] = []  # (target row, task row)
+
+    flow_dicts = [
+        (direct_production, "production", True, "direct production or consumption"),
+        (direct_consumption, "consumption", False, "direct production or consumption"),
+        (converted_production, "production", True, "indirect production or consumption"),
+        (converted_consumption, "consumption", False, "indirect production or consumption"),
+        (import_, "import", True, "trade"),
+        (export, "export", False, "trade"),
+    ]
+    for flow_dict, group, is_ingoing, description in flow_dicts:
+        _register_batch_rows(
+            flow_dict,
+            group,
+            is_ingoing,
+            description,
+            tasks=tasks,
+            task_descriptions=task_descriptions,
+            targets=targets,
+            pairs=pairs,
+        )
+
+    target_matrix = np.zeros((len(targets), num_periods), dtype=dtype)
+
+    _sum_flow_vectors_into_targets(
+        target_matrix=target_matrix,
+        tasks=list(tasks),
+        task_descriptions=task_descriptions,
+        pairs=pairs,
+        commodity=commodity,
+        node_to_commodity=node_to_commodity,
+        db=db,
+        data_period=data_period,
+        scenario_period=scenario_period,
+        unit=unit,
+        is_float32=is_float32,
+    )
 
-    # direct
-    for flow_dict, out_dict, is_ingoing in [(direct_production, out.get_production(), True), (direct_consumption, out.get_consumption(), False)]:
-        for node_category, flow_categories in flow_dict.items():
-            if node_category not in out_dict:
-                out_dict[node_category] = dict()
-            for flow_category, flows in flow_categories.items():
-                x = np.zeros(num_periods, dtype=dtype)
-                for flow in set(flows):
-                    try:
-                        vector = _get_vector(
-                            flow=flow,
-                            is_ingoing=is_ingoing,
-                            commodity=commodity,
-                            node_to_commodity=node_to_commodity,
-                            db=db,
-                            scenario_period=scenario_period,
-                            data_period=data_period,
-                            unit=unit,
-                            is_float32=is_float32,
-                        )
-                        np.add(x, vector, out=x)
-                    except Exception as e:
-                        send_warning_event(flow, f"Could not get direct production or consumption for flow {flow}: {e}")
-                out_dict[node_category][flow_category] = x
-
-    # converted
-    for flow_dict, out_dict, is_ingoing in [(converted_production, out.get_production(), True), (converted_consumption, out.get_consumption(), False)]:
-        for node_category, flow_categories in flow_dict.items():
-            if node_category not in out_dict:
-                out_dict[node_category] = dict()
-            for flow_category, flows in flow_categories.items():
-                x = out_dict[node_category][flow_category] if flow_category in out_dict[node_category] else np.zeros(num_periods, dtype=dtype)
-                for flow in set(flows):
-                    try:
-                        vector = _get_vector(
-                            flow=flow,
-                            is_ingoing=is_ingoing,
-                            commodity=commodity,
-                            node_to_commodity=node_to_commodity,
-                            db=db,
-                            scenario_period=scenario_period,
-                            data_period=data_period,
-                            unit=unit,
-                            is_float32=is_float32,
-                        )
-                        np.add(x, vector, out=x)
-                    except Exception as e:
-                        send_warning_event(flow, f"Could not get indirect production or consumption for flow {flow}: {e}")
-                out_dict[node_category][flow_category] = x
-
-    # trade
-    for flow_dict, out_dict, is_ingoing in [(import_, out.get_import(), True), (export, out.get_export(), False)]:
-        for category, trade_partners in flow_dict.items():
-            out_dict[category] = dict()
-            for trade_partner, flows in trade_partners.items():
-                x = np.zeros(num_periods, dtype=dtype)
-                for flow in set(flows):
-                    try:
-                        vector = _get_vector(
-                            flow=flow,
-                            is_ingoing=is_ingoing,
-                            commodity=commodity,
-                            node_to_commodity=node_to_commodity,
-                            db=db,
-                            scenario_period=scenario_period,
-                            data_period=data_period,
-                            unit=unit,
-                            is_float32=is_float32,
-                        )
-                        np.add(x, vector, out=x)
-                    except Exception as e:
-                        send_warning_event(flow, f"Could not get trade for flow {flow}: {e}")
-                out_dict[category][trade_partner] = x
+    return _get_regional_volumes_from_targets([(flow_dict, group) for flow_dict, group, __, __ in flow_dicts], targets, target_matrix)
+
+
+def _get_regional_volumes_from_targets(
+    flow_dicts: list[tuple[dict[str, dict[str, list[Flow]]], str]],
+    targets: dict[tuple[str, str, str], int],
+    target_matrix: NDArray,
+) -> RegionalVolumes:
+    """Put each target row into its group, category and subcategory. Categories without subcategories get an empty dict."""
+    out = RegionalVolumes()
+    out_dicts = {
+        "production": out.get_production(),
+        "consumption": out.get_consumption(),
+        "import": out.get_import(),
+        "export": out.get_export(),
+    }
+    for flow_dict, group in flow_dicts:
+        out_dict = out_dicts[group]
+        for category in flow_dict:
+            if category not in out_dict:
+                out_dict[category] = dict()
+    for (group, category, subcategory), row in targets.items():
+        out_dicts[group][category][subcategory] = target_matrix[row]
 
     return out
+
+
+def _register_batch_rows(
+    flow_dict: dict[str, dict[str, list[Flow]]],
+    group: str,
+    is_ingoing: bool,
+    description: str,
+    *,
+    tasks: dict[tuple[Flow, bool], int],
+    task_descriptions: list[str],
+    targets: dict[tuple[str, str, str], int],
+    pairs: list[tuple[int, int]],
+) -> None:
+    """Give each new (flow, is_ingoing) a task row and each new (group, category, subcategory) a target row, and pair them."""
+    for category, subcategories in flow_dict.items():
+        for subcategory, flows in subcategories.items():
+            target_key = (group, category, subcategory)
+            if target_key not in targets:
+                targets[target_key] = len(targets)
+            target_row = targets[target_key]
+            for flow in set(flows):
+                task_key = (flow, is_ingoing)
+                if task_key not in tasks:
+                    tasks[task_key] = len(tasks)
+                    task_descriptions.append(description)
+                pairs.append((target_row, tasks[task_key]))
+
+
+def _sum_flow_vectors_into_targets(
+    *,
+    target_matrix: NDArray,
+    tasks: list[tuple[Flow, bool]],
+    task_descriptions: list[str],
+    pairs: list[tuple[int, int]],
+    commodity: str,
+    node_to_commodity: dict[str, str],
+    db: QueryDB,
+    data_period: SinglePeriodTimeIndex,
+    scenario_period: FixedFrequencyTimeIndex,
+    unit: str,
+    is_float32: bool,
+) -> None:
+    """
+    Evaluate each task once into a (n_tasks, n_periods) flow matrix and segment-sum its rows into target_matrix.
+
+    The flow matrix is filled in blocks of at most _BATCH_BYTES to bound peak memory for long scenario horizons.
+    """
+    if not tasks or not pairs:
+        return
+
+    num_periods = target_matrix.shape[1]
+    rows_per_block = max(1, _BATCH_BYTES // max(1, num_periods * target_matrix.itemsize))
+
+    pair_array = np.array(pairs, dtype=np.int64)
+    pair_array = pair_array[np.lexsort((pair_array[:, 0], pair_array[:, 1]))]  # sort by task, then target
+    target_rows = pair_array[:, 0]
+    task_rows = pair_array[:, 1]
+
+    for start in range(0, len(tasks), rows_per_block):
+        stop = min(start + rows_per_block, len(tasks))
+        flow_matrix = np.zeros((stop - start, num_periods), dtype=target_matrix.dtype)
+        for row in range(start, stop):
+            flow, is_ingoing = tasks[row]
+            try:
+                flow_matrix[row - start] = _get_vector(
+                    flow=flow,
+                    is_ingoing=is_ingoing,
+                    commodity=commodity,
+                    node_to_commodity=node_to_commodity,
+                    db=db,
+                    scenario_period=scenario_period,
+                    data_period=data_period,
+                    unit=unit,
+                    is_float32=is_float32,
+                )
+            except Exception as e:
+                send_warning_event(flow, f"Could not get {task_descriptions[row]} for flow {flow}: {e}")
+
+        lo, hi = np.searchsorted(task_rows, [start, stop])
+        block_targets = target_rows[lo:hi]
+        block_tasks = task_rows[lo:hi] - start
+
+        # segment-sum: sort block pairs by target row and reduce each run of equal targets
+        order = np.argsort(block_targets, kind="stable")
+        block_targets = block_targets[order]
+        block_tasks = block_tasks[order]
+        segment_starts = np.flatnonzero(np.r_[True, block_targets[1:] != block_targets[:-1]])
+        sums = np.add.reduceat(flow_matrix[block_tasks], segment_starts, axis=0)
+        target_matrix[block_targets[segment_starts]] += sums
@@ -6,7 +6,14 @@ def get_supported_components(
     supported_types: tuple[type[Component]],
     forbidden_types: tuple[type[Component]],
 ) -> dict[str, Component]:
-    """Return simplified version of components in compliance with specified component types."""
+    """
+    Return simplified version of components in compliance with specified component types.
+
+    Simpler components are cached by each Component, so repeated calls on unchanged components reuse the same
+    child components. Setters, add_meta and replace_node clear the cache of the component they are called on.
+    Edits of nested objects (e.g. module.get_generator().set_power_node(...)) do not, and must be followed by
+    clear_simpler_components on the component that holds them.
+    """
     output: dict[str, Component] = {}
     errors: list[str] = []
 
@@ -1,9 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from framcore.components import Component, HydroModule
 from framcore.curves import Curve
-from framcore.expressions import Expr
+from framcore.expressions import Expr, get_level_value
 from framcore.metadata import LevelExprMeta
 from framcore.timevectors import ConstantTimeVector, TimeVector
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from framcore import Model
+    from framcore.querydbs import QueryDB
+    from framcore.timeindexes import FixedFrequencyTimeIndex, SinglePeriodTimeIndex
+
 
 def get_hydro_downstream_energy_equivalent(
     data: dict[str, Component | TimeVector | Curve | Expr],
@@ -15,30 +26,111 @@ def get_hydro_downstream_energy_equivalent(
 
     Either count all downstream energy equivalents, or only those that are connected to the given power_node.
     """
-    if data[module_name].get_pump() and data[module_name].get_pump().get_from_module() == module_name:  # transport pump
-        pump_power_node = data[module_name].get_pump().get_power_node()
-        pump_to = data[module_name].get_pump().get_to_module()
-        energy_equivalent = get_hydro_downstream_energy_equivalent(data, pump_to, power_node)  # continue downstream of pump_to module
-        if power_node in (pump_power_node, None):
-            return energy_equivalent - data[module_name].get_pump().get_energy_eq().get_level()  # pumps has negative energy equivalents
-        return energy_equivalent
+    return _get_downstream_energy_equivalent(data, module_name, power_node, dict(), _as_expr)
+
+
+def get_hydro_downstream_energy_equivalents(
+    data: dict[str, Component | TimeVector | Curve | Expr],
+    module_names: Iterable[str] | None = None,
+    power_node: str | None = None,
+    db: Model | QueryDB | None = None,
+    unit: str = "kWh/m3",
+    data_dim: SinglePeriodTimeIndex | None = None,
+    scen_dim: FixedFrequencyTimeIndex | None = None,
+) -> dict[str, Expr | float]:
+    """
+    Get the sum downstream energy equivalent for module_names (default all HydroModules in data) in one downstream pass.
+
+    Each module reuses the memoized result of the module it releases (or pumps) to, so sub-sums
+    are shared between modules instead of being rebuilt per module.
+
+    If db is given, return values in unit evaluated over data_dim and scen_dim instead of Expr.
+    Modules with no downstream energy equivalents get 0.
+    """
+    if db is None:
+        evaluate = _as_expr
+    else:
+        if data_dim is None or scen_dim is None:
+            message = "data_dim and scen_dim must be given to evaluate energy equivalents."
+            raise ValueError(message)
+
+        def evaluate(level: Expr) -> float:
+            return get_level_value(level, db, unit, data_dim, scen_dim, is_max=False)
+
+    if module_names is None:
+        module_names = [k for k, v in data.items() if isinstance(v, HydroModule)]
+
+    memo: dict[str, Expr | float] = dict()
+    return {name: _get_downstream_energy_equivalent(data, name, power_node, memo, evaluate) for name in module_names}
+
+
+def _as_expr(level: Expr) -> Expr:
+    return level
+
+
+def _get_downstream_module(data: dict[str, Component | TimeVector | Curve | Expr], module_name: str) -> str | None:
+    """Return the module that water from module_name goes to. The pump_to module for transport pumps, else release_to."""
+    module = data[module_name]
+    pump = module.get_pump()
+    if pump and pump.get_from_module() == module_name:  # transport pump
+        return pump.get_to_module()
+    return module.get_release_to()
+
+
+def _get_downstream_energy_equivalent(
+    data: dict[str, Component | TimeVector | Curve | Expr],
+    module_name: str,
+    power_node: str | None,
+    memo: dict[str, Expr | float],
+    evaluate: Callable[[Expr], Expr | float],
+) -> Expr | float:
+    """Walk downstream from module_name until a memoized module, then fill memo back up in topological order."""
+    path: list[str] = []
+    visited: set[str] = set()
+    current = module_name
+    while current is not None and current not in memo:
+        if current in visited:
+            message = f"Circular release_to or pump references between HydroModules {path}."
+            raise ValueError(message)
+        path.append(current)
+        visited.add(current)
+        current = _get_downstream_module(data, current)
+
+    energy_equivalent = 0 if current is None else memo[current]
+    for name in reversed(path):
+        energy_equivalent = _add_own_energy_equivalent(data, name, power_node, energy_equivalent, evaluate)
+        memo[name] = energy_equivalent
+    return memo[module_name]
+
+
+def _add_own_energy_equivalent(
+    data: dict[str, Component | TimeVector | Curve | Expr],
+    module_name: str,
+    power_node: str | None,
+    downstream: Expr | float,
+    evaluate: Callable[[Expr], Expr | float],
+) -> Expr | float:
+    module = data[module_name]
+    pump = module.get_pump()
+    if pump and pump.get_from_module() == module_name:  # transport pump
+        if power_node in (pump.get_power_node(), None):
+            return downstream - evaluate(pump.get_energy_eq().get_level())  # pumps has negative energy equivalents
+        return downstream
 
     energy_equivalent = 0
-    if data[module_name].get_generator():  # hydro generator
-        module_power_node = data[module_name].get_generator().get_power_node()
-        if power_node in (module_power_node, None):
-            energy_equivalent += data[module_name].get_generator().get_energy_eq().get_level()
-    if data[module_name].get_release_to():  # continue from release_to module
-        release_to = data[module_name].get_release_to()
-        energy_equivalent += get_hydro_downstream_energy_equivalent(data, release_to, power_node)
-    return energy_equivalent
+    generator = module.get_generator()
+    if generator and power_node in (generator.get_power_node(), None):  # hydro generator
+        energy_equivalent += evaluate(generator.get_energy_eq().get_level())
+    return energy_equivalent + downstream  # downstream last, so the shared sub-sum is kept as one argument
 
 
 def set_global_energy_equivalent(data: dict[str, Component | TimeVector | Curve | Expr], metakey_energy_eq_downstream: str) -> None:
     """Set the downstream energy equivalent of all HydroModules. Set to 1 for other types of components?."""
+    reservoir_modules = [k for k, v in data.items() if isinstance(v, HydroModule) and v.get_reservoir()]
+    energy_equivalents = get_hydro_downstream_energy_equivalents(data, reservoir_modules)
     for module_name, module in data.items():
         if isinstance(module, HydroModule) and module.get_reservoir():
-            energy_equivalent = get_hydro_downstream_energy_equivalent(data, module_name)
+            energy_equivalent = energy_equivalents[module_name]
             if energy_equivalent == 0:
                 message = f"HydroModule {module_name} has no downstream energy equivalents."
                 module.send_warning_event(message)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -51,6 +52,51 @@ def add_loaders(loaders: set[Loader], model: Model) -> None:
         c.add_loaders(loaders)
 
 
+def prefetch_loaded_ids(loaded_ids: dict[Loader, set[str]], max_workers: int = 4) -> int:
+    """
+    Load data behind ids of each loader in bulk to warm loader caches. Return number of ids loaded.
+
+    Loaders are grouped by source (e.g. file), and each group is loaded by one thread in sorted id
+    order, so reads from one file are sequential while different files are read in parallel,
+    and no loader is used from two threads at once.
+    """
+    _check_type(loaded_ids, "loaded_ids", dict)
+    _check_type(max_workers, "max_workers", int)
+    if max_workers < 1:
+        message = f"Expected max_workers >= 1. Got {max_workers}"
+        raise ValueError(message)
+
+    groups: dict[object, list[tuple[Loader, set[str]]]] = dict()
+    for loader, ids in loaded_ids.items():
+        try:
+            source = loader.get_source()
+        except (NotImplementedError, AttributeError):
+            source = loader
+        groups.setdefault(str(source) if isinstance(source, Path) else source, []).append((loader, ids))
+
+    if not groups:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+        return sum(executor.map(_load_source_group, groups.values()))
+
+
+def _load_source_group(group: list[tuple[Loader, set[str]]]) -> int:
+    from framcore.loaders import CurveLoader, TimeVectorLoader  # noqa: PLC0415
+
+    num_loaded = 0
+    for loader, ids in group:
+        for content_id in sorted(ids):
+            if isinstance(loader, TimeVectorLoader):
+                loader.get_index(content_id)
+                loader.get_values(content_id)
+            elif isinstance(loader, CurveLoader):
+                loader.get_x_axis(content_id)
+                loader.get_y_axis(content_id)
+            num_loaded += 1
+    return num_loaded
+
+
 def replace_loader_path(loaders: set[Loader], old: Path, new: Path) -> None:
     """Replace old path with new for all loaders using old path."""
     from framcore.loaders import FileLoader  # noqa: PLC0415
@@ -0,0 +1,128 @@
+from __future__ import annotations  # NB! added for type hint to work
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from framcore import Base
+from framcore.components import Component, Flow, Node
+from framcore.utils import FlowInfoTable, get_supported_components
+
+if TYPE_CHECKING:
+    from framcore import Model
+
+
+class NodeFlowGraph(Base):
+    """
+    Simplified Node and Flow view of the Components in a Model.
+
+    Holds the result of get_supported_components(components, (Node, Flow), tuple())
+    together with node_to_commodity, node_to_flows and flow_to_nodes indexes,
+    so that analysis utilities can share one decomposition per model state.
+
+    The Node and Flow objects are shared with the view (and for Node and Flow
+    components stored directly in the model, also with the model). Treat them as read only.
+    Use Model.get_node_flow_graph to get a view that is reused until the model changes.
+    """
+
+    def __init__(self, data: dict[str, object]) -> None:
+        """Decompose all Components in data into Node and Flow components and build indexes."""
+        self._check_type(data, dict)
+
+        self._components: dict[str, Component] = {k: v for k, v in data.items() if isinstance(v, Component)}
+        for k in self._components:
+            self._check_type(k, str)
+
+        self._graph: dict[str, Node | Flow] = get_supported_components(self._components, (Node, Flow), tuple())
+
+        self._nodes: dict[str, Node] = {k: v for k, v in self._graph.items() if isinstance(v, Node)}
+        self._flows: dict[str, Flow] = {k: v for k, v in self._graph.items() if isinstance(v, Flow)}
+
+        self._node_to_commodity: dict[str, str] = {k: v.get_commodity() for k, v in self._nodes.items()}
+
+        node_to_flows: dict[str, set[str]] = defaultdict(set)
+        flow_to_nodes: dict[str, set[str]] = defaultdict(set)
+        for flow_id, flow in self._flows.items():
+            for arrow in flow.get_arrows():
+                node_id = arrow.get_node()
+                node_to_flows[node_id].add(flow_id)
+                flow_to_nodes[flow_id].add(node_id)
+        self._node_to_flows: dict[str, set[str]] = dict(node_to_flows)
+        self._flow_to_nodes: dict[str, set[str]] = dict(flow_to_nodes)
+
+        self._flow_info_table: FlowInfoTable | None = None
+        self._top_parent_keys: dict[str, str] | None = None
+
+    def is_view_of(self, data: dict[str, object]) -> bool:
+        """Return True if data holds exactly the same Component objects (by identity) as when the view was created."""
+        n = 0
+        for key, value in data.items():
+            if not isinstance(value, Component):
+                continue
+            if self._components.get(key) is not value:
+                return False
+            n += 1
+        return n == len(self._components)
+
+    def get_components(self) -> dict[str, Component]:
+        """Return the top level Components the view was made from."""
+        return self._components
+
+    def get_graph(self) -> dict[str, Node | Flow]:
+        """Return all Node and Flow components."""
+        return self._graph
+
+    def get_nodes(self) -> dict[str, Node]:
+        """Return all Node components."""
+        return self._nodes
+
+    def get_flows(self) -> dict[str, Flow]:
+        """Return all Flow components."""
+        return self._flows
+
+    def get_node_to_commodity(self) -> dict[str, str]:
+        """Return dict with commodity (str) for each node id (str)."""
+        return self._node_to_commodity
+
+    def get_node_to_flows(self) -> dict[str, set[str]]:
+        """Return dict with ids of all flows with an arrow pointing to each node id. Nodes without flows are missing."""
+        return self._node_to_flows
+
+    def get_flow_to_nodes(self) -> dict[str, set[str]]:
+        """Return dict with ids of all nodes each flow id has an arrow pointing to."""
+        return self._flow_to_nodes
+
+    def get_top_parent_keys(self) -> dict[str, str]:
+        """Return dict with id of the top level Component each Node and Flow id comes from. Made on first call."""
+        if self._top_parent_keys is None:
+            # memo of each visited ancestor, so each parent chain is walked once
+            parent_keys: dict[Component, str] = {v: k for k, v in self._components.items()}
+            top_parent_keys = dict()
+            for k, v in self._graph.items():
+                chain = []
+                c = v
+                while c not in parent_keys:
+                    chain.append(c)
+                    c = c.get_parent()
+                key = parent_keys[c]
+                for c in chain:
+                    parent_keys[c] = key
+                top_parent_keys[k] = key
+            self._top_parent_keys = top_parent_keys
+        return self._top_parent_keys
+
+    def get_flow_info_table(self) -> FlowInfoTable:
+        """Return FlowInfoTable of all flows. Made on first call and shared by later callers."""
+        if self._flow_info_table is None:
+            self._flow_info_table = FlowInfoTable(self._flows, self._node_to_commodity)
+        return self._flow_info_table
+
+
+def get_node_flow_graph(data: Model | NodeFlowGraph | dict[str, object]) -> NodeFlowGraph:
+    """Return data if NodeFlowGraph, cached NodeFlowGraph if data is a Model, else create a new NodeFlowGraph from data."""
+    from framcore import Model  # noqa: PLC0415
+
+    if isinstance(data, NodeFlowGraph):
+        return data
+    if isinstance(data, Model):
+        return data.get_node_flow_graph()
+    return NodeFlowGraph(data)
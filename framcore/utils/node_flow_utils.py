@@ -3,12 +3,16 @@ from __future__ import annotations  # NB! added for type hint to work
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import NDArray
+
 from framcore import Base
 from framcore.components import Component, Flow, Node
 from framcore.utils import get_supported_components
 
 if TYPE_CHECKING:
     from framcore import Model
+    from framcore.utils import NodeFlowGraph
 
 
 class FlowInfo(Base):
@@ -34,6 +38,208 @@ class FlowInfo(Base):
         self.commodity_in = commodity_in
 
 
+class FlowInfoTable(Base):
+    """
+    FlowInfos of many Flows in columnar form.
+
+    Holds the same infos as get_flow_infos for each flow, in the same order, as one row per info in int arrays:
+    flow index, category code, node in/out index and commodity in/out index (-1 where not applicable).
+    The infos are derived from an arrow table (flow, node, direction, commodity) with array operations,
+    so no FlowInfo objects are made unless asked for with get_flow_infos.
+
+    Use NodeFlowGraph.get_flow_info_table to get a table that is shared by all users of the graph.
+    """
+
+    CATEGORIES = ("direct_in", "direct_out", "transport", "conversion")
+    DIRECT_IN = 0
+    DIRECT_OUT = 1
+    TRANSPORT = 2
+    CONVERSION = 3
+
+    def __init__(self, flows: dict[str, Flow], node_to_commodity: dict[str, str]) -> None:
+        """Build arrow table of all flows and classify each pair of opposite arrows and each unpaired arrow."""
+        _check_type(flows, dict)
+        _check_type(node_to_commodity, dict)
+
+        self._flow_ids: list[str] = list(flows)
+        self._flow_to_index: dict[str, int] = {flow_id: i for i, flow_id in enumerate(self._flow_ids)}
+        self._commodities: list[str] = sorted(set(node_to_commodity.values()))
+        commodity_to_index = {commodity: i for i, commodity in enumerate(self._commodities)}
+        self._node_ids: list[str] = []
+        node_to_index: dict[str, int] = dict()
+        node_commodity: list[int] = []
+
+        arrow_flow: list[int] = []
+        arrow_node: list[int] = []
+        arrow_is_ingoing: list[bool] = []
+        for i, (flow_id, flow) in enumerate(flows.items()):
+            for arrow in flow.get_arrows():
+                node_id = arrow.get_node()
+                node = node_to_index.get(node_id)
+                if node is None:
+                    if node_id not in node_to_commodity:
+                        message = f"node_id {node_id} missing from node_to_commodity for flow {flow_id}\n{flow}"
+                        raise RuntimeError(message)
+                    node = len(self._node_ids)
+                    node_to_index[node_id] = node
+                    self._node_ids.append(node_id)
+                    node_commodity.append(commodity_to_index[node_to_commodity[node_id]])
+                arrow_flow.append(i)
+                arrow_node.append(node)
+                arrow_is_ingoing.append(arrow.is_ingoing())
+
+        self._set_rows(
+            len(self._flow_ids),
+            np.array(arrow_flow, dtype=np.int32),
+            np.array(arrow_node, dtype=np.int32),
+            np.array(arrow_is_ingoing, dtype=np.bool_),
+            np.array(node_commodity, dtype=np.int32),
+        )
+
+    def _set_rows(self, num_flows: int, flow: NDArray, node: NDArray, is_ingoing: NDArray, node_commodity: NDArray) -> None:
+        num_arrows = len(flow)
+        position = np.arange(num_arrows)
+
+        # Arrows sorted by (flow, direction), so the opposite arrows of each arrow are one contiguous block.
+        # Index 2 * flow + is_ingoing gives the start and size of the block of that flow and direction.
+        block = 2 * flow + is_ingoing
+        order = np.lexsort((position, block))
+        block_sizes = np.bincount(block, minlength=2 * num_flows)
+        block_starts = np.cumsum(block_sizes) - block_sizes
+        opposite = block ^ 1
+        num_opposite = block_sizes[opposite]
+
+        # All (x, y) pairs of arrows in opposite directions in the order get_flow_infos visits them.
+        x = np.repeat(position, num_opposite)
+        offsets = np.arange(len(x)) - np.repeat(np.cumsum(num_opposite) - num_opposite, num_opposite)
+        y = order[block_starts[opposite[x]] + offsets]
+        arrow_in = np.where(is_ingoing[x], x, y)
+        arrow_out = np.where(is_ingoing[x], y, x)
+        pair_keys = (flow[x], node[arrow_in], node[arrow_out])
+        pairs = _first_occurrences(pair_keys, len(x))
+
+        # Arrows without opposite arrows become direct infos, once per node.
+        unpaired = np.flatnonzero(num_opposite == 0)
+        unpaired = unpaired[_first_occurrences((flow[unpaired], node[unpaired]), len(unpaired))]
+
+        pair_flow = flow[x[pairs]]
+        pair_node_in = node[arrow_in[pairs]]
+        pair_node_out = node[arrow_out[pairs]]
+        is_transport = node_commodity[pair_node_in] == node_commodity[pair_node_out]
+        pair_category = np.where(is_transport, self.TRANSPORT, self.CONVERSION)
+
+        direct_is_ingoing = is_ingoing[unpaired]
+        direct_node = node[unpaired]
+        missing = np.full(len(unpaired), -1, dtype=np.int32)
+
+        row_flow = np.concatenate((pair_flow, flow[unpaired]))
+        rows = np.argsort(row_flow, kind="stable")  # per flow: pairs, then unpaired arrows
+        self._flow = row_flow[rows].astype(np.int32)
+        self._category = np.concatenate((pair_category, np.where(direct_is_ingoing, self.DIRECT_IN, self.DIRECT_OUT)))[rows].astype(np.int8)
+        self._node_in = np.concatenate((pair_node_in, np.where(direct_is_ingoing, direct_node, missing)))[rows].astype(np.int32)
+        self._node_out = np.concatenate((pair_node_out, np.where(direct_is_ingoing, missing, direct_node)))[rows].astype(np.int32)
+        node_commodity = np.append(node_commodity, -1)  # index -1 (no node) gives commodity -1
+        self._commodity_in = node_commodity[self._node_in]
+        self._commodity_out = node_commodity[self._node_out]
+        self._num_infos = np.bincount(self._flow, minlength=num_flows)
+        self._flow_starts = np.cumsum(self._num_infos) - self._num_infos
+
+    def get_flow_ids(self) -> list[str]:
+        """Return flow id of each flow index."""
+        return self._flow_ids
+
+    def get_node_ids(self) -> list[str]:
+        """Return node id of each node index."""
+        return self._node_ids
+
+    def get_commodities(self) -> list[str]:
+        """Return commodity of each commodity index."""
+        return self._commodities
+
+    def get_commodity_index(self, commodity: str) -> int:
+        """Return index of commodity, or -1 if no node has the commodity."""
+        try:
+            return self._commodities.index(commodity)
+        except ValueError:
+            return -1
+
+    def get_num_rows(self) -> int:
+        """Return total number of infos."""
+        return len(self._flow)
+
+    def get_flow(self) -> NDArray:
+        """Return flow index of each info."""
+        return self._flow
+
+    def get_category(self) -> NDArray:
+        """Return category code of each info. See CATEGORIES."""
+        return self._category
+
+    def get_node_in(self) -> NDArray:
+        """Return node index of ingoing arrow of each info, or -1."""
+        return self._node_in
+
+    def get_node_out(self) -> NDArray:
+        """Return node index of outgoing arrow of each info, or -1."""
+        return self._node_out
+
+    def get_commodity_in(self) -> NDArray:
+        """Return commodity index of ingoing arrow of each info, or -1."""
+        return self._commodity_in
+
+    def get_commodity_out(self) -> NDArray:
+        """Return commodity index of outgoing arrow of each info, or -1."""
+        return self._commodity_out
+
+    def get_num_infos(self) -> NDArray:
+        """Return number of infos of each flow."""
+        return self._num_infos
+
+    def get_rows_of_commodity(self, commodity: str) -> NDArray:
+        """Return rows where the ingoing or outgoing arrow has commodity, in flow order."""
+        index = self.get_commodity_index(commodity)
+        if index < 0:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero((self._commodity_in == index) | (self._commodity_out == index))
+
+    def get_single_info_rows(self, category: int, commodity: str, is_ingoing: bool = True) -> NDArray:
+        """Return rows of flows with exactly one info, which has category and commodity on the ingoing (or outgoing) side."""
+        index = self.get_commodity_index(commodity)
+        if index < 0:
+            return np.empty(0, dtype=np.intp)
+        commodities = self._commodity_in if is_ingoing else self._commodity_out
+        mask = (self._num_infos[self._flow] == 1) & (self._category == category) & (commodities == index)
+        return np.flatnonzero(mask)
+
+    def get_flow_info(self, row: int) -> FlowInfo:
+        """Return FlowInfo object of row."""
+        node_in = int(self._node_in[row])
+        node_out = int(self._node_out[row])
+        return FlowInfo(
+            self.CATEGORIES[self._category[row]],
+            node_out=self._node_ids[node_out] if node_out >= 0 else None,
+            commodity_out=self._commodities[self._commodity_out[row]] if node_out >= 0 else None,
+            node_in=self._node_ids[node_in] if node_in >= 0 else None,
+            commodity_in=self._commodities[self._commodity_in[row]] if node_in >= 0 else None,
+        )
+
+    def get_flow_infos(self, flow_id: str) -> list[FlowInfo]:
+        """Return same FlowInfos as get_flow_infos for the flow."""
+        i = self._flow_to_index[flow_id]
+        start = int(self._flow_starts[i])
+        return [self.get_flow_info(row) for row in range(start, start + int(self._num_infos[i]))]
+
+
+def _first_occurrences(keys: tuple[NDArray, ...], n: int) -> NDArray:
+    """Return sorted positions of the first occurrence of each distinct key tuple."""
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    order = np.lexsort((np.arange(n), *reversed(keys)))
+    is_first = np.ones(n, dtype=np.bool_)
+    is_first[1:] = np.any([k[order][1:] != k[order][:-1] for k in keys], axis=0)
+    return np.sort(order[is_first])
+
+
 def _check_type(value: object, expected) -> None:  # noqa: ANN001
     assert isinstance(value, expected), f"Expected {expected}. Got {type(value.__name__)}."
 
@@ -148,23 +354,18 @@ def get_flow_infos(flow: Flow, node_to_commodity: dict[str, str]) -> list[FlowIn
     return infos
 
 
-def get_component_to_nodes(data: Model | dict[str, object]) -> dict[str, set[str]]:
+def get_component_to_nodes(data: Model | NodeFlowGraph | dict[str, object]) -> dict[str, set[str]]:
     """For each str key in data where value is a Comonent find all Node id str in data directly connected to the Component."""
     from framcore import Model  # noqa: PLC0415
+    from framcore.utils import NodeFlowGraph, get_node_flow_graph  # noqa: PLC0415
 
-    _check_type(data, Model | dict)
-
-    if isinstance(data, Model):
-        data = data.get_data()
-
-    components = {k: v for k, v in data.items() if isinstance(v, Component)}
-    for k in components:
-        assert isinstance(k, str), f"Got invalid key {k}"
+    _check_type(data, Model | NodeFlowGraph | dict)
 
-    g = get_supported_components(components, (Node, Flow), tuple())
+    graph = get_node_flow_graph(data)
 
-    nodes = {k: v for k, v in g.items() if isinstance(v, Node)}
-    flows = {k: v for k, v in g.items() if isinstance(v, Flow)}
+    components = graph.get_components()
+    nodes = graph.get_nodes()
+    flows = graph.get_flows()
 
     domain_nodes = {k: v for k, v in nodes.items() if (k in components) and isinstance(v, Node)}
     assert all(isinstance(v, Node) for v in domain_nodes.values())
@@ -182,40 +383,33 @@ def get_component_to_nodes(data: Model | dict[str, object]) -> dict[str, set[str
     return out
 
 
-def get_transports_by_commodity(data: Model | dict[str, object], commodity: str) -> dict[str, tuple[str, str]]:
+def get_transports_by_commodity(data: Model | NodeFlowGraph | dict[str, object], commodity: str) -> dict[str, tuple[str, str]]:
     """Return dict with key component_id and value (from_node_id, to_node_id) where both nodes belong to given commodity."""
     from framcore import Model  # noqa: PLC0415
+    from framcore.utils import NodeFlowGraph, get_node_flow_graph  # noqa: PLC0415
 
-    _check_type(data, Model | dict)
+    _check_type(data, Model | NodeFlowGraph | dict)
     _check_type(commodity, str)
 
-    if isinstance(data, Model):
-        data = data.get_data()
+    graph = get_node_flow_graph(data)
 
-    components = {k: v for k, v in data.items() if isinstance(v, Component)}
-    for k in components:
-        assert isinstance(k, str), f"Got invalid key {k}"
-
-    node_to_commodity = get_node_to_commodity(components)
-
-    g = get_supported_components(components, (Node, Flow), tuple())
+    components = graph.get_components()
+    flows = graph.get_flows()
 
-    flows = {k: v for k, v in g.items() if isinstance(v, Flow)}
+    table = graph.get_flow_info_table()
+    flow_ids = table.get_flow_ids()
+    node_ids = table.get_node_ids()
+    flow_index = table.get_flow()
+    node_in = table.get_node_in()
+    node_out = table.get_node_out()
 
     parent_keys = {v: k for k, v in components.items()}
 
     out = dict()
-    for flow in flows.values():
+    for row in table.get_single_info_rows(FlowInfoTable.TRANSPORT, commodity).tolist():
+        flow = flows[flow_ids[flow_index[row]]]
         parent_key = parent_keys[flow.get_top_parent()]
-        infos = get_flow_infos(flow, node_to_commodity)
-        if len(infos) != 1:
-            continue
-        info = infos[0]
-        if info.category != "transport":
-            continue
-        if info.commodity_in != commodity:
-            continue
-        out[parent_key] = (info.node_out, info.node_in)
+        out[parent_key] = (node_ids[node_out[row]], node_ids[node_in[row]])
 
     return out
 
@@ -4,30 +4,40 @@ from collections import defaultdict
 
 from framcore import Model
 from framcore.components import Component, Flow, Node
-from framcore.utils import get_supported_components
+from framcore.utils import NodeFlowGraph, get_node_flow_graph
 
 
-# TODO: Finish implementation, test and demo
-def get_storage_subsystems(domain_components: dict[str, Component] | Model) -> dict[str, set[str]]:
-    if isinstance(domain_components, Model):
-        domain_components = {k: v for k, v in domain_components.get_data() if isinstance(v, Component)}
+def get_storage_subsystems(
+    domain_components: dict[str, Component] | Model | NodeFlowGraph,
+    include_boundaries: bool = False,
+) -> dict[str, set[str]]:
+    """
+    Group domain components into storage subsystems.
+
+    Returns dict[subsystem_id, member_domain_component_ids]. The subsystem_id is the id of the first storage Node
+    of the subsystem in the Node and Flow graph (see get_one_commodity_storage_subsystems), and the members are the
+    ids of the top level components in domain_components the subsystem is made from.
 
+    If include_boundaries is False, components only connected to the subsystem through nodes of another commodity
+    (e.g. the power node of a hydro generator) are not members, so each domain component belongs to at most
+    one subsystem of each commodity.
+    """
     # translate domain_components to graph consisting of just Flow and Node components
-    graph: dict[str, Flow | Node] = get_supported_components(
-        components=domain_components,
-        supported_types=(Node, Flow),
-    )
+    graph = get_node_flow_graph(domain_components)
 
-    abstract_subsystems, __ = get_one_commodity_storage_subsystems(graph, include_boundaries=True)
+    abstract_subsystems = get_one_commodity_storage_subsystems(graph, include_boundaries)
 
-    # TODO: Use Component.get_top_level to lift abstract_subsystems back to domain_components
-    domain_subsystems = abstract_subsystems
+    # lift abstract_subsystems back to domain_components
+    top_parent_keys = graph.get_top_parent_keys()
+    domain_subsystems: dict[str, set[str]] = dict()
+    for subsystem_id, (__, member_component_ids, __) in abstract_subsystems.items():
+        domain_subsystems[subsystem_id] = {top_parent_keys[k] for k in member_component_ids}
 
     return domain_subsystems
 
 
 def get_one_commodity_storage_subsystems(
-    graph: dict[str, Node | Flow],
+    graph: dict[str, Node | Flow] | NodeFlowGraph,
     include_boundaries: bool,
 ) -> dict[str, tuple[str, set[str], set[str]]]:
     """
@@ -42,66 +52,95 @@ def get_one_commodity_storage_subsystems(
 
     If include_boundaries is False only nodes with same commodity as storage_node will
     be included in the subsystem.
-    """
-    if not all(isinstance(c, Flow | Node) for c in graph.values()):
-        invalid = {k: v for k, v in graph.items() if not isinstance(v, Flow | Node)}
-        message = f"All values in graph must be Flow or Node objects. Found invalid objects: {invalid}"
-        raise ValueError(message)
 
-    flows: dict[str, Flow] = {k: v for k, v in graph.items() if isinstance(v, Flow)}
-    nodes: dict[str, Node] = {k: v for k, v in graph.items() if isinstance(v, Node)}
-
-    storage_nodes: dict[str, Node] = {k: v for k, v in nodes.items() if v.get_storage()}
+    Pass a NodeFlowGraph (e.g. from Model.get_node_flow_graph) to reuse its node and flow adjacency.
+    Each subsystem is found with one traversal, so the total work is linear in the size of the graph.
+    """
+    if isinstance(graph, NodeFlowGraph):
+        nodes = graph.get_nodes()
+        node_to_flows = graph.get_node_to_flows()
+        flow_to_nodes = graph.get_flow_to_nodes()
+    else:
+        nodes, node_to_flows, flow_to_nodes = _get_adjacency(graph)
 
-    node_to_flows: dict[str, set[str]] = defaultdict(set)
-    flow_to_nodes: dict[str, set[str]] = defaultdict(set)
-    for flow_id, flow in flows.items():
-        for arrow in flow.get_arrows():
-            node_id = arrow.get_node()
-            node_to_flows[node_id].add(flow_id)
-            flow_to_nodes[flow_id].add(node_id)
+    node_to_commodity: dict[str, str] = {k: v.get_commodity() for k, v in nodes.items()}
 
     out = dict()
     allocated: set[str] = set()
-    for storage_node_id, storage_node in storage_nodes.items():
-        if storage_node_id in allocated:
+    for storage_node_id, storage_node in nodes.items():
+        if storage_node_id in allocated or not storage_node.get_storage():
             continue
 
         subsystem_id = storage_node_id
-        storage_commodity = storage_node.get_commodity()
+        storage_commodity = node_to_commodity[storage_node_id]
+
+        member_node_ids, member_flow_ids, boundary_node_ids = _traverse_subsystem(
+            storage_node_id,
+            storage_commodity,
+            node_to_flows,
+            flow_to_nodes,
+            node_to_commodity,
+        )
+        allocated |= member_node_ids
+
+        boundary_commodities = {node_to_commodity[k] for k in boundary_node_ids}
+        member_component_ids = member_node_ids | member_flow_ids
+        if include_boundaries:
+            member_component_ids |= boundary_node_ids
 
-        member_component_ids: set[str] = set()
-        boundary_commodities: set[str] = set()
+        out[subsystem_id] = (storage_commodity, member_component_ids, boundary_commodities)
 
-        visited: set[str] = set()
-        remaining: set[str] = set()
+    return out
 
-        remaining.add(storage_node_id)
 
-        while remaining:
-            component_id = remaining.pop()
-            if component_id in visited:
+def _traverse_subsystem(
+    storage_node_id: str,
+    storage_commodity: str,
+    node_to_flows: dict[str, set[str]],
+    flow_to_nodes: dict[str, set[str]],
+    node_to_commodity: dict[str, str],
+) -> tuple[set[str], set[str], set[str]]:
+    """Return member node ids, member flow ids and boundary node ids of the subsystem of storage_node_id."""
+    member_node_ids: set[str] = {storage_node_id}
+    member_flow_ids: set[str] = set()
+    boundary_node_ids: set[str] = set()
+
+    remaining: list[str] = [storage_node_id]
+
+    # nodes of storage_commodity are expanded, nodes of other commodities are boundaries
+    while remaining:
+        node_id = remaining.pop()
+        for flow_id in node_to_flows.get(node_id, ()):
+            if flow_id in member_flow_ids:
                 continue
+            member_flow_ids.add(flow_id)
+            for other_id in flow_to_nodes[flow_id]:
+                if other_id not in node_to_commodity:
+                    continue  # arrow to node missing from graph
+                if node_to_commodity[other_id] != storage_commodity:
+                    boundary_node_ids.add(other_id)
+                elif other_id not in member_node_ids:
+                    member_node_ids.add(other_id)
+                    remaining.append(other_id)
 
-            visited.add(component_id)
-
-            if component_id in nodes:
-                node: Node = nodes[component_id]
-                node_commodity = node.get_commodity()
+    return member_node_ids, member_flow_ids, boundary_node_ids
 
-                if node_commodity == storage_commodity:
-                    allocated.add(component_id)
-                    remaining.update(node_to_flows.get(component_id, set()))
-                else:
-                    boundary_commodities.add(node_commodity)
 
-                if include_boundaries or node_commodity == storage_commodity:
-                    member_component_ids.add(component_id)
+def _get_adjacency(graph: dict[str, Node | Flow]) -> tuple[dict[str, Node], dict[str, set[str]], dict[str, set[str]]]:
+    if not all(isinstance(c, Flow | Node) for c in graph.values()):
+        invalid = {k: v for k, v in graph.items() if not isinstance(v, Flow | Node)}
+        message = f"All values in graph must be Flow or Node objects. Found invalid objects: {invalid}"
+        raise ValueError(message)
 
-            else:
-                remaining.update(flow_to_nodes.get(component_id, set()))
-                member_component_ids.add(component_id)
+    flows: dict[str, Flow] = {k: v for k, v in graph.items() if isinstance(v, Flow)}
+    nodes: dict[str, Node] = {k: v for k, v in graph.items() if isinstance(v, Node)}
 
-        out[subsystem_id] = (storage_commodity, member_component_ids, boundary_commodities)
+    node_to_flows: dict[str, set[str]] = defaultdict(set)
+    flow_to_nodes: dict[str, set[str]] = defaultdict(set)
+    for flow_id, flow in flows.items():
+        for arrow in flow.get_arrows():
+            node_id = arrow.get_node()
+            node_to_flows[node_id].add(flow_id)
+            flow_to_nodes[flow_id].add(node_id)
 
-    return out
+    return nodes, node_to_flows, flow_to_nodes
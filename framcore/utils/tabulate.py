@@ -0,0 +1,289 @@
+"""Columnar export of component attributes, e.g. to build input tables for solvers."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from framcore import Base
+from framcore.attributes import LevelProfile
+from framcore.components import Component
+from framcore.expressions import get_profile_vector
+from framcore.expressions._utils import _load_model_and_create_model_db
+from framcore.timeindexes import FixedFrequencyTimeIndex, SinglePeriodTimeIndex
+
+if TYPE_CHECKING:
+    from framcore import Model
+    from framcore.querydbs import QueryDB
+
+
+class TableColumn(Base):
+    """
+    Specification of one column in a ComponentTable.
+
+    The path is a dotted list of getter names without the get_ prefix, e.g. "max_capacity" calls
+    component.get_max_capacity() and "generator.energy_eq" calls component.get_generator().get_energy_eq().
+
+    Kinds:
+        value: One float per component. LevelProfile values are the level (plus intercept) over data_dim.
+            Other values are stored as they are (numbers as float, e.g. dicts of arrows in an object column).
+        vector: Row of scenario values level * profile + intercept along scen_dim. Only for LevelProfile.
+        profile: Row of profile values along scen_dim (ones if no profile). Only for LevelProfile.
+
+    Missing values (None along the path, or a LevelProfile without level) become NaN, or None in object columns.
+    """
+
+    VALUE = "value"
+    VECTOR = "vector"
+    PROFILE = "profile"
+
+    _KINDS = (VALUE, VECTOR, PROFILE)
+
+    def __init__(self, path: str, unit: str | None = None, kind: str = VALUE, name: str | None = None) -> None:
+        """
+        Create column specification.
+
+        Args:
+            path (str): Dotted getter names without get_ prefix, e.g. "generator.energy_eq".
+            unit (str | None): Unit of LevelProfile values. None for unitless attributes.
+            kind (str): value, vector or profile.
+            name (str | None): Column name. Defaults to path.
+
+        """
+        self._check_type(path, str)
+        self._check_type(unit, (str, type(None)))
+        self._check_type(name, (str, type(None)))
+        if kind not in self._KINDS:
+            message = f"Expected kind in {self._KINDS}, got {kind}."
+            raise ValueError(message)
+        self._path = path
+        self._getters = tuple(f"get_{part}" for part in path.split("."))
+        self._unit = unit
+        self._kind = kind
+        self._name = path if name is None else name
+
+    def get_path(self) -> str:
+        """Return dotted getter path."""
+        return self._path
+
+    def get_unit(self) -> str | None:
+        """Return unit of LevelProfile values."""
+        return self._unit
+
+    def get_kind(self) -> str:
+        """Return value, vector or profile."""
+        return self._kind
+
+    def get_name(self) -> str:
+        """Return column name."""
+        return self._name
+
+    def resolve(self, component: Component) -> object:
+        """Follow the getter path from component. Return None if an object along the path is None."""
+        obj = component
+        for getter in self._getters:
+            if obj is None:
+                return None
+            try:
+                method = getattr(obj, getter)
+            except AttributeError:
+                message = f"Column '{self._name}': {type(obj).__name__} has no method {getter} (path '{self._path}')."
+                raise ValueError(message) from None
+            obj = method()
+        return obj
+
+
+class ComponentTable:
+    """
+    Columns of equal length with one row per component.
+
+    The id column holds component ids. Value columns are 1-D arrays, vector and profile columns are C-contiguous
+    2-D arrays with one row per component, so each can be handed to a solver back-end as one buffer.
+    """
+
+    ID_COLUMN = "id"
+
+    def __init__(self, columns: dict[str, NDArray]) -> None:
+        """Create table from columns. Must include the id column, and all columns must have the same number of rows."""
+        if self.ID_COLUMN not in columns:
+            message = f"Expected column '{self.ID_COLUMN}', got {list(columns)}."
+            raise ValueError(message)
+        num_rows = len(columns[self.ID_COLUMN])
+        for name, column in columns.items():
+            if len(column) != num_rows:
+                message = f"Column '{name}' has {len(column)} rows, expected {num_rows}."
+                raise ValueError(message)
+        self._columns = columns
+
+    def __repr__(self) -> str:
+        """Return short representation."""
+        return f"{type(self).__name__}(num_rows={self.get_num_rows()}, columns={self.get_column_names()})"
+
+    def get_num_rows(self) -> int:
+        """Return number of rows (components)."""
+        return len(self._columns[self.ID_COLUMN])
+
+    def get_column_names(self) -> list[str]:
+        """Return column names, starting with the id column."""
+        return list(self._columns)
+
+    def get_ids(self) -> NDArray:
+        """Return the id column."""
+        return self._columns[self.ID_COLUMN]
+
+    def get_column(self, name: str) -> NDArray:
+        """Return column by name."""
+        if name not in self._columns:
+            message = f"Table has no column '{name}'. Columns: {self.get_column_names()}."
+            raise KeyError(message)
+        return self._columns[name]
+
+    def to_dict(self) -> dict[str, NDArray]:
+        """Return dict of columns (not copied)."""
+        return dict(self._columns)
+
+    def to_arrow(self) -> object:
+        """Return pyarrow.Table. 2-D columns become fixed size list columns. Requires pyarrow."""
+        try:
+            pa = importlib.import_module("pyarrow")
+        except ImportError as e:
+            message = "ComponentTable.to_arrow requires pyarrow. Install pyarrow or use to_dict."
+            raise ImportError(message) from e
+        arrays = {}
+        for name, column in self._columns.items():
+            if column.ndim == 2:  # noqa: PLR2004
+                arrays[name] = pa.FixedSizeListArray.from_arrays(pa.array(column.ravel()), column.shape[1])
+            else:
+                arrays[name] = pa.array(column)
+        return pa.table(arrays)
+
+
+def tabulate(
+    db: QueryDB | Model,
+    component_type: type[Component] | tuple[type[Component], ...],
+    columns: list[TableColumn],
+    data_dim: SinglePeriodTimeIndex,
+    scen_dim: FixedFrequencyTimeIndex,
+    ids: list[str] | None = None,
+    is_float32: bool = False,
+) -> ComponentTable:
+    """
+    Evaluate columns for all components of component_type in one pass over the model data.
+
+    Args:
+        db (QueryDB | Model): Model or QueryDB to evaluate attributes in. Use a CacheDB to reuse shared expressions.
+        component_type (type | tuple): Tabulate components that are instances of component_type.
+        columns (list[TableColumn]): Columns to evaluate.
+        data_dim (SinglePeriodTimeIndex): Period of level values.
+        scen_dim (FixedFrequencyTimeIndex): Scenario horizon of vector and profile columns.
+        ids (list[str] | None): Ids of components to tabulate, in this order. Defaults to all components of
+            component_type in model data order.
+        is_float32 (bool): Use float32 for vector and profile columns.
+
+    Returns:
+        ComponentTable: Table with the id column followed by the given columns.
+
+    """
+    if not isinstance(data_dim, SinglePeriodTimeIndex):
+        message = f"Expected SinglePeriodTimeIndex for data_dim, got {type(data_dim).__name__}."
+        raise TypeError(message)
+    if not isinstance(scen_dim, FixedFrequencyTimeIndex):
+        message = f"Expected FixedFrequencyTimeIndex for scen_dim, got {type(scen_dim).__name__}."
+        raise TypeError(message)
+    names = [column.get_name() for column in columns]
+    if len(set(names)) != len(names) or ComponentTable.ID_COLUMN in names:
+        message = f"Column names must be unique and not '{ComponentTable.ID_COLUMN}', got {names}."
+        raise ValueError(message)
+
+    db = _load_model_and_create_model_db(db)
+    components = _get_components(db, component_type, ids)
+
+    num_rows = len(components)
+    num_periods = scen_dim.get_num_periods()
+    dtype = np.float32 if is_float32 else np.float64
+    buffers: list[NDArray | list] = [
+        [None] * num_rows if column.get_kind() == TableColumn.VALUE else np.empty((num_rows, num_periods), dtype=dtype) for column in columns
+    ]
+
+    for row, component in enumerate(components.values()):
+        for column, buffer in zip(columns, buffers, strict=True):
+            obj = column.resolve(component)
+            if column.get_kind() == TableColumn.VALUE:
+                buffer[row] = _get_value(column, obj, db, data_dim, scen_dim)
+            else:
+                _write_row(column, obj, db, data_dim, scen_dim, is_float32, buffer[row])
+
+    table = {ComponentTable.ID_COLUMN: np.array(list(components), dtype=np.str_)}
+    for column, buffer in zip(columns, buffers, strict=True):
+        table[column.get_name()] = _to_array(buffer) if column.get_kind() == TableColumn.VALUE else buffer
+    return ComponentTable(table)
+
+
+def _get_components(
+    db: QueryDB,
+    component_type: type[Component] | tuple[type[Component], ...],
+    ids: list[str] | None,
+) -> dict[str, Component]:
+    if ids is None:
+        return {key: obj for key, obj in db.get_data().items() if isinstance(obj, component_type)}
+    components = {}
+    for key in ids:
+        obj = db.get(key)
+        if not isinstance(obj, component_type):
+            message = f"Expected {component_type} for '{key}', got {type(obj).__name__}."
+            raise TypeError(message)
+        components[key] = obj
+    return components
+
+
+def _get_value(
+    column: TableColumn,
+    obj: object,
+    db: QueryDB,
+    data_dim: SinglePeriodTimeIndex,
+    scen_dim: FixedFrequencyTimeIndex,
+) -> object:
+    if isinstance(obj, LevelProfile):
+        if not obj.has_level():
+            return None
+        return obj.get_data_value(db, scen_dim, data_dim, column.get_unit())
+    return obj
+
+
+def _write_row(
+    column: TableColumn,
+    obj: object,
+    db: QueryDB,
+    data_dim: SinglePeriodTimeIndex,
+    scen_dim: FixedFrequencyTimeIndex,
+    is_float32: bool,
+    out: NDArray,
+) -> None:
+    if obj is None or (isinstance(obj, LevelProfile) and column.get_kind() == TableColumn.VECTOR and not obj.has_level()):
+        out.fill(np.nan)
+        return
+    if not isinstance(obj, LevelProfile):
+        message = f"Column '{column.get_name()}': expected LevelProfile at path '{column.get_path()}', got {type(obj).__name__}."
+        raise TypeError(message)
+    if column.get_kind() == TableColumn.VECTOR:
+        obj.get_scenario_vector(db, scen_dim, data_dim, column.get_unit(), is_float32=is_float32, out=out)
+        return
+    profile = obj.get_profile()
+    if profile is None:
+        out.fill(1.0)
+        return
+    out[:] = get_profile_vector(profile, db, data_dim, scen_dim, is_zero_one=obj.is_max_and_zero_one(), is_float32=is_float32)
+
+
+def _to_array(values: list) -> NDArray:
+    """Make float64 (NaN for None), bool or str array if values allow, otherwise object array."""
+    if values and all(isinstance(v, bool | np.bool_) for v in values):
+        return np.array(values, dtype=np.bool_)
+    if all(v is None or (isinstance(v, int | float | np.number) and not isinstance(v, bool)) for v in values):
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    if all(isinstance(v, str) for v in values):
+        return np.array(values, dtype=np.str_)
+    return np.array(values, dtype=object)
@@ -0,0 +1,132 @@
+import sys
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from framcore import Model
+from framcore.attributes import AvgFlowVolume, MaxFlowVolume
+from framcore.components import Demand, Node, Transmission
+from framcore.metadata import Member
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.timevectors import ConstantTimeVector
+from framcore.utils import get_regional_volumes
+
+
+def _add_node(model: Model, name: str, area: str) -> None:
+    node = Node(commodity="Power")
+    node.add_meta("area", Member(area))
+    model.add(name, node)
+
+
+def _add_demand(model: Model, name: str, node: str, value: float, category: str) -> None:
+    demand = Demand(node=node, consumption=AvgFlowVolume(level=ConstantTimeVector(value, unit="MW", is_max_level=False)))
+    demand.add_meta("consumer", Member(category))
+    model.add(name, demand)
+
+
+def _setup() -> Model:
+    model = Model()
+    _add_node(model, "n1", "A")
+    _add_node(model, "n2", "A")
+    _add_node(model, "n3", "B")
+    _add_demand(model, "d1", "n1", 100.0, "household")
+    _add_demand(model, "d2", "n2", 50.0, "household")
+    _add_demand(model, "d3", "n2", 10.0, "industry")
+    _add_demand(model, "d4", "n3", 7.0, "industry")
+    model.add(
+        "line",
+        Transmission(
+            from_node="n1",
+            to_node="n3",
+            max_capacity=MaxFlowVolume(level=ConstantTimeVector(1000.0, unit="MW", is_max_level=True)),
+            ingoing_volume=AvgFlowVolume(level=ConstantTimeVector(20.0, unit="MW", is_max_level=False)),
+            outgoing_volume=AvgFlowVolume(level=ConstantTimeVector(20.0, unit="MW", is_max_level=False)),
+        ),
+    )
+    return model
+
+
+def test_get_regional_volumes_sums_flows_per_category() -> None:
+    model = _setup()
+    scenario_period = ProfileTimeIndex(1981, 2, timedelta(weeks=1), is_52_week_years=True)
+
+    volumes = get_regional_volumes(
+        model,
+        commodity="Power",
+        node_category="area",
+        production_category="producer",
+        consumption_category="consumer",
+        data_period=ModelYear(2025),
+        scenario_period=scenario_period,
+        unit="MW",
+    )
+
+    consumption = volumes.get_consumption()
+    num_periods = scenario_period.get_num_periods()
+
+    assert set(consumption) == {"A", "B"}
+    assert consumption["A"]["household"].shape == (num_periods,)
+    assert np.allclose(consumption["A"]["household"], 150.0)
+    assert np.allclose(consumption["A"]["industry"], 10.0)
+    assert np.allclose(consumption["B"]["industry"], 7.0)
+    assert consumption["A"]["household"].dtype == np.float32
+
+    assert set(volumes.get_import()) == {"B"}
+    assert set(volumes.get_export()) == {"A"}
+    assert np.allclose(volumes.get_import()["B"]["A"], 20.0)
+    assert np.allclose(volumes.get_export()["A"]["B"], 20.0)
+
+
+def _get_volumes(model: Model) -> dict[str, dict[str, dict[str, np.ndarray]]]:
+    volumes = get_regional_volumes(
+        model,
+        commodity="Power",
+        node_category="area",
+        production_category="producer",
+        consumption_category="consumer",
+        data_period=ModelYear(2025),
+        scenario_period=ProfileTimeIndex(1981, 2, timedelta(weeks=1), is_52_week_years=True),
+        unit="MW",
+        is_float32=False,
+    )
+    return {
+        "consumption": volumes.get_consumption(),
+        "import": volumes.get_import(),
+        "export": volumes.get_export(),
+    }
+
+
+def test_get_regional_volumes_in_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = _setup()
+    unblocked = _get_volumes(model)
+
+    # room for one flow vector per block, so every task is evaluated in its own block
+    monkeypatch.setattr(sys.modules["framcore.utils.get_regional_volumes"], "_BATCH_BYTES", 8)
+    blocked = _get_volumes(model)
+
+    assert blocked.keys() == unblocked.keys()
+    for group, categories in unblocked.items():
+        assert blocked[group].keys() == categories.keys()
+        for category, subcategories in categories.items():
+            assert blocked[group][category].keys() == subcategories.keys()
+            for subcategory, vector in subcategories.items():
+                assert np.array_equal(blocked[group][category][subcategory], vector)
+
+    assert np.allclose(blocked["consumption"]["A"]["household"], 150.0)
+    assert np.allclose(blocked["import"]["B"]["A"], 20.0)
+
+
+def test_categories_without_subcategories_are_kept() -> None:
+    module = sys.modules["framcore.utils.get_regional_volumes"]
+    flow_dicts = [({"A": {"household": []}, "B": {}}, "consumption"), ({"C": {}}, "import")]
+    targets = {("consumption", "A", "household"): 0}
+    target_matrix = np.ones((1, 3))
+
+    volumes = module._get_regional_volumes_from_targets(flow_dicts, targets, target_matrix)
+
+    assert volumes.get_consumption().keys() == {"A", "B"}
+    assert np.array_equal(volumes.get_consumption()["A"]["household"], np.ones(3))
+    assert volumes.get_consumption()["B"] == {}
+    assert volumes.get_import() == {"C": {}}
+    assert volumes.get_production() == {}
@@ -0,0 +1,59 @@
+import copy
+import pickle
+
+import pytest
+
+from framcore.attributes import Arrow, AvgFlowVolume, Conversion, HydroPump, Price, StockVolume, Storage
+from framcore.components import Demand, HydroModule, Node
+from framcore.metadata import Member
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        AvgFlowVolume(),
+        Price(value=10, unit="EUR/MWh"),
+        Arrow("node", True),
+        Storage(StockVolume()),
+        Member("area"),
+        Node("Power"),
+        HydroModule(),
+    ],
+    ids=type,
+)
+def test_compact_instances_have_no_dict(obj: object) -> None:
+    assert not hasattr(obj, "__dict__")
+    copied = pickle.loads(pickle.dumps(obj))
+    assert copied.get_fingerprint_default().get_hash() == obj.get_fingerprint_default().get_hash()
+    assert repr(copy.deepcopy(obj)) == repr(obj)
+
+
+def test_fingerprint_and_repr_use_slots() -> None:
+    assert repr(Arrow("node", True)) == "Arrow(_is_ingoing=True, _node=node)"
+    member = Member("area")
+    assert member.get_fingerprint_default().get_hash() != Member("other").get_fingerprint_default().get_hash()
+
+
+def test_subclass_without_slots_keeps_dict() -> None:
+    class TaggedNode(Node):
+        def __init__(self, tag: str) -> None:
+            super().__init__("Power")
+            self.tag = tag
+
+    node = TaggedNode("a")
+    fields = dict(node._get_fields())
+    assert fields["tag"] == "a"
+    assert fields["_commodity"] == "Power"
+    assert node.get_fingerprint_default().get_hash() != TaggedNode("b").get_fingerprint_default().get_hash()
+
+
+def test_setters_write_declared_fields() -> None:
+    demand = Demand("a")
+    demand.set_node("b")
+    assert demand.get_node() == "b"
+
+    pump = HydroPump("power", "lower", "upper", AvgFlowVolume(), Conversion(value=1.0), power_capacity=AvgFlowVolume())
+    pump.set_head_min("head")
+    pump.set_qmax("qmax")
+    assert pump.get_head_min() is not None
+    assert pump.get_q_max() is not None
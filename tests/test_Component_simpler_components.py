@@ -0,0 +1,77 @@
+import copy
+import pickle
+
+from framcore.attributes import Conversion, HydroGenerator, MaxFlowVolume
+from framcore.components import Demand, Flow, HydroModule, Node
+from framcore.metadata import Member
+from framcore.utils import get_supported_components
+
+
+def _module() -> HydroModule:
+    return HydroModule(
+        release_to="lower",
+        release_capacity=MaxFlowVolume(level="capacity"),
+        generator=HydroGenerator("power", Conversion(value=1.0)),
+    )
+
+
+def test_children_are_reused_until_changed() -> None:
+    demand = Demand("a")
+    children = demand.get_simpler_components("d")
+    assert demand.get_simpler_components("d")["d_Flow"] is children["d_Flow"]
+    assert demand.get_simpler_components("other")["other_Flow"] is not children["d_Flow"]
+
+    components = {"d": demand}
+    first = get_supported_components(components, (Node, Flow), tuple())
+    assert get_supported_components(components, (Node, Flow), tuple())["d_Flow"] is first["d_Flow"]
+
+    demand.set_node("b")
+    flow = demand.get_simpler_components("d")["d_Flow"]
+    assert flow is not first["d_Flow"]
+    assert flow.get_main_node() == "b"
+
+
+def test_meta_and_replace_node_clear_cache() -> None:
+    module = _module()
+    children = module.get_simpler_components("m")
+
+    module.add_meta("area", Member("north"))
+    with_meta = module.get_simpler_components("m")
+    assert with_meta["m_release_flow"] is not children["m_release_flow"]
+    assert with_meta["m_release_flow"].get_meta("area") == Member("north")
+
+    module.replace_node("power", "power2")
+    nodes = {a.get_node() for a in module.get_simpler_components("m")["m_release_flow"].get_arrows()}
+    assert "power2" in nodes
+
+
+def test_nested_edit_needs_clear_simpler_components() -> None:
+    module = _module()
+    components = {"m": module}
+    get_supported_components(components, (Node, Flow), tuple())
+
+    module.get_generator().set_power_node("power2")
+    nodes = {a.get_node() for a in get_supported_components(components, (Node, Flow), tuple())["m_release_flow"].get_arrows()}
+    assert "power" in nodes
+    assert "power2" not in nodes
+
+    module.clear_simpler_components()
+    nodes = {a.get_node() for a in get_supported_components(components, (Node, Flow), tuple())["m_release_flow"].get_arrows()}
+    assert "power2" in nodes
+
+
+def test_cache_is_not_state() -> None:
+    module = _module()
+    fingerprint = module.get_fingerprint_default().get_hash()
+    text = repr(module)
+    pickled = pickle.dumps(module)
+
+    children = module.get_simpler_components("m")
+    assert module.get_fingerprint_default().get_hash() == fingerprint
+    assert repr(module) == text
+    assert pickle.dumps(module) == pickled
+
+    copied = copy.copy(module)
+    copied_children = copied.get_simpler_components("m")
+    assert copied_children["m_release_flow"] is not children["m_release_flow"]
+    assert copied_children["m_release_flow"].get_parent() is copied
@@ -0,0 +1,149 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from framcore import Model
+from framcore.attributes import ReservoirCurve
+from framcore.curves import Curve, CurveBreakpoints, LoadedCurve
+from framcore.loaders import CurveLoader
+
+
+class _ArrayCurveLoader(CurveLoader):
+    def __init__(self, curves: dict[str, tuple[np.ndarray, np.ndarray]]) -> None:
+        super().__init__()
+        self._curves = curves
+
+    def get_source(self) -> dict:
+        return self._curves
+
+    def set_source(self, new_source: dict) -> None:
+        self._curves = new_source
+
+    def get_metadata(self, content_id: str) -> None:
+        return None
+
+    def _get_ids(self) -> list[str]:
+        return list(self._curves)
+
+    def clear_cache(self) -> None:
+        pass
+
+    def get_x_axis(self, curve_id: str) -> np.ndarray:
+        return self._curves[curve_id][0]
+
+    def get_y_axis(self, curve_id: str) -> np.ndarray:
+        return self._curves[curve_id][1]
+
+    def get_x_unit(self, curve_id: str) -> str:
+        return "Mm3"
+
+    def get_y_unit(self, curve_id: str) -> str:
+        return "m"
+
+
+X = np.array([0.0, 10.0, 20.0, 50.0, 100.0])
+Y = np.array([300.0, 310.0, 315.0, 318.0, 320.0])
+
+
+def test_linear_matches_np_interp() -> None:
+    rng = np.random.default_rng(0)
+    order = rng.permutation(X.size)
+    breakpoints = CurveBreakpoints(X[order], Y[order])
+    x = np.linspace(-10.0, 110.0, 243)
+    assert np.allclose(breakpoints.evaluate(x), np.interp(x, X, Y))
+    assert breakpoints.evaluate(x.reshape(3, -1)).shape == (3, 81)
+    assert np.array_equal(breakpoints.get_x(), X)
+
+
+def test_monotone_spline_is_smooth_and_does_not_overshoot() -> None:
+    breakpoints = CurveBreakpoints(X, Y, mode=CurveBreakpoints.MONOTONE_SPLINE)
+    x = np.linspace(0.0, 100.0, 1001)
+    y = breakpoints.evaluate(x)
+    assert np.allclose(breakpoints.evaluate(X), Y)
+    assert np.all(np.diff(y) >= 0)
+    assert y.min() >= Y.min()
+    assert y.max() <= Y.max()
+
+    flat = CurveBreakpoints([0.0, 1.0, 2.0, 3.0], [0.0, 1.0, 1.0, 0.0], mode=CurveBreakpoints.MONOTONE_SPLINE)
+    assert np.all(flat.evaluate(np.linspace(1.0, 2.0, 11)) == 1.0)
+
+
+def test_evaluate_many() -> None:
+    curves = [
+        CurveBreakpoints(X, Y),
+        CurveBreakpoints([5.0], [1.0]),
+        CurveBreakpoints(X * 2, Y[::-1], mode=CurveBreakpoints.MONOTONE_SPLINE),
+    ]
+    x = np.linspace(-10.0, 210.0, 50)
+    expected = np.stack([curve.evaluate(x) for curve in curves])
+    assert np.allclose(CurveBreakpoints.evaluate_many(curves, x), expected)
+
+    x_per_curve = np.stack([x, x + 1, x + 2])
+    expected = np.stack([curve.evaluate(xi) for curve, xi in zip(curves, x_per_curve, strict=True)])
+    assert np.allclose(CurveBreakpoints.evaluate_many(curves, x_per_curve), expected)
+
+    with pytest.raises(ValueError, match="Expected x of shape"):
+        CurveBreakpoints.evaluate_many(curves, np.zeros((2, 5)))
+
+
+def test_invalid_breakpoints() -> None:
+    with pytest.raises(ValueError, match="duplicate x"):
+        CurveBreakpoints([0.0, 1.0, 1.0], [0.0, 1.0, 2.0])
+    with pytest.raises(ValueError, match="equal length"):
+        CurveBreakpoints([0.0, 1.0], [0.0])
+    with pytest.raises(ValueError, match="finite"):
+        CurveBreakpoints([0.0, np.nan], [0.0, 1.0])
+    with pytest.raises(ValueError, match="Expected mode"):
+        CurveBreakpoints(X, Y, mode="cubic")
+
+
+def test_loaded_curve_caches_breakpoints() -> None:
+    loader = _ArrayCurveLoader({"curve": (X, Y), "other": (X, Y + 1)})
+    curve = LoadedCurve("curve", loader)
+    assert np.allclose(curve.evaluate([5.0, 75.0]), [305.0, 319.0])
+    assert curve.get_breakpoints() is curve.get_breakpoints()
+
+    other = LoadedCurve("other", loader)
+    assert np.allclose(Curve.evaluate_many([curve, other], [5.0]), [[305.0], [306.0]])
+
+    copy = pickle.loads(pickle.dumps(curve))
+    assert copy._breakpoints == dict()
+
+
+def test_loaded_curve_breakpoints_follow_loader() -> None:
+    loader = _ArrayCurveLoader({"curve": (X, Y)})
+    curve = LoadedCurve("curve", loader)
+    breakpoints = curve.get_breakpoints()
+
+    loader.set_source({"curve": (X, Y + 1)})
+    assert curve.get_breakpoints() is not breakpoints
+    assert np.allclose(curve.evaluate([5.0]), [306.0])
+
+    breakpoints = curve.get_breakpoints()
+    curve.clear_cache()
+    assert curve.get_breakpoints() is not breakpoints
+
+
+def test_loaded_curve_fingerprint() -> None:
+    loader = _ArrayCurveLoader({"a": (X, Y), "b": (X, Y), "c": (X, Y + 1)})
+    a = LoadedCurve("a", loader).get_fingerprint()
+    assert a.get_hash() == LoadedCurve("b", loader).get_fingerprint().get_hash()
+    assert a.get_hash() != LoadedCurve("c", loader).get_fingerprint().get_hash()
+
+
+def test_reservoir_curve() -> None:
+    loader = _ArrayCurveLoader({"curve": (X, Y)})
+    model = Model()
+    model.add("curve", LoadedCurve("curve", loader))
+
+    by_key = ReservoirCurve("curve")
+    assert np.allclose(by_key.evaluate([15.0], db=model), [312.5])
+    with pytest.raises(ValueError, match="Give db"):
+        by_key.get_curve()
+
+    by_curve = ReservoirCurve(LoadedCurve("curve", loader))
+    assert np.allclose(by_curve.evaluate([15.0]), [312.5])
+    loaders = set()
+    by_curve.add_loaders(loaders)
+    assert loaders == {loader}
@@ -0,0 +1,57 @@
+from framcore import Model
+from framcore.attributes import Arrow, Conversion
+from framcore.components import Flow
+from framcore.populators import SyntheticPopulator
+from framcore.utils import FlowInfoTable, get_flow_infos, get_transports_by_commodity
+
+
+def _flow(*arrows: tuple[str, bool]) -> Flow:
+    flow = Flow(arrows[0][0] if arrows else "a")
+    for i, (node, is_ingoing) in enumerate(arrows):
+        flow.add_arrow(Arrow(node, is_ingoing, conversion=Conversion(value=float(i + 1))))
+    return flow
+
+
+def _as_tuples(infos: list) -> list[tuple]:
+    return [(i.category, i.node_in, i.commodity_in, i.node_out, i.commodity_out) for i in infos]
+
+
+def test_table_matches_get_flow_infos() -> None:
+    node_to_commodity = {"a": "Power", "b": "Power", "h": "Hydro", "g": "Gas"}
+    flows = {
+        "empty": _flow(),
+        "direct_in": _flow(("a", True)),
+        "direct_out": _flow(("h", False)),
+        "transport": _flow(("a", False), ("b", True)),
+        "conversion": _flow(("g", False), ("a", True)),
+        "two_in_two_out": _flow(("h", False), ("a", True), ("h", True), ("g", False)),
+        "same_node_in": _flow(("a", True), ("a", True), ("b", True)),
+        "loop": _flow(("a", True), ("a", False)),
+    }
+    table = FlowInfoTable(flows, node_to_commodity)
+
+    for flow_id, flow in flows.items():
+        assert _as_tuples(table.get_flow_infos(flow_id)) == _as_tuples(get_flow_infos(flow, node_to_commodity)), flow_id
+    assert table.get_num_rows() == sum(len(get_flow_infos(f, node_to_commodity)) for f in flows.values())
+    assert table.get_num_infos()[table.get_flow_ids().index("empty")] == 0
+
+    transports = table.get_single_info_rows(FlowInfoTable.TRANSPORT, "Power")
+    assert [table.get_flow_ids()[table.get_flow()[row]] for row in transports] == ["transport", "loop"]
+    assert len(table.get_single_info_rows(FlowInfoTable.DIRECT_OUT, "Oil", is_ingoing=False)) == 0
+    assert len(table.get_rows_of_commodity("Gas")) == 3
+
+
+def test_model_graph_shares_table() -> None:
+    model = Model()
+    SyntheticPopulator(num_cascades=4, pump_share=1.0).populate(model)
+    graph = model.get_node_flow_graph()
+    table = graph.get_flow_info_table()
+    assert graph.get_flow_info_table() is table
+
+    node_to_commodity = graph.get_node_to_commodity()
+    for flow_id, flow in graph.get_flows().items():
+        assert _as_tuples(table.get_flow_infos(flow_id)) == _as_tuples(get_flow_infos(flow, node_to_commodity))
+
+    transports = get_transports_by_commodity(model, "Power")
+    assert transports
+    assert all(key.startswith("line_") for key in transports)
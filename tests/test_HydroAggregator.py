@@ -0,0 +1,81 @@
+from collections.abc import Callable, Iterator
+from datetime import timedelta
+
+import pytest
+
+from framcore import Model
+from framcore.aggregators import HydroAggregator
+from framcore.attributes import AvgFlowVolume, Conversion, HydroGenerator, HydroReservoir, MaxFlowVolume, StockVolume
+from framcore.components import HydroModule
+from framcore.events import RingBufferEventHandler, set_event_handler
+from framcore.expressions import get_level_value
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.timevectors import ConstantTimeVector
+from framcore.utils import set_global_energy_equivalent
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1981, 1, timedelta(weeks=1), is_52_week_years=True)
+METAKEY = "ee"
+
+
+@pytest.fixture
+def handler() -> Iterator[RingBufferEventHandler]:
+    handler = RingBufferEventHandler(capacity=100)
+    set_event_handler(handler)
+    yield handler
+    set_event_handler(None)
+
+
+def _module(release_capacity: float, reservoir_capacity: float) -> HydroModule:
+    return HydroModule(
+        release_capacity=MaxFlowVolume(level=ConstantTimeVector(release_capacity, unit="m3/s", is_max_level=True)),
+        generator=HydroGenerator("A", Conversion(level=ConstantTimeVector(1.0, unit="kWh/m3", is_max_level=True))),
+        inflow=AvgFlowVolume(level=ConstantTimeVector(0.1, unit="m3/s", is_max_level=False)),
+        reservoir=HydroReservoir(capacity=StockVolume(level=ConstantTimeVector(reservoir_capacity, unit="Mm3", is_max_level=True))),
+    )
+
+
+def _aggregate_set_results_and_disaggregate(release_capacities: tuple[float, float]) -> Model:
+    model = Model()
+    model.add("m1", _module(release_capacities[0], 10.0))
+    model.add("m2", _module(release_capacities[1], 30.0))
+    set_global_energy_equivalent(model.get_data(), METAKEY)
+    HydroAggregator(METAKEY, DATA_DIM, SCEN_DIM).aggregate(model)
+
+    data = model.get_data()
+    assert set(data) == {"A_hydro_reservoir"}
+    agg_module = data["A_hydro_reservoir"]
+    agg_module.get_generator().get_production().set_level(ConstantTimeVector(40.0, unit="MW", is_max_level=False))
+    agg_module.get_reservoir().get_volume().set_level(ConstantTimeVector(8.0, unit="Mm3", is_max_level=False))
+
+    model.disaggregate()
+
+    assert set(model.get_data()) == {"m1", "m2"}
+    return model
+
+
+def _values(model: Model, get_level: Callable[[HydroModule], object], unit: str) -> dict[str, float | None]:
+    data = model.get_data()
+    levels = {key: get_level(data[key]) for key in ("m1", "m2")}
+    return {key: None if level is None else get_level_value(level, model, unit, DATA_DIM, SCEN_DIM, is_max=False) for key, level in levels.items()}
+
+
+def test_disaggregate_production_and_filling_with_weights_from_aggregate(handler: RingBufferEventHandler) -> None:
+    model = _aggregate_set_results_and_disaggregate((100.0, 300.0))
+
+    production = _values(model, lambda m: m.get_generator().get_production().get_level(), "MW")
+    filling = _values(model, lambda m: m.get_reservoir().get_volume().get_level(), "Mm3")
+    assert production == pytest.approx({"m1": 10.0, "m2": 30.0})
+    assert filling == pytest.approx({"m1": 2.0, "m2": 6.0})
+    assert not handler.get_events("warning")
+
+
+def test_zero_production_capacity_warns_and_keeps_production(handler: RingBufferEventHandler) -> None:
+    model = _aggregate_set_results_and_disaggregate((0.0, 0.0))
+
+    production = _values(model, lambda m: m.get_generator().get_production().get_level(), "MW")
+    filling = _values(model, lambda m: m.get_reservoir().get_volume().get_level(), "Mm3")
+    assert production == {"m1": None, "m2": None}
+    assert filling == pytest.approx({"m1": 2.0, "m2": 6.0})
+    messages = [event["message"] for event in handler.get_events("warning")]
+    assert messages == ["All grouped modules have zero production capacity. Production not disaggregated for A_hydro_reservoir."]
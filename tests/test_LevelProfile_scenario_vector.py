@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from framcore import Model
+from framcore.attributes import AvgFlowVolume
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.timevectors import ConstantTimeVector, ReferencePeriod
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1981, 3, timedelta(days=1), is_52_week_years=True)
+
+
+def _make_volume(with_profile: bool) -> AvgFlowVolume:
+    profile = ConstantTimeVector(0.5, is_zero_one_profile=False) if with_profile else None
+    level = ConstantTimeVector(10.0, unit="MW", is_max_level=False, reference_period=ReferencePeriod(1981, 3))
+    volume = AvgFlowVolume(level=level, profile=profile)
+    volume.shift_intercept(2.0, unit="MW")
+    return volume
+
+
+@pytest.mark.parametrize("with_profile", [True, False])
+def test_get_scenario_vector_into_out_buffer(with_profile: bool) -> None:
+    volume = _make_volume(with_profile)
+    expected = volume.get_scenario_vector(Model(), SCEN_DIM, DATA_DIM, "MW")
+
+    out = np.full(SCEN_DIM.get_num_periods(), np.nan, dtype=np.float32)
+    result = volume.get_scenario_vector(Model(), SCEN_DIM, DATA_DIM, "MW", out=out)
+
+    assert result is out
+    assert np.allclose(out, expected)
+
+
+def test_get_scenario_vector_rejects_wrong_out_shape() -> None:
+    volume = _make_volume(with_profile=True)
+    with pytest.raises(ValueError, match="shape"):
+        volume.get_scenario_vector(Model(), SCEN_DIM, DATA_DIM, "MW", out=np.zeros(3))
+
+
+@pytest.mark.parametrize("window", [1, 100, 365, 10_000])
+def test_iter_scenario_vector_matches_full_vector(window: int) -> None:
+    volume = _make_volume(with_profile=True)
+    expected = volume.get_scenario_vector(Model(), SCEN_DIM, DATA_DIM, "MW")
+
+    chunks = [chunk.copy() for chunk in volume.iter_scenario_vector(Model(), SCEN_DIM, DATA_DIM, "MW", window=window)]
+
+    assert all(len(chunk) <= window for chunk in chunks)
+    assert np.allclose(np.concatenate(chunks), expected)
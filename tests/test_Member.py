@@ -0,0 +1,6 @@
+from framcore.metadata import Member
+
+
+def test_member_hash_matches_equality() -> None:
+    assert hash(Member("a")) == hash(Member("a"))
+    assert len({Member("a"), Member("a"), Member("b")}) == 2
@@ -0,0 +1,91 @@
+import threading
+from datetime import timedelta
+
+import numpy as np
+
+from framcore import Model
+from framcore.attributes import MaxFlowVolume
+from framcore.components import Wind
+from framcore.expressions import Expr, get_loaded_ids_from_expr
+from framcore.loaders import TimeVectorLoader
+from framcore.timeindexes import ProfileTimeIndex
+from framcore.timevectors import LoadedTimeVector
+
+
+class _Loader(TimeVectorLoader):
+    def __init__(self, source: str, ids: list[str]) -> None:
+        super().__init__()
+        self._source = source
+        self._ids = ids
+        self.loaded: list[tuple[str, str]] = []
+
+    def clear_cache(self) -> None:
+        pass
+
+    def get_source(self) -> str:
+        return self._source
+
+    def set_source(self, new_source: str) -> None:
+        self._source = new_source
+
+    def get_metadata(self, content_id: str) -> None:
+        return None
+
+    def _get_ids(self) -> list[str]:
+        return self._ids
+
+    def get_values(self, vector_id: str) -> np.ndarray:
+        self.loaded.append((vector_id, threading.current_thread().name))
+        return np.ones(52)
+
+    def get_index(self, vector_id: str) -> ProfileTimeIndex:
+        return ProfileTimeIndex(1981, 1, timedelta(weeks=1), is_52_week_years=True)
+
+    def get_unit(self, vector_id: str) -> str:
+        return "MW"
+
+    def is_max_level(self, vector_id: str) -> bool:
+        return True
+
+    def is_zero_one_profile(self, vector_id: str) -> None:
+        return None
+
+    def get_reference_period(self, vector_id: str) -> None:
+        return None
+
+
+def _setup() -> tuple[Model, _Loader, _Loader, _Loader]:
+    a1 = _Loader("a.h5", ["x", "y", "z"])
+    a2 = _Loader("a.h5", ["w"])
+    b = _Loader("b.h5", ["v"])
+    model = Model()
+    model.add("x", LoadedTimeVector("x", a1))
+    model.add("wind", Wind(power_node="A", max_capacity=MaxFlowVolume(level=LoadedTimeVector("v", b))))
+    model.add("expr", Expr(src="x", is_level=True) + Expr(src=LoadedTimeVector("w", a2), is_level=True))
+    return model, a1, a2, b
+
+
+def test_get_loaded_ids_from_expr() -> None:
+    model, a1, a2, __ = _setup()
+    assert get_loaded_ids_from_expr(model, model.get_data()["expr"]) == {a1: {"x"}, a2: {"w"}}
+
+
+def test_prefetch_selected_values() -> None:
+    model, a1, a2, b = _setup()
+    assert model.prefetch(["expr"]) == 2
+    assert sorted(vector_id for vector_id, __ in a1.loaded + a2.loaded) == ["w", "x"]
+    assert b.loaded == []
+
+
+def test_prefetch_all_groups_loaders_per_source() -> None:
+    model, a1, a2, b = _setup()
+    assert model.prefetch(max_workers=2) == 5
+    assert sorted(vector_id for vector_id, __ in a1.loaded) == ["x", "y", "z"]
+    assert [vector_id for vector_id, __ in b.loaded] == ["v"]
+    assert len({thread for __, thread in a1.loaded + a2.loaded}) == 1  # one thread per source file
+
+
+def test_prefetch_component() -> None:
+    model, __, __, b = _setup()
+    assert model.prefetch([model.get_data()["wind"]]) == 1
+    assert [vector_id for vector_id, __ in b.loaded] == ["v"]
@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from framcore import Model
+from framcore.aggregators import NodeAggregator
+from framcore.attributes import AvgFlowVolume, Loss, MaxFlowVolume, Price
+from framcore.components import Demand, Node, Transmission
+from framcore.metadata import Member
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.timevectors import ConstantTimeVector, ReferencePeriod
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1981, 1, timedelta(weeks=1), is_52_week_years=True)
+
+
+def _add_node(model: Model, name: str, area: str, price: float, profile: float) -> None:
+    level = ConstantTimeVector(price, unit="EUR/MWh", is_max_level=False, reference_period=ReferencePeriod(1981, 1))
+    node = Node(commodity="Power", price=Price(level=level, profile=ConstantTimeVector(profile, is_zero_one_profile=False)))
+    node.add_meta("area", Member(area))
+    model.add(name, node)
+
+
+def _setup() -> Model:
+    model = Model()
+    _add_node(model, "n1", "A", 10.0, 1.0)
+    _add_node(model, "n2", "A", 30.0, 2.0)
+    _add_node(model, "n3", "B", 50.0, 1.0)
+    model.add("d1", Demand(node="n1"))
+    model.add(
+        "line",
+        Transmission(
+            from_node="n1",
+            to_node="n2",
+            max_capacity=MaxFlowVolume(level=ConstantTimeVector(100.0, unit="MW", is_max_level=True)),
+            outgoing_volume=AvgFlowVolume(level=ConstantTimeVector(20.0, unit="MW", is_max_level=False)),
+        ),
+    )
+    return model
+
+
+def test_aggregate_sets_weighted_group_price() -> None:
+    model = _setup()
+    NodeAggregator("Power", "area", DATA_DIM, SCEN_DIM).aggregate(model)
+
+    data = model.get_data()
+    assert {"A", "B"} <= set(data)
+    assert not {"n1", "n2", "n3", "line"} & set(data)
+    assert data["d1"].get_node() == "A"
+
+    price = data["A"].get_price()
+    vector = price.get_scenario_vector(model, SCEN_DIM, DATA_DIM, "EUR/MWh")
+    # mean of member levels, constant profiles are mean one
+    assert np.allclose(vector, 20.0)
+
+
+def test_disaggregate_restores_members() -> None:
+    model = _setup()
+    aggregator = NodeAggregator("Power", "area", DATA_DIM, SCEN_DIM)
+    aggregator.aggregate(model)
+    model.disaggregate()
+
+    data = model.get_data()
+    assert {"n1", "n2", "n3", "line"} <= set(data)
+    assert "A" not in data
+    assert data["d1"].get_node() == "n1"
+
+
+def test_aggregate_raises_on_member_price_without_level() -> None:
+    model = _setup()
+    model.get_data()["n2"].get_price().set_level(None)
+
+    with pytest.raises(ValueError, match="without level"):
+        NodeAggregator("Power", "area", DATA_DIM, SCEN_DIM).aggregate(model)
+
+
+def test_aggregate_adds_internal_transport_loss_demand() -> None:
+    model = _setup()
+    model.get_data()["d1"].add_meta("consumer", Member("household"))
+    model.get_data()["line"].set_loss(Loss(level=ConstantTimeVector(0.05, is_max_level=False)))
+    NodeAggregator("Power", "area", DATA_DIM, SCEN_DIM).aggregate(model)
+
+    data = model.get_data()
+    key = "line_InternalTransportLossDemand_A"
+    demand = data[key]
+    assert isinstance(demand, Demand)
+    assert demand.get_node() == "A"
+    assert demand.get_meta("consumer") == Member("InternalTransportLossFromNodeAggregator")
+
+    # loss share of outgoing volume
+    vector = demand.get_capacity().get_scenario_vector(model, SCEN_DIM, DATA_DIM, "MW")
+    assert np.allclose(vector, 20.0 * 0.05)
+
+    model.disaggregate()
+    assert key not in model.get_data()
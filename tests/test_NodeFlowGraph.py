@@ -0,0 +1,61 @@
+from framcore import Model
+from framcore.components import Component, Demand, Flow, Node
+from framcore.utils import get_node_to_commodity, get_supported_components
+
+
+def _make_model() -> Model:
+    model = Model()
+    model.add("n1", Node(commodity="Power"))
+    model.add("n2", Node(commodity="Power"))
+    model.add("d1", Demand(node="n1"))
+    return model
+
+
+def test_graph_matches_get_supported_components() -> None:
+    model = _make_model()
+    graph = model.get_node_flow_graph()
+
+    components = {k: v for k, v in model.get_data().items() if isinstance(v, Component)}
+    expected = get_supported_components(components, (Node, Flow), tuple())
+
+    assert set(graph.get_graph().keys()) == set(expected.keys())
+    assert graph.get_node_to_commodity() == get_node_to_commodity(model.get_data())
+
+    (flow_id,) = graph.get_flows().keys()
+    assert graph.get_flow_to_nodes() == {flow_id: {"n1"}}
+    assert graph.get_node_to_flows() == {"n1": {flow_id}}
+
+
+def test_graph_is_reused_until_model_changes() -> None:
+    model = _make_model()
+    graph = model.get_node_flow_graph()
+    assert model.get_node_flow_graph() is graph
+
+    version = model.get_version()
+    model.add("d2", Demand(node="n2"))
+    assert model.get_version() > version
+
+    new_graph = model.get_node_flow_graph()
+    assert new_graph is not graph
+    assert "n2" in new_graph.get_node_to_flows()
+
+    model.delete("d2")
+    assert "n2" not in model.get_node_flow_graph().get_node_to_flows()
+
+
+def test_graph_detects_direct_edits_of_model_data() -> None:
+    model = _make_model()
+    graph = model.get_node_flow_graph()
+
+    model.get_data()["n3"] = Node(commodity="Gas")
+
+    new_graph = model.get_node_flow_graph()
+    assert new_graph is not graph
+    assert new_graph.get_node_to_commodity()["n3"] == "Gas"
+
+
+def test_clear_caches_drops_graph() -> None:
+    model = _make_model()
+    graph = model.get_node_flow_graph()
+    model.clear_caches()
+    assert model.get_node_flow_graph() is not graph
@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from framcore import Model
+from framcore.expressions import Expr, get_level_value
+from framcore.querydbs import CacheDB
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.timevectors import ConstantTimeVector
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1981, 1, timedelta(weeks=1), is_52_week_years=True)
+
+
+def _setup() -> tuple[CacheDB, Expr]:
+    model = Model()
+    model.add("a", ConstantTimeVector(2.0, unit="MW", is_max_level=True))
+    model.add("b", ConstantTimeVector(3.0, unit="MW", is_max_level=True))
+    expr = Expr(src="a", is_level=True) + Expr(src="b", is_level=True)
+    db = CacheDB(model)
+    db.set_min_elapsed_seconds(0.0)
+    return db, expr
+
+
+def test_cache_hits_misses_and_evaluations() -> None:
+    db, expr = _setup()
+    metrics = db.enable_metrics()
+
+    for __ in range(3):
+        assert get_level_value(expr, db, "MW", DATA_DIM, SCEN_DIM, is_max=True) == 5.0
+
+    report = metrics.get_report()
+    assert report["queries"]["_get_constant_from_expr"] == {"hits": 2, "misses": 1, "puts": 1, "skipped_puts": 0}
+    assert report["cache"]["entries"] == 1
+    assert report["cache"]["bytes"] > 0
+    assert report["evaluations"]["fastpath_sum"]["count"] == 1
+
+    metrics.reset()
+    assert metrics.get_report()["queries"] == {}
+
+
+def test_skipped_puts_and_disabled_metrics() -> None:
+    db, expr = _setup()
+    assert db.get_metrics() is None
+    db.set_min_elapsed_seconds(10.0)
+    metrics = db.enable_metrics()
+    get_level_value(expr, db, "MW", DATA_DIM, SCEN_DIM, is_max=True)
+    assert metrics.get_report()["queries"]["_get_constant_from_expr"]["skipped_puts"] == 1
+    assert metrics.get_report()["cache"]["entries"] == 0
+
+    db.disable_metrics()
+    assert db.get_metrics() is None
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from framcore import Model
+from framcore.components import Node
+from framcore.solvers import ScenarioSweep, Solver, SolverConfig
+
+
+class _Config(SolverConfig):
+    pass
+
+
+class _Solver(Solver):
+    def __init__(self) -> None:
+        self._config = _Config()
+
+    def get_config(self) -> SolverConfig:
+        return self._config
+
+    def _solve(self, folder: Path, model: Model) -> None:
+        first_year, num_years = self._config.get_weather_years()
+        (folder / "weather_years.txt").write_text(f"{first_year} {num_years} {len(model.get_data())}")
+
+
+def _add_node(model: Model, config: SolverConfig) -> None:
+    config.set_weather_years(1991, 1)
+    model.add("extra", Node(commodity="Power"))
+
+
+def _fail(model: Model, config: SolverConfig) -> None:
+    message = "bad scenario"
+    raise ValueError(message)
+
+
+def _setup(folder: Path) -> ScenarioSweep:
+    model = Model()
+    model.add("n1", Node(commodity="Power"))
+    sweep = ScenarioSweep(_Solver(), model, folder)
+    sweep.add_weather_years_scenarios(1981, 3, 2)
+    sweep.add_scenario("extra", _add_node)
+    sweep.add_scenario("fail", _fail)
+    return sweep
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_solves_each_scenario_in_own_folder(tmp_path: Path, max_workers: int) -> None:
+    sweep = _setup(tmp_path)
+    assert sweep.get_scenario_names() == ["weather_1981", "weather_1982", "extra", "fail"]
+
+    index = sweep.run(max_workers=max_workers)
+
+    assert index == json.loads((tmp_path / "index.json").read_text())
+    assert [name for name, record in index.items() if record["status"] == "ok"] == ["weather_1981", "weather_1982", "extra"]
+    assert "bad scenario" in index["fail"]["error"]
+    assert (tmp_path / "weather_1982" / "weather_years.txt").read_text() == "1982 2 1"
+    assert (tmp_path / "extra" / "weather_years.txt").read_text() == "1991 1 2"
+    assert Solver.get_model_store(tmp_path / "extra").get_keys() == ["n1", "extra"]
+
+
+def test_invalid_scenario_names() -> None:
+    sweep = ScenarioSweep(_Solver(), Model(), "folder")
+    with pytest.raises(ValueError, match="folder name"):
+        sweep.add_scenario("a/b", _add_node)
+    sweep.add_scenario("a", _add_node)
+    with pytest.raises(KeyError):
+        sweep.add_scenario("a", _add_node)
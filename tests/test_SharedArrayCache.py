@@ -0,0 +1,94 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from framcore.loaders import SharedArrayCache, TimeVectorLoader
+
+
+class _Loader(TimeVectorLoader):
+    def __init__(self) -> None:
+        super().__init__()
+        self.num_loads = 0
+
+    def clear_cache(self) -> None:
+        pass
+
+    def get_source(self) -> str:
+        return "memory"
+
+    def set_source(self, new_source: str) -> None:
+        pass
+
+    def get_metadata(self, content_id: str) -> None:
+        return None
+
+    def _get_ids(self) -> list[str]:
+        return ["v1", "v2"]
+
+    def get_values(self, vector_id: str) -> np.ndarray:
+        self.num_loads += 1
+        return np.arange(5, dtype=np.float64) * int(vector_id[-1])
+
+    def get_index(self, vector_id: str) -> None:
+        return None
+
+    def get_unit(self, vector_id: str) -> str:
+        return "MW"
+
+    def is_max_level(self, vector_id: str) -> None:
+        return None
+
+    def is_zero_one_profile(self, vector_id: str) -> None:
+        return None
+
+    def get_reference_period(self, vector_id: str) -> None:
+        return None
+
+
+def _sum_values(loader: _Loader) -> tuple[float, int]:
+    return float(loader.get_values("v2").sum()), loader.num_loads
+
+
+def test_unpickled_loader_reattaches_shared_values() -> None:
+    loader = _Loader()
+    loader.share_values()
+    assert loader.num_loads == 2
+
+    copy = pickle.loads(pickle.dumps(loader))
+    values = copy.get_values("v2")
+    assert copy.num_loads == 2  # not reloaded
+    assert np.array_equal(values, np.arange(5) * 2)
+    with pytest.raises(ValueError, match="read-only"):
+        values[0] = 1.0
+
+    loader.disable_shared_memory()
+
+
+def test_process_pool_workers_share_values() -> None:
+    loader = _Loader()
+    loader.share_values(["v2"])
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_sum_values, [loader] * 3))
+    assert results == [(20.0, 1)] * 3
+
+    # workers exiting must not unlink blocks owned by this process
+    assert _sum_values(pickle.loads(pickle.dumps(loader))) == (20.0, 1)
+    loader.disable_shared_memory()
+
+
+def test_reload_when_owner_closed() -> None:
+    cache = SharedArrayCache()
+    cache.get("a", lambda: np.ones(3))
+    copy = pickle.loads(pickle.dumps(cache))
+    cache.close()
+    assert np.array_equal(copy.get("a", lambda: np.zeros(3)), np.zeros(3))
+
+
+def test_disabled_by_default() -> None:
+    loader = _Loader()
+    assert not loader.is_shared_memory()
+    loader.get_values("v1")
+    loader.get_values("v1")
+    assert loader.num_loads == 2
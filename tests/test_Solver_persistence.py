@@ -0,0 +1,232 @@
+import copy
+import json
+import os
+import subprocess
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from framcore import Model
+from framcore.attributes import Arrow, Conversion, MaxFlowVolume, Price
+from framcore.components import Flow, Node, Wind
+from framcore.fingerprints import FingerprintDiffType
+from framcore.loaders import TimeVectorLoader
+from framcore.metadata import Div, Member
+from framcore.solvers import ModelStore, Solver, SolverConfig
+from framcore.timeindexes import ProfileTimeIndex
+from framcore.timevectors import ConstantTimeVector, LoadedTimeVector
+
+
+class _Config(SolverConfig):
+    pass
+
+
+class _Solver(Solver):
+    def __init__(self) -> None:
+        self._config = _Config()
+        self.num_solves = 0
+
+    def get_config(self) -> SolverConfig:
+        return self._config
+
+    def _solve(self, folder: Path, model: Model) -> None:
+        self.num_solves += 1
+        for value in model.get_data().values():
+            if isinstance(value, Node):
+                value.get_price().set_level(ConstantTimeVector(42.0, unit="EUR/MWh", is_max_level=False))
+
+
+class _Loader(TimeVectorLoader):
+    def __init__(self, source: str) -> None:
+        super().__init__()
+        self._source = source
+
+    def clear_cache(self) -> None:
+        pass
+
+    def get_source(self) -> str:
+        return self._source
+
+    def set_source(self, new_source: str) -> None:
+        self._source = new_source
+
+    def get_metadata(self, content_id: str) -> None:
+        return None
+
+    def _get_ids(self) -> list[str]:
+        return ["capacity"]
+
+    def get_values(self, vector_id: str) -> np.ndarray:
+        return np.ones(52)
+
+    def get_index(self, vector_id: str) -> ProfileTimeIndex:
+        return ProfileTimeIndex(1981, 1, timedelta(weeks=1), is_52_week_years=True)
+
+    def get_unit(self, vector_id: str) -> str:
+        return "MW"
+
+    def is_max_level(self, vector_id: str) -> bool:
+        return True
+
+    def is_zero_one_profile(self, vector_id: str) -> None:
+        return None
+
+    def get_reference_period(self, vector_id: str) -> None:
+        return None
+
+
+def _setup() -> Model:
+    model = Model()
+    model.add("n1", Node(commodity="Power", price=Price()))
+    model.add("n2", Node(commodity="Power", price=Price()))
+    model.add("tv", ConstantTimeVector(1.0, unit="MW", is_max_level=True))
+    return model
+
+
+def _setup_flows() -> Model:
+    """Model with sets (flow arrows, Div metadata) and components sharing one loader."""
+    model = _setup()
+    for i in range(5):
+        flow = Flow(main_node="n1")
+        for node in ("n1", "n2", "n3", "n4"):
+            flow.add_arrow(Arrow(node, node == "n1", conversion=Conversion(value=1.0)))
+        flow.add_meta("tags", Div({Member(tag) for tag in "pqrstuvw"}))
+        model.add(f"flow{i}", flow)
+    loader = _Loader("capacity.h5")
+    for i in range(11):
+        model.add(f"wind{i}", Wind(power_node="n1", max_capacity=MaxFlowVolume(level=LoadedTimeVector("capacity", loader))))
+    return model
+
+
+def test_solve_writes_only_changed_chunks(tmp_path: Path) -> None:
+    solver = _Solver()
+    solver.get_config().set_solve_folder(tmp_path)
+    model = _setup()
+    solver.solve(model)
+
+    store = Solver.get_model_store(tmp_path)
+    assert set(store.get_keys()) == {"n1", "n2", "tv"}
+    assert (tmp_path / "solver.pickle").is_file()
+
+    model.add("n3", Node(commodity="Gas", price=Price()))
+    model.delete("n2")
+    assert store.write(model) == ["n3"]
+    assert set(store.get_keys()) == {"n1", "tv", "n3"}
+    assert len(list(store.get_folder().glob("*.zlib"))) == 4  # three chunks and the model shell
+
+
+def test_write_equal_model_rewrites_nothing(tmp_path: Path) -> None:
+    store = ModelStore(tmp_path)
+    model = _setup_flows()
+    assert len(store.write(model)) == len(model.get_data())
+
+    assert store.write(copy.deepcopy(model)) == []
+    assert store.write(copy.deepcopy(model)) == []
+    assert store.write(store.load_model()) == []
+
+
+def test_fingerprints_equal_in_other_process(tmp_path: Path) -> None:
+    code = (
+        "import json, sys\n"
+        f"sys.path.insert(0, {str(Path(__file__).parent)!r})\n"
+        "from test_Solver_persistence import _setup_flows\n"
+        "from framcore.solvers import ModelStore\n"
+        f"print(json.dumps(ModelStore({str(tmp_path)!r}).get_model_fingerprints(_setup_flows())))"
+    )
+    expected = ModelStore(tmp_path).get_model_fingerprints(_setup_flows())
+    for seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+        assert json.loads(result.stdout) == expected
+
+
+def test_load_model_shares_loaders(tmp_path: Path) -> None:
+    store = ModelStore(tmp_path)
+    model = _setup_flows()
+    store.write(model)
+    assert len(model.get_loaders()) == 1
+
+    loaded = store.load_model(max_workers=2)
+    assert len(loaded.get_loaders()) == 1
+    assert loaded.get_data()["wind0"].get_max_capacity().get_level() is not None
+    assert isinstance(store.load("wind3"), Wind)
+
+    model.add("extra", LoadedTimeVector("capacity", _Loader("other.h5")))
+    store.write(model)
+    assert len(store.load_model().get_loaders()) == 2
+    model.delete("extra")
+    store.write(model)
+    assert len(list(store.get_folder().glob("loader_*"))) == 1
+
+
+def test_lazy_load_single_key_and_whole_model(tmp_path: Path) -> None:
+    model = _setup()
+    solver = _Solver()
+    solver.get_config().set_solve_folder(tmp_path)
+    solver.solve(model)
+
+    store = Solver.get_model_store(tmp_path)
+    node = store.load("n2")
+    assert isinstance(node, Node)
+    assert node.get_commodity() == "Power"
+
+    loaded = store.load_model(max_workers=2)
+    assert set(loaded.get_data()) == {"n1", "n2", "tv"}
+    assert loaded.get_data()["tv"].get_vector(is_float32=True)[0] == 1.0
+
+    with pytest.raises(KeyError):
+        store.load("missing")
+
+
+def _get_reuse_solver(folder: Path) -> _Solver:
+    solver = _Solver()
+    solver.get_config().set_solve_folder(folder)
+    solver.get_config().set_diff_policy_reuse()
+    return solver
+
+
+def test_reuse_skips_solve_when_inputs_unchanged(tmp_path: Path) -> None:
+    solver = _get_reuse_solver(tmp_path)
+    solved = _setup()
+    solver.solve(solved)
+    assert solver.num_solves == 1
+
+    assert solver.get_solve_diff(tmp_path, _setup()).is_none()
+    assert solver.get_solve_diff(tmp_path, solved).is_results_only()
+
+    model = _setup()
+    solver.solve(model)
+    assert solver.num_solves == 1
+    assert model.get_data()["n1"].get_price().get_level() is not None  # results loaded from folder
+
+
+def test_reuse_skips_solve_of_copied_model(tmp_path: Path) -> None:
+    solver = _get_reuse_solver(tmp_path)
+    model = _setup_flows()
+    solver.solve(copy.deepcopy(model))
+
+    assert solver.get_solve_diff(tmp_path, copy.deepcopy(model)).is_none()
+    solver.solve(copy.deepcopy(model))
+    assert solver.num_solves == 1
+
+
+def test_reuse_resolves_when_inputs_changed(tmp_path: Path) -> None:
+    solver = _get_reuse_solver(tmp_path)
+    solver.solve(_setup())
+
+    model = _setup()
+    model.delete("n2")
+    model.add("tv", ConstantTimeVector(2.0, unit="MW", is_max_level=True), overwrite=True)
+    diff = solver.get_solve_diff(tmp_path, model)
+    assert diff.is_inputs_changed()
+    assert diff.get_input_diffs() == {"n2": FingerprintDiffType.DELETED, "tv": FingerprintDiffType.MODIFIED}
+
+    solver.solve(model)
+    assert solver.num_solves == 2
+    assert solver.get_solve_diff(tmp_path, model).is_results_only()
+
+    solver.get_config().set_num_cpu_cores(2)
+    assert solver.get_solve_diff(tmp_path, model).is_config_changed()
@@ -0,0 +1,110 @@
+import pickle
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from framcore import Model
+from framcore.aggregators import HydroAggregator, NodeAggregator, WindAggregator
+from framcore.components import HydroModule, Node, Solar, Transmission, Wind
+from framcore.populators import SyntheticPopulator, SyntheticProfileLoader
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.utils import set_global_energy_equivalent
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1991, 2, timedelta(weeks=1), is_52_week_years=True)
+
+
+def _populate(**kwargs: object) -> Model:
+    model = Model()
+    SyntheticPopulator(**kwargs).populate(model)
+    return model
+
+
+def _count(model: Model, cls: type) -> int:
+    return sum(isinstance(obj, cls) for obj in model.get_data().values())
+
+
+def test_populate_sizes() -> None:
+    model = _populate(num_areas=3, nodes_per_area=2, num_cascades=4, cascade_length=3, num_wind=5, num_solar=2)
+    assert _count(model, Node) == 6
+    assert _count(model, HydroModule) == 12
+    assert _count(model, Wind) == 5
+    assert _count(model, Solar) == 2
+    assert _count(model, Transmission) >= 3 * 1 + 2
+
+    data = model.get_data()
+    assert data["hydro_0_0"].get_release_to() == "hydro_0_1"
+    assert data["hydro_0_2"].get_release_to() is None
+    assert data["hydro_0_0"].get_reservoir() is not None
+    assert data["node_2_1"].get_meta(SyntheticPopulator.METAKEY_AREA).get_value() == "area_2"
+
+
+def test_populate_is_reproducible() -> None:
+    a = _populate(seed=7, pump_share=1.0)
+    b = _populate(seed=7, pump_share=1.0)
+    c = _populate(seed=8, pump_share=1.0)
+    assert a.get_data().keys() == b.get_data().keys()
+    assert a.get_data()["hydro_3_1_inflow"] == b.get_data()["hydro_3_1_inflow"]
+    assert a.get_data()["hydro_3_1_inflow"] != c.get_data()["hydro_3_1_inflow"]
+
+    profile_a = a.get_data()["wind_0"].get_max_capacity().get_profile().get_src()
+    profile_b = b.get_data()["wind_0"].get_max_capacity().get_profile().get_src()
+    assert np.array_equal(profile_a.get_vector(False), profile_b.get_vector(False))
+
+
+def test_pumps_go_to_top_reservoir() -> None:
+    model = _populate(num_cascades=20, reservoir_share=1.0, pump_share=1.0)
+    for cascade in range(20):
+        pump = model.get_data()[f"hydro_{cascade}_0"].get_pump()
+        assert pump is not None
+        assert pump.get_to_module() == f"hydro_{cascade}_0"
+        assert model.get_data()[pump.get_from_module()].get_reservoir() is not None
+
+
+def test_populate_rejects_existing_ids() -> None:
+    model = _populate()
+    with pytest.raises(RuntimeError, match="Duplicate ID found: 'node_0_0'"):
+        SyntheticPopulator().populate(model)
+
+
+def test_profiles() -> None:
+    loader = SyntheticProfileLoader(seed=1, first_year=1991, num_years=2, period_duration=timedelta(hours=3))
+    for kind in ("wind", "solar", "inflow"):
+        loader.add_profile(kind, kind)
+
+    assert loader.get_index("wind").get_num_periods() == 2 * 52 * 56
+    for kind in ("wind", "solar"):
+        values = loader.get_values(kind)
+        assert loader.is_zero_one_profile(kind)
+        assert loader.get_reference_period(kind) is None
+        assert values.min() >= 0.0
+        assert values.max() <= 1.0
+    assert not loader.is_zero_one_profile("inflow")
+    assert loader.get_values("inflow").mean() == pytest.approx(1.0)
+
+    with pytest.raises(KeyError):
+        loader.add_profile("wind", "wind")
+    with pytest.raises(ValueError, match="Expected kind"):
+        loader.add_profile("tidal", "tidal")
+    with pytest.raises(ValueError, match="divides one week"):
+        SyntheticProfileLoader(seed=1, first_year=1991, num_years=1, period_duration=timedelta(hours=5))
+
+
+def test_loader_pickles_without_values() -> None:
+    loader = SyntheticProfileLoader(seed=1, first_year=1991, num_years=1)
+    loader.add_profile("wind", "wind")
+    values = loader.get_values("wind")
+    data = pickle.dumps(loader)
+    assert len(data) < values.nbytes
+    assert np.array_equal(pickle.loads(data).get_values("wind"), values)
+
+
+def test_aggregators_run_on_synthetic_model() -> None:
+    model = _populate(num_weather_years=2, pump_share=0.5)
+    set_global_energy_equivalent(model.get_data(), "energy_eq_downstream")
+    HydroAggregator("energy_eq_downstream", DATA_DIM, SCEN_DIM).aggregate(model)
+    WindAggregator(DATA_DIM, SCEN_DIM).aggregate(model)
+    NodeAggregator("Power", SyntheticPopulator.METAKEY_AREA, DATA_DIM, SCEN_DIM).aggregate(model)
+    assert _count(model, HydroModule) < 50
+    assert _count(model, Node) == 4
@@ -0,0 +1,111 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from framcore import Model
+from framcore.components import Wind
+from framcore.populators import SyntheticPopulator
+from framcore.querydbs import CacheDB, ModelDB, ThreadSafeCacheDB
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1991, 1, timedelta(weeks=1), is_52_week_years=True)
+
+
+def _model() -> Model:
+    model = Model()
+    SyntheticPopulator(num_cascades=2, num_wind=20, num_solar=0).populate(model)
+    return model
+
+
+def test_get_or_compute() -> None:
+    model = _model()
+    calls = []
+
+    def compute() -> float:
+        calls.append(1)
+        return 1.0
+
+    for db in (CacheDB(model), ThreadSafeCacheDB(model)):
+        db.set_min_elapsed_seconds(0.0)
+        metrics = db.enable_metrics()
+        calls.clear()
+        assert db.get_or_compute(("key",), compute) == 1.0
+        assert db.get_or_compute(("key",), compute) == 1.0
+        assert len(calls) == 1
+        assert metrics.get_report()["queries"]["key"] == {"hits": 1, "misses": 1, "puts": 1, "skipped_puts": 0}
+
+    calls.clear()
+    db = ModelDB(model)
+    db.get_or_compute(("key",), compute)
+    db.get_or_compute(("key",), compute)
+    assert len(calls) == 2
+
+
+def test_single_flight() -> None:
+    db = ThreadSafeCacheDB(_model())
+    db.set_min_elapsed_seconds(1.0)  # not stored, so waiting threads must get the value from the producer
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def compute() -> object:
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    def query() -> object:
+        barrier.wait()
+        return db.get_or_compute(("slow",), compute)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(executor.map(lambda __: query(), range(8)))
+
+    assert len(calls) == 1
+    assert all(value is values[0] for value in values)
+
+
+def test_failed_producer_lets_waiters_retry() -> None:
+    db = ThreadSafeCacheDB(_model())
+    db.set_min_elapsed_seconds(0.0)
+    calls = []
+    started = threading.Event()
+
+    def compute() -> float:
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            time.sleep(0.2)
+            message = "first call fails"
+            raise RuntimeError(message)
+        return 2.0
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        failing = executor.submit(db.get_or_compute, ("key",), compute)
+        started.wait()
+        waiting = executor.submit(db.get_or_compute, ("key",), compute)
+        with pytest.raises(RuntimeError, match="first call fails"):
+            failing.result()
+        assert waiting.result() == 2.0
+    assert len(calls) == 2
+
+
+def test_parallel_queries_match_serial() -> None:
+    model = _model()
+    winds = [v for v in model.get_data().values() if isinstance(v, Wind)]
+
+    def query(db: CacheDB, wind: Wind) -> np.ndarray:
+        return wind.get_max_capacity().get_scenario_vector(db, SCEN_DIM, DATA_DIM, "MW", is_float32=False)
+
+    serial = [query(CacheDB(model), wind) for wind in winds]
+
+    db = ThreadSafeCacheDB(model)
+    db.set_min_elapsed_seconds(0.0)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = list(executor.map(lambda wind: query(db, wind), winds * 3))
+
+    for i, vector in enumerate(parallel):
+        assert np.array_equal(vector, serial[i % len(winds)])
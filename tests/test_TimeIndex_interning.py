@@ -0,0 +1,86 @@
+import copy
+import gc
+import pickle
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from framcore.timeindexes import FixedFrequencyTimeIndex, ListTimeIndex, ModelYear, ProfileTimeIndex, SinglePeriodTimeIndex
+from framcore.timeindexes._interning import clear_interned, get_num_interned
+
+
+def _index(start_time: datetime = datetime(2020, 1, 6), num_periods: int = 3) -> FixedFrequencyTimeIndex:
+    return FixedFrequencyTimeIndex(start_time, timedelta(hours=1), num_periods, False, False, False)
+
+
+def test_equal_indices_are_shared() -> None:
+    index = _index()
+    assert _index() is index
+    assert index.copy_with(num_periods=3) is index
+    assert index.copy_with(num_periods=4) is _index(num_periods=4)
+    assert ModelYear(2025) is ModelYear(2025)
+    assert ModelYear(2025) is not ModelYear(2026)
+
+    by_keywords = ProfileTimeIndex(start_year=1991, num_years=2, period_duration=timedelta(weeks=1), is_52_week_years=True)
+    assert ProfileTimeIndex(1991, 2, timedelta(weeks=1), True) is by_keywords
+
+
+def test_classes_and_timezones_are_not_mixed() -> None:
+    single = SinglePeriodTimeIndex(datetime.fromisocalendar(2025, 1, 1), timedelta(weeks=52), is_52_week_years=True)
+    assert single == ModelYear(2025)
+    assert single is not ModelYear(2025)
+    assert type(single) is SinglePeriodTimeIndex
+
+    utc = _index(datetime(2020, 1, 6, 1, tzinfo=UTC))
+    cet = _index(datetime(2020, 1, 6, 2, tzinfo=timezone(timedelta(hours=1))))
+    assert utc == cet
+    assert utc is not cet
+    assert cet.get_timezone() == timezone(timedelta(hours=1))
+
+
+def test_indices_are_immutable() -> None:
+    index = _index()
+    with pytest.raises(AttributeError, match="immutable"):
+        index._num_periods = 5
+    assert not hasattr(index, "__dict__")
+    assert index.get_stop_time() == datetime(2020, 1, 6, 3)
+    assert hash(index) == hash(_index(num_periods=4).copy_with(num_periods=3))
+
+
+def test_copy_and_pickle_keep_identity() -> None:
+    index = ModelYear(2025)
+    assert copy.copy(index) is index
+    assert copy.deepcopy({"index": index})["index"] is index
+    assert pickle.loads(pickle.dumps(index)) is index
+
+    restored = pickle.loads(pickle.dumps(ModelYear(2031)))
+    assert type(restored) is ModelYear
+    assert restored == ModelYear(2031)
+    assert restored.get_fingerprint().get_hash() == ModelYear(2031).get_fingerprint().get_hash()
+
+
+def test_unused_indices_are_released() -> None:
+    clear_interned()
+    gc.collect()
+    num_interned = get_num_interned()
+    indices = [_index(num_periods=n) for n in range(1000, 1100)]
+    assert get_num_interned() == num_interned + 100
+    kept = indices[0]
+    del indices
+    clear_interned()
+    gc.collect()
+    assert get_num_interned() == num_interned + 1
+    assert _index(num_periods=1000) is kept
+
+
+def test_list_time_index_equality() -> None:
+    dts = [datetime(2020, 1, 1), datetime(2021, 1, 1)]
+    index = ListTimeIndex(dts, False, False, False)
+    assert index == ListTimeIndex(dts, False, False, False)
+    assert index == ListTimeIndex(list(dts), False, False, False)
+    assert hash(index) == hash(ListTimeIndex(list(dts), False, False, False))
+    assert index != ListTimeIndex(dts, False, True, False)
+
+    dts.append(datetime(2022, 1, 1))
+    assert index == ListTimeIndex(dts[:2], False, False, False)
+    assert hash(index) == hash(ListTimeIndex(dts[:2], False, False, False))
@@ -0,0 +1,64 @@
+from collections.abc import Iterator
+from datetime import timedelta
+
+import pytest
+
+from framcore import Model
+from framcore.aggregators import WindAggregator
+from framcore.attributes import MaxFlowVolume
+from framcore.components import Wind
+from framcore.events import RingBufferEventHandler, set_event_handler
+from framcore.expressions import get_level_value
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.timevectors import ConstantTimeVector
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1981, 1, timedelta(weeks=1), is_52_week_years=True)
+
+
+@pytest.fixture
+def handler() -> Iterator[RingBufferEventHandler]:
+    handler = RingBufferEventHandler(capacity=100)
+    set_event_handler(handler)
+    yield handler
+    set_event_handler(None)
+
+
+def _setup(capacities: tuple[float, float] = (100.0, 300.0)) -> Model:
+    model = Model()
+    for name, capacity in zip(("w1", "w2"), capacities, strict=True):
+        model.add(name, Wind(power_node="A", max_capacity=MaxFlowVolume(level=ConstantTimeVector(capacity, unit="MW", is_max_level=True))))
+    return model
+
+
+def test_disaggregate_production_with_weights_from_aggregate() -> None:
+    model = _setup()
+    WindAggregator(DATA_DIM, SCEN_DIM).aggregate(model)
+
+    data = model.get_data()
+    assert set(data) == {"AggregatedWindA"}
+    agg_production = ConstantTimeVector(40.0, unit="MW", is_max_level=False)
+    data["AggregatedWindA"].get_production().set_level(agg_production)
+
+    model.disaggregate()
+
+    data = model.get_data()
+    assert set(data) == {"w1", "w2"}
+    values = {key: get_level_value(data[key].get_production().get_level(), model, "MW", DATA_DIM, SCEN_DIM, is_max=False) for key in ("w1", "w2")}
+    assert values == {"w1": 10.0, "w2": 30.0}
+
+
+def test_zero_capacity_warns_only_when_disaggregating_production(handler: RingBufferEventHandler) -> None:
+    model = _setup((0.0, 0.0))
+    WindAggregator(DATA_DIM, SCEN_DIM).aggregate(model)
+    assert not handler.get_events("warning")  # no profiles or voc to weight
+
+    data = model.get_data()
+    data["AggregatedWindA"].get_production().set_level(ConstantTimeVector(40.0, unit="MW", is_max_level=False))
+    model.disaggregate()
+
+    data = model.get_data()
+    assert data["w1"].get_production().get_level() is None
+    assert data["w2"].get_production().get_level() is None
+    messages = [event["message"] for event in handler.get_events("warning")]
+    assert messages == ["All grouped components have zero capacity. Production not disaggregated for AggregatedWindA."]
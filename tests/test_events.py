@@ -0,0 +1,81 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from framcore.events import (
+    JsonLinesEventHandler,
+    RingBufferEventHandler,
+    get_counters,
+    increment_counter,
+    is_event_enabled,
+    reset_counters,
+    send_debug_event,
+    send_info_event,
+    set_event_handler,
+    set_event_level,
+    span,
+)
+
+
+@pytest.fixture
+def handler() -> Iterator[RingBufferEventHandler]:
+    handler = RingBufferEventHandler(capacity=3)
+    set_event_handler(handler)
+    yield handler
+    set_event_handler(None)
+    set_event_level("debug")
+
+
+def test_level_filters_events_before_handler(handler: RingBufferEventHandler) -> None:
+    set_event_level("info")
+    assert not is_event_enabled("debug")
+    assert is_event_enabled("custom")
+    send_debug_event(None, "dropped")
+    send_info_event(None, "kept")
+    assert [e["message"] for e in handler.get_events()] == ["kept"]
+
+
+def test_ring_buffer_keeps_latest(handler: RingBufferEventHandler) -> None:
+    for i in range(5):
+        send_info_event(handler, str(i))
+    events = handler.get_events()
+    assert [e["message"] for e in events] == ["2", "3", "4"]
+    assert events[0]["sender"] == "RingBufferEventHandler"
+
+
+def test_span_sends_duration_and_fields(handler: RingBufferEventHandler) -> None:
+    with span(test_span_sends_duration_and_fields, "work", component="c1") as fields:
+        fields["num_items"] = 2
+    (event,) = handler.get_events("span")
+    assert event["name"] == "work"
+    assert event["component"] == "c1"
+    assert event["num_items"] == 2
+    assert event["seconds"] >= 0.0
+    assert event["sender"] == "test_span_sends_duration_and_fields"
+
+    set_event_level("info")
+    with span(None, "silent"):
+        pass
+    assert len(handler.get_events("span")) == 1
+
+
+def test_counters() -> None:
+    reset_counters()
+    increment_counter("hits")
+    increment_counter("hits", 2)
+    assert get_counters() == {"hits": 3}
+    reset_counters()
+    assert get_counters() == {}
+
+
+def test_json_lines_handler(tmp_path: Path) -> None:
+    handler = JsonLinesEventHandler(tmp_path / "events.jsonl")
+    handler.handle_event(None, "info", message="a", path=tmp_path)
+    handler.close()
+    (line,) = (tmp_path / "events.jsonl").read_text().splitlines()
+    record = json.loads(line)
+    assert record["type"] == "info"
+    assert record["message"] == "a"
+    assert record["path"] == str(tmp_path)
@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+import pytest
+
+from framcore import Model
+from framcore.attributes import Conversion, HydroGenerator, HydroReservoir, StockVolume
+from framcore.components import HydroModule
+from framcore.expressions import get_level_value
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.timevectors import ConstantTimeVector
+from framcore.utils import get_hydro_downstream_energy_equivalent, get_hydro_downstream_energy_equivalents, set_global_energy_equivalent
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1981, 1, timedelta(weeks=1), is_52_week_years=True)
+
+
+def _generator(power_node: str, energy_eq: float) -> HydroGenerator:
+    return HydroGenerator(power_node, Conversion(level=ConstantTimeVector(energy_eq, unit="kWh/m3", is_max_level=True)))
+
+
+def _setup() -> Model:
+    model = Model()
+    reservoir = HydroReservoir(capacity=StockVolume(level=ConstantTimeVector(10.0, unit="Mm3", is_max_level=True)))
+    model.add("m1", HydroModule(release_to="m2", generator=_generator("A", 1.0), reservoir=reservoir))
+    model.add("m2", HydroModule(release_to="m3", generator=_generator("B", 2.0)))
+    model.add("m3", HydroModule(generator=_generator("A", 4.0)))
+    model.add("m4", HydroModule(release_to="m3"))
+    return model
+
+
+def _value(model: Model, expr: object) -> float:
+    if isinstance(expr, int):  # no downstream energy equivalents
+        return float(expr)
+    return get_level_value(expr, model, "kWh/m3", DATA_DIM, SCEN_DIM, is_max=False)
+
+
+@pytest.mark.parametrize("power_node", [None, "A", "B"])
+def test_memoized_expressions_match_single_module_walk(power_node: str | None) -> None:
+    model = _setup()
+    data = model.get_data()
+
+    energy_equivalents = get_hydro_downstream_energy_equivalents(data, power_node=power_node)
+
+    assert set(energy_equivalents) == {"m1", "m2", "m3", "m4"}
+    for name, expr in energy_equivalents.items():
+        assert _value(model, expr) == _value(model, get_hydro_downstream_energy_equivalent(data, name, power_node))
+
+
+def test_numeric_values() -> None:
+    model = _setup()
+
+    values = get_hydro_downstream_energy_equivalents(model.get_data(), db=model, data_dim=DATA_DIM, scen_dim=SCEN_DIM)
+
+    assert values == {"m1": 7.0, "m2": 6.0, "m3": 4.0, "m4": 4.0}
+
+
+def test_numeric_values_require_dims() -> None:
+    model = _setup()
+    with pytest.raises(ValueError, match="data_dim and scen_dim"):
+        get_hydro_downstream_energy_equivalents(model.get_data(), db=model)
+
+
+def test_circular_references_raise() -> None:
+    model = _setup()
+    model.get_data()["m3"] = HydroModule(release_to="m1", generator=_generator("A", 4.0))
+    with pytest.raises(ValueError, match="Circular"):
+        get_hydro_downstream_energy_equivalents(model.get_data())
+
+
+def test_set_global_energy_equivalent_only_sets_reservoirs() -> None:
+    model = _setup()
+    set_global_energy_equivalent(model.get_data(), "ee")
+
+    data = model.get_data()
+    assert _value(model, data["m1"].get_meta("ee").get_value()) == 7.0
+    assert data["m2"].get_meta("ee") is None
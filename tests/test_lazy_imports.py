@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+from framcore.expressions import units
+
+_HEAVY_MODULES = ("sympy", "pandas", "numexpr", "sklearn", "multiprocessing.shared_memory")
+
+
+def _get_loaded_heavy_modules(code: str) -> list[str]:
+    check = f"import sys\n{code}\nprint(','.join(m for m in {_HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def test_import_does_not_load_heavy_modules() -> None:
+    code = (
+        "import framcore\n"
+        "from framcore import Model\n"
+        "from framcore.timevectors import ConstantTimeVector, ListTimeVector\n"
+        "from framcore.expressions import get_unit_conversion_factor\n"
+        "assert get_unit_conversion_factor('MW', 'GW') == 0.001"
+    )
+    assert _get_loaded_heavy_modules(code) == []
+
+
+def test_sympy_is_loaded_by_fallback() -> None:
+    code = "from framcore.expressions import get_unit_conversion_factor\nget_unit_conversion_factor('GWh/year', 'kW')"
+    assert _get_loaded_heavy_modules(code) == ["sympy"]
+
+
+def test_lazy_unit_attributes() -> None:
+    assert units.EUR is units._SUPPORTED_UNITS["€"]
+    assert units.get_unit_conversion_factor("EUR/kWh", "EUR/MWh") == 1000.0
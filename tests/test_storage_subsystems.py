@@ -0,0 +1,42 @@
+from framcore import Model
+from framcore.components import HydroModule
+from framcore.populators import SyntheticPopulator
+from framcore.utils import get_one_commodity_storage_subsystems, get_storage_subsystems
+
+
+def _model() -> Model:
+    model = Model()
+    SyntheticPopulator(num_areas=2, nodes_per_area=1, num_cascades=6, cascade_length=4, reservoir_share=0.5, pump_share=0.5).populate(model)
+    return model
+
+
+def test_subsystems_are_cascades() -> None:
+    model = _model()
+    subsystems = get_storage_subsystems(model)
+
+    assert set(subsystems) == {f"hydro_{cascade}_0_node" for cascade in range(6)}
+    for cascade in range(6):
+        assert subsystems[f"hydro_{cascade}_0_node"] == {f"hydro_{cascade}_{i}" for i in range(4)}
+
+    module_ids = [k for k, v in model.get_data().items() if isinstance(v, HydroModule)]
+    assert sorted(k for members in subsystems.values() for k in members) == sorted(module_ids)
+
+    with_boundaries = get_storage_subsystems(model, include_boundaries=True)
+    for subsystem_id, members in with_boundaries.items():
+        extra = members - subsystems[subsystem_id]
+        assert extra
+        assert all(k.startswith("node_") for k in extra)
+
+
+def test_graph_and_dict_input_agree() -> None:
+    graph = _model().get_node_flow_graph()
+    for include_boundaries in (True, False):
+        from_graph = get_one_commodity_storage_subsystems(graph, include_boundaries)
+        from_dict = get_one_commodity_storage_subsystems(graph.get_graph(), include_boundaries)
+        assert from_graph == from_dict
+
+    storage_commodity, members, boundary_commodities = get_one_commodity_storage_subsystems(graph, False)["hydro_0_0_node"]
+    assert storage_commodity == "Hydro"
+    assert boundary_commodities == {"Power"}
+    assert "hydro_0_3_node" in members
+    assert not any(k.startswith("node_") for k in members)
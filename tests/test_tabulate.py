@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from framcore import Model
+from framcore.components import HydroModule, Wind
+from framcore.populators import SyntheticPopulator
+from framcore.querydbs import CacheDB
+from framcore.timeindexes import ModelYear, ProfileTimeIndex
+from framcore.utils import ComponentTable, TableColumn, tabulate
+
+DATA_DIM = ModelYear(2025)
+SCEN_DIM = ProfileTimeIndex(1991, 1, timedelta(weeks=1), is_52_week_years=True)
+
+
+def _model() -> Model:
+    model = Model()
+    SyntheticPopulator(num_areas=2, nodes_per_area=2, num_cascades=3, cascade_length=2, num_wind=4, num_solar=1).populate(model)
+    return model
+
+
+def test_value_vector_and_profile_columns() -> None:
+    model = _model()
+    columns = [
+        TableColumn("power_node"),
+        TableColumn("max_capacity", unit="MW"),
+        TableColumn("max_capacity", unit="MW", kind=TableColumn.VECTOR, name="capacity_vector"),
+        TableColumn("max_capacity", kind=TableColumn.PROFILE, name="capacity_profile"),
+        TableColumn("voc", unit="EUR/MWh"),
+    ]
+    table = tabulate(model, Wind, columns, DATA_DIM, SCEN_DIM)
+
+    assert table.get_column_names() == ["id", "power_node", "max_capacity", "capacity_vector", "capacity_profile", "voc"]
+    assert list(table.get_ids()) == ["wind_0", "wind_1", "wind_2", "wind_3"]
+    assert np.isnan(table.get_column("voc")).all()
+
+    db = CacheDB(model)
+    for row, wind_id in enumerate(table.get_ids()):
+        wind = model.get_data()[wind_id]
+        capacity = wind.get_max_capacity()
+        assert table.get_column("power_node")[row] == wind.get_power_node()
+        assert table.get_column("max_capacity")[row] == capacity.get_data_value(db, SCEN_DIM, DATA_DIM, "MW")
+        expected = capacity.get_scenario_vector(db, SCEN_DIM, DATA_DIM, "MW", is_float32=False)
+        assert np.allclose(table.get_column("capacity_vector")[row], expected)
+        assert np.allclose(table.get_column("capacity_profile")[row] * table.get_column("max_capacity")[row], expected)
+
+    vectors = table.get_column("capacity_vector")
+    assert vectors.shape == (4, SCEN_DIM.get_num_periods())
+    assert vectors.dtype == np.float64
+    assert vectors.flags.c_contiguous
+
+
+def test_nested_paths_ids_and_float32() -> None:
+    model = _model()
+    columns = [
+        TableColumn("generator.energy_eq", unit="kWh/m3", name="energy_eq"),
+        TableColumn("reservoir.capacity", unit="Mm3", name="reservoir_capacity"),
+        TableColumn("inflow", unit="m3/s", kind=TableColumn.VECTOR),
+        TableColumn("release_to"),
+    ]
+    ids = ["hydro_2_1", "hydro_0_0"]
+    table = tabulate(model, HydroModule, columns, DATA_DIM, SCEN_DIM, ids=ids, is_float32=True)
+
+    assert list(table.get_ids()) == ids
+    assert table.get_column("inflow").dtype == np.float32
+    assert list(table.get_column("release_to")) == [None, "hydro_0_1"]
+    assert table.get_column("release_to").dtype == object
+    assert np.isnan(table.get_column("reservoir_capacity")).sum() == (model.get_data()["hydro_2_1"].get_reservoir() is None)
+    assert table.get_column("energy_eq")[1] == pytest.approx(
+        model.get_data()["hydro_0_0"].get_generator().get_energy_eq().get_data_value(model, SCEN_DIM, DATA_DIM, "kWh/m3"),
+    )
+
+
+def test_errors() -> None:
+    model = _model()
+    with pytest.raises(ValueError, match="has no method get_unknown"):
+        tabulate(model, Wind, [TableColumn("max_capacity.unknown")], DATA_DIM, SCEN_DIM)
+    with pytest.raises(ValueError, match="unique"):
+        tabulate(model, Wind, [TableColumn("power_node"), TableColumn("power_node")], DATA_DIM, SCEN_DIM)
+    with pytest.raises(TypeError, match="expected LevelProfile"):
+        tabulate(model, Wind, [TableColumn("power_node", kind=TableColumn.VECTOR)], DATA_DIM, SCEN_DIM)
+    with pytest.raises(TypeError, match="hydro_0_0"):
+        tabulate(model, Wind, [TableColumn("power_node")], DATA_DIM, SCEN_DIM, ids=["hydro_0_0"])
+    with pytest.raises(ValueError, match="rows"):
+        ComponentTable({"id": np.array(["a"]), "x": np.zeros(2)})
+
+
+def test_to_arrow() -> None:
+    pa = pytest.importorskip("pyarrow")
+    columns = [TableColumn("max_capacity", unit="MW"), TableColumn("max_capacity", unit="MW", kind=TableColumn.VECTOR, name="vector")]
+    table = tabulate(_model(), Wind, columns, DATA_DIM, SCEN_DIM).to_arrow()
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 4
+    assert table.column("vector").type.list_size == SCEN_DIM.get_num_periods()